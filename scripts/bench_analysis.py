@@ -0,0 +1,191 @@
+#!/usr/bin/env python
+"""Benchmark the analysis reports on a large synthetic result set.
+
+Times what ``summarize.py`` does, end to end, both ways:
+
+- loop: load the JSONL archive as ``BenchmarkResult`` objects and run the
+  per-record loop implementations the reports used to have,
+- vectorized: load it as a ``ResultTable``, build the results frame once
+  and run every report in ``solver_benchmarks.analysis`` on that frame.
+
+Each report runs once, in order, so statistic columns such as
+``solve_time:min`` are computed by the first report that needs them. Both
+ways must give the same answers. Also reports the memory each loader keeps.
+
+Usage:
+    uv run python scripts/bench_analysis.py
+    uv run python scripts/bench_analysis.py --rows 100000 --problems 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import tempfile
+import time
+import tracemalloc
+from collections import defaultdict
+from pathlib import Path
+
+import numpy as np
+
+from solver_benchmarks.analysis import (
+    fastest_solver_per_problem,
+    metric_value,
+    results_frame,
+    solver_comparison_table,
+    solver_reliability_summary,
+)
+from solver_benchmarks.results import BenchmarkResult, load_all_results, save_results
+from solver_benchmarks.table import ResultTable
+from solver_benchmarks.timing import summarize_samples
+
+SOLVERS = ["CLARABEL", "SCS", "OSQP", "HIGHS", "ECOS", "SCIPY", "MOSEK", "GUROBI"]
+PROBLEM_TYPES = ["LP", "QP", "SOCP", "SDP", "MIP"]
+STATUSES = ["optimal", "optimal", "optimal", "optimal_inaccurate", "solver_error"]
+
+
+def synthetic_results(rows: int, problems: int, seed: int = 0) -> list[BenchmarkResult]:
+    rng = np.random.default_rng(seed)
+    problem = rng.integers(problems, size=rows)
+    solver = rng.integers(len(SOLVERS), size=rows)
+    status = rng.integers(len(STATUSES), size=rows)
+    solve_time = rng.lognormal(-3, 2, size=rows)
+    repeated = rng.random(rows) < 0.1
+
+    results = []
+    for i in range(rows):
+        p = int(problem[i])
+        stats = None
+        if repeated[i]:
+            stats = {"solve_time": summarize_samples([solve_time[i] * f for f in (0.9, 1.0, 1.2)])}
+        results.append(
+            BenchmarkResult(
+                problem_name=f"problem_{p}",
+                solver_name=SOLVERS[solver[i]],
+                solve_time=float(solve_time[i]),
+                total_time=float(solve_time[i]) * 1.5,
+                repeats=3 if stats else 1,
+                timing_stats=stats,
+                status=STATUSES[status[i]],
+                problem_type=PROBLEM_TYPES[p % len(PROBLEM_TYPES)],
+            )
+        )
+    return results
+
+
+# The loop-based implementations the vectorized reports replaced.
+
+
+def loop_comparison_table(results, metric="solve_time", problem_type=None):
+    filtered = results
+    if problem_type:
+        filtered = [r for r in filtered if r.problem_type == problem_type]
+    problems = sorted({r.problem_name for r in filtered})
+    solvers = sorted({r.solver_name for r in filtered})
+    lookup = {(r.problem_name, r.solver_name): r for r in filtered}
+    table = {}
+    for p in problems:
+        row = {}
+        for s in solvers:
+            r = lookup.get((p, s))
+            row[s] = None if r is None else metric_value(r, metric)
+        table[p] = row
+    return table
+
+
+def loop_reliability_summary(results):
+    counts = defaultdict(lambda: defaultdict(lambda: {"total": 0, "optimal": 0}))
+    for r in results:
+        entry = counts[r.solver_name][r.problem_type]
+        entry["total"] += 1
+        if r.status == "optimal":
+            entry["optimal"] += 1
+    return {s: dict(v) for s, v in counts.items()}
+
+
+def loop_fastest_solver_per_problem(results, metric="solve_time"):
+    by_problem = defaultdict(list)
+    for r in results:
+        if r.status == "optimal":
+            by_problem[r.problem_name].append(r)
+    best = {}
+    for problem, runs in by_problem.items():
+        valid = [(r, metric_value(r, metric)) for r in runs]
+        valid = [(r, v) for r, v in valid if v is not None]
+        if valid:
+            r, v = min(valid, key=lambda x: x[1])
+            best[problem] = (r.solver_name, v)
+    return best
+
+
+def timed(func, *args, **kwargs):
+    """Return ``func``'s value and its wall time."""
+    t0 = time.perf_counter()
+    value = func(*args, **kwargs)
+    return value, time.perf_counter() - t0
+
+
+def load_frame(path):
+    return results_frame(ResultTable.load(path))
+
+
+def print_row(name: str, t_loop: float, t_vec: float) -> None:
+    print(f"{name:<18} {t_loop:>8.3f}s {t_vec:>10.3f}s {t_loop / t_vec:>7.1f}x")
+
+
+def retained_memory(func, *args):
+    """Return the memory still allocated by ``func``'s result, in bytes."""
+    gc.collect()
+    tracemalloc.start()
+    value = func(*args)
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del value
+    return current
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the analysis reports")
+    parser.add_argument("--rows", type=int, default=200_000, help="Number of synthetic results")
+    parser.add_argument("--problems", type=int, default=2000, help="Number of distinct problems")
+    args = parser.parse_args()
+
+    print(f"Generating {args.rows} results over {args.problems} problems...")
+    reports = [
+        ("comparison", loop_comparison_table, solver_comparison_table, {}),
+        ("comparison LP", loop_comparison_table, solver_comparison_table, {"problem_type": "LP"}),
+        ("comparison :min", loop_comparison_table, solver_comparison_table, {"metric": "solve_time:min"}),
+        ("reliability", loop_reliability_summary, solver_reliability_summary, {}),
+        ("fastest", loop_fastest_solver_per_problem, fastest_solver_per_problem, {}),
+    ]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        save_results(synthetic_results(args.rows, args.problems), Path(tmpdir) / "results.jsonl")
+        results, load_loop = timed(load_all_results, tmpdir)
+        # Keep full collections from walking the loaded records during timings.
+        gc.freeze()
+        frame, load_vec = timed(load_frame, tmpdir)
+        memory = [retained_memory(load_all_results, tmpdir), retained_memory(load_frame, tmpdir)]
+
+    print(f"{'Step':<18} {'loop':>9} {'vectorized':>11} {'speedup':>8}")
+    print_row("load", load_loop, load_vec)
+    total_loop = total_vec = 0.0
+    for name, loop_func, vec_func, kwargs in reports:
+        expected, t_loop = timed(loop_func, results, **kwargs)
+        actual, t_vec = timed(vec_func, frame, **kwargs)
+        if actual != expected:
+            raise SystemExit(f"{name}: vectorized result differs from the loop result")
+        total_loop += t_loop
+        total_vec += t_vec
+        print_row(name, t_loop, t_vec)
+    print_row("all reports", total_loop, total_vec)
+    print_row("load + reports", load_loop + total_loop, load_vec + total_vec)
+    print(
+        f"\nMemory kept after loading: {memory[0] / 2**20:.1f} MB as objects, "
+        f"{memory[1] / 2**20:.1f} MB as a frame"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+#!/usr/bin/env python
+"""Convert the JSONL results archive into a columnar store.
+
+Usage:
+    uv run python scripts/compact_results.py
+    uv run python scripts/compact_results.py --layout arrow --dest results_store
+"""
+
+from __future__ import annotations
+
+import argparse
+
+from solver_benchmarks.store import compact
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compact JSONL results into Parquet/Arrow")
+    parser.add_argument("--results-dir", default="results", help="Directory containing .jsonl files")
+    parser.add_argument("--dest", default="results_store", help="Output store (replaced if it exists)")
+    parser.add_argument(
+        "--layout",
+        choices=["parquet", "arrow"],
+        default="parquet",
+        help="Partitioned Parquet dataset or a single Arrow file",
+    )
+    args = parser.parse_args()
+
+    try:
+        n = compact(args.results_dir, args.dest, layout=args.layout)
+    except ValueError as exc:
+        parser.error(str(exc))
+    print(f"Wrote {n} results to {args.dest} ({args.layout})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+"""Export benchmark instances to MPS/QPS, CBF, SDPA and .npz conic form.
+
+Each problem instance (one per seed in --seeds, default 0) is canonicalized
+once and written to the instance cache, under
+<output-dir>/cvxpy-<version>/<problem>/seed<seed>.<ext>, in every format
+that can represent it. run_benchmarks.py --instance-dir loads the .npz
+files back instead of building the problems.
+
+Usage:
+    uv run python scripts/export_instances.py
+    uv run python scripts/export_instances.py --tags lp mip --formats mps
+    uv run python scripts/export_instances.py --problems sdp/max_cut_small --seeds 0..4 --output-dir /tmp/instances
+"""
+
+from __future__ import annotations
+
+import argparse
+
+from solver_benchmarks.export import DEFAULT_INSTANCE_DIR, FORMATS, export_instance
+from solver_benchmarks.problems import get_problem, list_problems
+from solver_benchmarks.runner import parse_seeds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export benchmark instances")
+    parser.add_argument("--problems", nargs="+", help="Specific problem names")
+    parser.add_argument("--tags", nargs="+", help="Filter problems by tags")
+    parser.add_argument("--seeds", nargs="+", default=["0"], help="Instance seeds, e.g. 0..9")
+    parser.add_argument("--formats", nargs="+", choices=FORMATS, default=list(FORMATS), help="Formats to write")
+    parser.add_argument("--output-dir", default=str(DEFAULT_INSTANCE_DIR), help="Instance cache directory")
+    args = parser.parse_args()
+
+    if args.problems:
+        specs = [get_problem(name) for name in args.problems]
+    elif args.tags:
+        specs = [s for s in list_problems() if set(args.tags) & set(s.tags)]
+    else:
+        specs = list_problems()
+
+    try:
+        seeds = parse_seeds(args.seeds)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    for spec in specs:
+        for seed in seeds:
+            label = f"{spec.name} (seed {seed})"
+            try:
+                paths = export_instance(spec, seed, args.output_dir, formats=tuple(args.formats))
+            except Exception as exc:
+                print(f"{label:<45} failed: {exc}")
+                continue
+            written = ", ".join(path.name for path in paths.values()) or "no requested format applies"
+            print(f"{label:<45} {written}")
+
+
+if __name__ == "__main__":
+    main()
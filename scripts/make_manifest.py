@@ -0,0 +1,23 @@
+#!/usr/bin/env python
+"""Regenerate the problem manifest.
+
+The registry lists problems from ``src/solver_benchmarks/problems/manifest.json``
+without importing the problem modules. Run this after adding or editing a
+problem; a stale manifest is ignored (and all modules imported) until then.
+
+Usage:
+    uv run python scripts/make_manifest.py
+"""
+
+from __future__ import annotations
+
+from solver_benchmarks.problems import write_manifest
+
+
+def main():
+    path = write_manifest()
+    print(f"Wrote {path}")
+
+
+if __name__ == "__main__":
+    main()
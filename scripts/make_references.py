@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+"""Compute high-accuracy reference objectives for the objective gap.
+
+Each problem instance (one per seed in --seeds, default 0) is solved with
+tight tolerances (Clarabel, or HiGHS for integer problems) and its objective
+is stored in the references file, which benchmark runs compare their
+objective against. Existing entries are kept unless --force is given.
+
+Usage:
+    uv run python scripts/make_references.py
+    uv run python scripts/make_references.py --tags small medium --seeds 0..9
+    uv run python scripts/make_references.py --problems qp/lasso_medium --solver MOSEK --force
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from solver_benchmarks.problems import get_problem, list_problems
+from solver_benchmarks.quality import (
+    DEFAULT_REFERENCES,
+    compute_reference,
+    load_references,
+    save_references,
+)
+from solver_benchmarks.runner import parse_seeds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compute reference objectives")
+    parser.add_argument("--problems", nargs="+", help="Specific problem names")
+    parser.add_argument("--tags", nargs="+", help="Filter problems by tags")
+    parser.add_argument("--solver", default=None, help="Reference solver (default: CLARABEL, HIGHS for MIPs)")
+    parser.add_argument("--references", default=str(DEFAULT_REFERENCES), help="References file to update")
+    parser.add_argument("--seeds", nargs="+", default=["0"], help="Instance seeds, e.g. 0..9")
+    parser.add_argument("--force", action="store_true", help="Recompute existing references")
+    args = parser.parse_args()
+
+    if args.problems:
+        specs = [get_problem(name) for name in args.problems]
+    elif args.tags:
+        specs = [s for s in list_problems() if set(args.tags) & set(s.tags)]
+    else:
+        specs = list_problems()
+
+    try:
+        seeds = parse_seeds(args.seeds)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    references = dict(load_references(args.references))
+    for spec in specs:
+        for seed in seeds:
+            label = f"{spec.name} (seed {seed})"
+            if str(seed) in references.get(spec.name, {}) and not args.force:
+                continue
+            t0 = time.perf_counter()
+            try:
+                entry = compute_reference(spec.func(seed), solver=args.solver)
+            except Exception as exc:
+                print(f"{label:<45} failed: {exc}")
+                continue
+            if entry["status"] != "optimal":
+                print(f"{label:<45} {entry['status']} with {entry['solver']}, not stored")
+                continue
+            references.setdefault(spec.name, {})[str(seed)] = entry
+            save_references(references, args.references)
+            print(f"{label:<45} {entry['objective']:.10g} ({entry['solver']}, {time.perf_counter() - t0:.1f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,20 @@ Usage:
     uv run python scripts/run_benchmarks.py --contributor username
     uv run python scripts/run_benchmarks.py --tags lp qp --contributor username
     uv run python scripts/run_benchmarks.py --problems lp/diet_small qp/lasso_medium --solvers SCS CLARABEL
+    uv run python scripts/run_benchmarks.py --jobs 8 --threads-per-job 2 --pin-cpus --contributor username
+    uv run python scripts/run_benchmarks.py --jobs 8 --tags small medium --plan
+    uv run python scripts/run_benchmarks.py --tags small --repeats 20 --warmup 2 --contributor username
+    uv run python scripts/run_benchmarks.py --tags small medium --seeds 0..9 --cache-compiled --contributor username
+    uv run python scripts/run_benchmarks.py --tags bikeshare --cache-dir ~/.cache/solver_benchmarks/compiled --contributor username
+    uv run python scripts/run_benchmarks.py --tags small --instance-dir instances --contributor username
+    uv run python scripts/run_benchmarks.py --resume --contributor username
+    uv run python scripts/run_benchmarks.py --timeout 600 --memory-limit 8000 --contributor username
+    uv run python scripts/run_benchmarks.py --tags bikeshare --profile cprofile --profile-dir profiles
+    uv run python scripts/run_benchmarks.py --tags bikeshare --trace-memory
+    uv run python scripts/run_benchmarks.py --mode resolve --repeats 50 --warmup 5 --solvers OSQP CLARABEL
+    uv run python scripts/run_benchmarks.py --mode latency --tags small --repeats 5000 --solvers HIGHS CLARABEL
+    uv run python scripts/run_benchmarks.py --mode direct --tags small --repeats 20 --warmup 2
+    uv run python scripts/run_benchmarks.py --scale --scale-budget 120 --memory-limit 8000 --solvers CLARABEL SCS
 """
 
 from __future__ import annotations
@@ -14,7 +28,8 @@ import argparse
 import logging
 
 from solver_benchmarks.problems import list_problems
-from solver_benchmarks.runner import run_benchmarks
+from solver_benchmarks.profiling import PROFILERS
+from solver_benchmarks.settings import DEFAULT_REFERENCES, GC_MODES
 
 
 def main():
@@ -25,6 +40,71 @@ def main():
     parser.add_argument("--tags", nargs="+", help="Run problems matching these tags")
     parser.add_argument("--contributor", default="anonymous", help="Contributor name for results file")
     parser.add_argument("--output-dir", default="results", help="Output directory for results")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="Number of benchmark runs to execute in parallel")
+    parser.add_argument("--threads-per-job", type=int, default=None, help="Limit OMP/MKL/BLAS threads per run (default: CPUs / jobs)")
+    parser.add_argument("--pin-cpus", action="store_true", help="Pin each worker process to its own block of CPUs")
+    parser.add_argument(
+        "--repeats", type=int, default=None, help="Number of timed trials per run (timings report the median; default 1, 1000 for --mode latency)"
+    )
+    parser.add_argument(
+        "--warmup", type=int, default=None, help="Number of untimed warmup trials per run (default 0, 100 for --mode latency)"
+    )
+    parser.add_argument("--cache-compiled", action="store_true", help="Build and canonicalize each problem once and share it across solvers")
+    parser.add_argument("--cache-dir", default=None, help="Persist compiled problems in this directory (implies --cache-compiled)")
+    parser.add_argument("--instance-dir", default=None, help="Load problems from exported instances in this directory, exporting missing ones (not with --scale)")
+    parser.add_argument("--resume", action="store_true", help="Skip runs that already succeeded on this host (per results in --output-dir)")
+    parser.add_argument("--timeout", type=float, default=None, help="Kill runs exceeding this many seconds of wall-clock time")
+    parser.add_argument("--memory-limit", type=float, default=None, help="Kill runs whose resident memory exceeds this many MB")
+    parser.add_argument(
+        "--profile", choices=list(PROFILERS), default=None, help="Profile one extra untimed run per benchmark"
+    )
+    parser.add_argument("--profile-dir", default="profiles", help="Directory for --profile output")
+    parser.add_argument(
+        "--trace-memory",
+        action="store_true",
+        help="Also record peak Python allocations (tracemalloc) on one extra untimed run per benchmark",
+    )
+    parser.add_argument(
+        "--mode",
+        choices=["cold", "resolve", "latency", "direct"],
+        default="cold",
+        help="cold: solve freshly built problems; resolve: re-solve parameterized problems with new data "
+        "and warm starts (--repeats timed updates after --warmup untimed ones); latency: time --repeats "
+        "solves of each problem in a loop and record their distribution; direct: time the solver on "
+        "CVXPY's problem data (solve_via_data) next to end-to-end solves",
+    )
+    parser.add_argument(
+        "--gc",
+        choices=list(GC_MODES),
+        default="controlled",
+        help="--mode latency: collect garbage between batches of calls only (controlled) or leave GC on (enabled)",
+    )
+    parser.add_argument(
+        "--scale",
+        action="store_true",
+        help="Run scalable problems at increasing sizes (see --scale-budget) instead of their default size; "
+        "runs one at a time, without the pool, cache, resume, seed, mode or profiling options",
+    )
+    parser.add_argument(
+        "--scale-budget", type=float, default=60.0, help="Seconds to spend per problem and solver in --scale mode"
+    )
+    parser.add_argument(
+        "--seeds",
+        nargs="+",
+        default=["0"],
+        help="Instance seeds: numbers and inclusive ranges, e.g. 0..9 (not with --scale)",
+    )
+    parser.add_argument(
+        "--references",
+        default=str(DEFAULT_REFERENCES),
+        help="Reference objectives for the objective gap (see make_references.py)",
+    )
+    parser.add_argument(
+        "--plan",
+        action="store_true",
+        help="Print the runs in the order they would start, with run times estimated from "
+        "--output-dir, and the estimated total time, then exit",
+    )
     parser.add_argument("-v", "--verbose", action="store_true", help="Verbose logging")
     args = parser.parse_args()
 
@@ -39,16 +119,104 @@ def main():
         print("-" * 80)
         for p in problems:
             tags = ", ".join(p.tags)
-            print(f"{p.name:<35} {tags:<25} {p.description}")
+            scale = f" [--scale {p.size_param}: {p.sizes[0]}..{p.sizes[-1]}]" if p.sizes else ""
+            print(f"{p.name:<35} {tags:<25} {p.description}{scale}")
         return
 
-    results = run_benchmarks(
-        problems=args.problems,
-        solvers=args.solvers,
-        tags=args.tags,
-        output_dir=args.output_dir,
-        contributor=args.contributor,
-    )
+    if args.scale:
+        # A scaling sweep runs the sizes of each problem and solver one after
+        # another; these options have no counterpart there.
+        ignored = {
+            "--jobs": args.jobs != 1,
+            "--threads-per-job": args.threads_per_job is not None,
+            "--pin-cpus": args.pin_cpus,
+            "--cache-compiled": args.cache_compiled,
+            "--cache-dir": args.cache_dir is not None,
+            "--instance-dir": args.instance_dir is not None,
+            "--resume": args.resume,
+            "--seeds": args.seeds != ["0"],
+            "--mode": args.mode != "cold",
+            "--profile": args.profile is not None,
+            "--trace-memory": args.trace_memory,
+            "--references": args.references != str(DEFAULT_REFERENCES),
+            "--plan": args.plan,
+        }
+        given = [option for option, used in ignored.items() if used]
+        if given:
+            parser.error(f"--scale does not support {', '.join(given)}")
+
+    # Imported here: the runner pulls in CVXPY, which --list does not need.
+    from solver_benchmarks.runner import parse_seeds, plan_benchmarks, run_benchmarks, run_scaling
+    from solver_benchmarks.scheduler import format_schedule
+
+    latency = args.mode == "latency"
+    repeats = args.repeats if args.repeats is not None else (1000 if latency else 1)
+    warmup = args.warmup if args.warmup is not None else (100 if latency else 0)
+    if repeats < 1:
+        parser.error("--repeats must be at least 1")
+    if warmup < 0:
+        parser.error("--warmup must be non-negative")
+    try:
+        seeds = parse_seeds(args.seeds)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    if args.plan:
+        schedule = plan_benchmarks(
+            problems=args.problems,
+            solvers=args.solvers,
+            tags=args.tags,
+            output_dir=args.output_dir,
+            jobs=args.jobs,
+            repeats=repeats,
+            warmup=warmup,
+            resume=args.resume,
+            mode=args.mode,
+            seeds=seeds,
+            instance_dir=args.instance_dir,
+        )
+        print(format_schedule(schedule))
+        return
+
+    if args.scale:
+        results = run_scaling(
+            problems=args.problems,
+            solvers=args.solvers,
+            tags=args.tags,
+            output_dir=args.output_dir,
+            contributor=args.contributor,
+            time_budget=args.scale_budget,
+            timeout=args.timeout,
+            memory_limit_mb=args.memory_limit,
+            repeats=repeats,
+            warmup=warmup,
+        )
+    else:
+        results = run_benchmarks(
+            problems=args.problems,
+            solvers=args.solvers,
+            tags=args.tags,
+            output_dir=args.output_dir,
+            contributor=args.contributor,
+            jobs=args.jobs,
+            threads_per_job=args.threads_per_job,
+            pin_cpus=args.pin_cpus,
+            timeout=args.timeout,
+            memory_limit_mb=args.memory_limit,
+            repeats=repeats,
+            warmup=warmup,
+            cache_compiled=args.cache_compiled,
+            cache_dir=args.cache_dir,
+            resume=args.resume,
+            profiler=args.profile,
+            profile_dir=args.profile_dir,
+            trace_memory=args.trace_memory,
+            mode=args.mode,
+            gc_mode=args.gc,
+            references=args.references,
+            seeds=seeds,
+            instance_dir=args.instance_dir,
+        )
 
     # Print summary
     n_optimal = sum(1 for r in results if r.status == "optimal")
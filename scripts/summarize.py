@@ -6,59 +6,355 @@ Usage:
     uv run python scripts/summarize.py --report reliability
     uv run python scripts/summarize.py --report fastest --metric solve_time
     uv run python scripts/summarize.py --report comparison --problem-type LP --metric total_time
+    uv run python scripts/summarize.py --report comparison --metric solve_time:min
+    uv run python scripts/summarize.py --report comparison --metric peak_rss_mb
+    uv run python scripts/summarize.py --report comparison --metric solve_time_norm
+    uv run python scripts/summarize.py --report machines
+    uv run python scripts/summarize.py --report accuracy --tolerance 1e-6
+    uv run python scripts/summarize.py --report seeds --metric solve_time
+    uv run python scripts/summarize.py --report sgm --tolerance 1e-4
+    uv run python scripts/summarize.py --store results_store --solver CLARABEL SCS --cvxpy-version ">=1.8"
+    uv run python scripts/summarize.py --report comparison --solver HIGHS --split-versions
+    uv run python scripts/summarize.py --report sgm --time-limit 60 --csv sgm.csv
+    uv run python scripts/summarize.py --report profile --plot profiles.png --csv profiles.csv
+    uv run python scripts/summarize.py --report phases --problem-type QP
+    uv run python scripts/summarize.py --report scaling --scale-by nnz
+    uv run python scripts/summarize.py --report resolve
+    uv run python scripts/summarize.py --report comparison --mode resolve
+    uv run python scripts/summarize.py --report latency --csv latency.csv
+    uv run python scripts/summarize.py --report direct
+    uv run python scripts/summarize.py --report comparison --source instance
+    uv run python scripts/summarize.py --report regressions --baseline "cvxpy_version==1.7.1" --candidate "cvxpy_version>=1.8"
 """
 
 from __future__ import annotations
 
 import argparse
+import sys
+from dataclasses import asdict
+
+import numpy as np
+import pandas as pd
 
 from solver_benchmarks.analysis import (
+    SCALING_MEASURES,
+    accuracy_table,
+    data_profile,
+    direct_summary,
     fastest_solver_per_problem,
+    latency_summary,
+    machine_summary,
+    mark_inaccurate,
     format_comparison_table,
+    format_direct_summary,
+    format_accuracy_table,
+    format_latency_summary,
+    format_machine_summary,
+    format_phase_breakdown,
+    format_scaling,
+    format_seed_summary,
+    format_profile,
     format_reliability_summary,
+    format_resolve_summary,
+    format_sgm,
+    performance_profile,
+    resolve_summary,
+    phase_breakdown,
+    scaling_exponents,
+    seed_summary,
+    plot_profiles,
+    results_frame,
+    shifted_geometric_mean,
+    split_solver_versions,
     solver_comparison_table,
     solver_reliability_summary,
 )
-from solver_benchmarks.results import load_all_results
+from solver_benchmarks.quality import DEFAULT_REFERENCES, load_references
+from solver_benchmarks.regression import DEFAULT_METRICS, compare_runs, format_comparisons, select
+from solver_benchmarks.store import version_matches
+from solver_benchmarks.table import ResultTable
 
 
 def main():
     parser = argparse.ArgumentParser(description="Summarize benchmark results")
     parser.add_argument(
         "--report",
-        choices=["comparison", "reliability", "fastest"],
+        choices=["comparison", "reliability", "fastest", "sgm", "profile", "regressions", "phases", "scaling", "resolve", "latency", "direct", "machines", "accuracy", "seeds"],
         default="comparison",
         help="Report type",
     )
-    parser.add_argument("--metric", default="solve_time", help="Metric for comparison/fastest")
+    parser.add_argument(
+        "--metric",
+        default="solve_time",
+        help="Metric for comparison/fastest, e.g. solve_time, peak_rss_mb or parallelism; "
+        "timings use the median over repeats, append :min, :mean, :std or :iqr for another statistic; "
+        "append _norm to the name (solve_time_norm) for times relative to the machine's calibration",
+    )
     parser.add_argument("--problem-type", default=None, help="Filter by problem type (LP, QP, SOCP, SDP, MIP)")
     parser.add_argument("--results-dir", default="results", help="Directory containing .jsonl files")
+    parser.add_argument("--store", default=None, help="Read from a columnar store (see compact_results.py) instead")
+    parser.add_argument(
+        "--mode",
+        choices=["cold", "resolve", "latency", "direct"],
+        default="cold",
+        help="Only include runs of this mode (--report resolve, latency, direct and machines use all runs)",
+    )
+    parser.add_argument(
+        "--source",
+        choices=["native", "instance"],
+        default="native",
+        help="Only include runs of problems built by their factories (native) or loaded from "
+        "exported instances (instance; see run_benchmarks.py --instance-dir)",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=None,
+        help="Count solved runs whose objective gap or primal residual exceeds this as failed "
+        "(status 'inaccurate'), so sgm and profile compare the time to reach this accuracy",
+    )
+    parser.add_argument(
+        "--references",
+        default=str(DEFAULT_REFERENCES),
+        help="Reference objectives to recompute gaps from (recorded gaps are used if missing)",
+    )
+    parser.add_argument("--solver", nargs="+", default=None, help="Only include these solvers")
+    parser.add_argument("--cvxpy-version", default=None, help='CVXPY version spec, e.g. ">=1.8,<1.9"')
+    parser.add_argument("--solver-version", default=None, help='Solver version spec, e.g. ">=0.11"')
+    parser.add_argument(
+        "--split-versions", action="store_true", help="Report each solver version as a separate solver (not with --report regressions)"
+    )
+    parser.add_argument("--shift", type=float, default=0.01, help="Shift for --report sgm, in metric units")
+    parser.add_argument(
+        "--time-limit",
+        type=float,
+        default=None,
+        help="Value charged for failed runs in --report sgm (default: largest solved value)",
+    )
+    parser.add_argument(
+        "--per-variable",
+        action="store_true",
+        help="Normalize data profile budgets by the number of scalar variables + 1",
+    )
+    parser.add_argument(
+        "--scale-by",
+        choices=list(SCALING_MEASURES),
+        default="size",
+        help="Size measure for --report scaling: the size parameter, solver data nonzeros or variables",
+    )
+    parser.add_argument(
+        "--baseline", default=None, help='Runs to compare against, e.g. "cvxpy_version==1.7.1,contributor=alice"'
+    )
+    parser.add_argument("--candidate", default=None, help='Runs to check for regressions, e.g. "cvxpy_version>=1.8"')
+    parser.add_argument(
+        "--metrics", nargs="+", default=list(DEFAULT_METRICS), help="Metrics checked by --report regressions"
+    )
+    parser.add_argument("--alpha", type=float, default=0.05, help="Significance level for --report regressions")
+    parser.add_argument(
+        "--threshold", type=float, default=0.1, help="Relative slowdown flagged by --report regressions (0.1 = 10%%)"
+    )
+    parser.add_argument("--csv", default=None, help="Also write the sgm/profile/regressions/phases report to this CSV file")
+    parser.add_argument("--plot", default=None, help="Save profile plots to this image file (needs matplotlib)")
     args = parser.parse_args()
+    if args.report == "regressions" and not (args.baseline and args.candidate):
+        parser.error("--report regressions needs --baseline and --candidate")
 
-    results = load_all_results(args.results_dir)
-    if not results:
+    if args.store:
+        table = ResultTable.from_store(
+            args.store,
+            problem_type=args.problem_type,
+            solvers=args.solver,
+            cvxpy_version=args.cvxpy_version,
+            solver_version=args.solver_version,
+        )
+        frame = results_frame(table)
+    else:
+        frame = results_frame(ResultTable.load(args.results_dir))
+        mask = np.ones(len(frame), dtype=bool)
+        if args.problem_type:
+            mask &= frame["problem_type"] == args.problem_type
+        if args.solver:
+            mask &= frame["solver_name"].isin(args.solver)
+        for column, spec in [("cvxpy_version", args.cvxpy_version), ("solver_version", args.solver_version)]:
+            if spec:
+                matching = [v for v in frame[column].cat.categories if version_matches(v, spec)]
+                mask &= frame[column].isin(matching)
+        if not mask.all():
+            frame = frame[mask].reset_index(drop=True)
+    if args.report not in ("resolve", "latency", "direct", "machines"):
+        # Records from before the mode field are cold runs.
+        mode = frame["mode"].astype(object).fillna("cold").to_numpy()
+        if not (mode == args.mode).all():
+            frame = frame[mode == args.mode].reset_index(drop=True)
+    if args.report != "machines":
+        # Records from before the problem_source field are native runs.
+        source = frame["problem_source"].astype(object).fillna("native").to_numpy()
+        if not (source == args.source).all():
+            frame = frame[source == args.source].reset_index(drop=True)
+    if args.split_versions and args.report != "regressions":
+        frame = split_solver_versions(frame)
+    references = load_references(args.references) or None
+    if args.tolerance is not None and args.report != "accuracy":
+        frame = mark_inaccurate(frame, args.tolerance, references)
+    if frame.empty:
         print("No results found. Run benchmarks first.")
         return
 
-    if args.problem_type:
-        results = [r for r in results if r.problem_type == args.problem_type]
-
     if args.report == "comparison":
-        table = solver_comparison_table(results, metric=args.metric, problem_type=args.problem_type)
+        table = solver_comparison_table(frame, metric=args.metric, problem_type=args.problem_type)
         print(format_comparison_table(table, metric=args.metric))
 
     elif args.report == "reliability":
-        summary = solver_reliability_summary(results)
+        summary = solver_reliability_summary(frame)
         print(format_reliability_summary(summary))
 
     elif args.report == "fastest":
-        best = fastest_solver_per_problem(results, metric=args.metric)
+        best = fastest_solver_per_problem(frame, metric=args.metric)
         print(f"Fastest solver per problem (metric: {args.metric})")
         print("=" * 60)
         for problem in sorted(best):
             solver, value = best[problem]
             print(f"  {problem:<35} {solver:<15} {value:.4f}s")
 
+    elif args.report == "sgm":
+        summaries = {
+            ptype: shifted_geometric_mean(
+                frame, metric=args.metric, shift=args.shift, time_limit=args.time_limit, problem_type=ptype
+            )
+            for ptype in sorted(frame["problem_type"].unique())
+        }
+        print(format_sgm(summaries, metric=args.metric))
+        if args.csv:
+            rows = [
+                {"problem_type": ptype, "solver_name": solver, **entry}
+                for ptype, summary in summaries.items()
+                for solver, entry in summary.items()
+            ]
+            pd.DataFrame(rows).to_csv(args.csv, index=False)
+
+    elif args.report == "profile":
+        profiles = {
+            ptype: {
+                "performance": performance_profile(frame, metric=args.metric, problem_type=ptype),
+                "data": data_profile(
+                    frame, metric=args.metric, problem_type=ptype, per_variable=args.per_variable
+                ),
+            }
+            for ptype in sorted(frame["problem_type"].unique())
+        }
+        for ptype, panel in profiles.items():
+            print(f"\n{ptype}: performance profile (fraction within tau x best {args.metric})")
+            print(format_profile(panel["performance"]))
+            print(f"\n{ptype}: data profile (fraction solved within budget)")
+            print(format_profile(panel["data"], points=(1e-4, 1e-3, 1e-2, 0.1, 1, 10, 100)))
+        if args.csv:
+            pd.concat(
+                [
+                    profile.rename_axis("x").reset_index().melt(id_vars="x", var_name="solver_name", value_name="fraction")
+                    .assign(problem_type=ptype, profile=kind)
+                    for ptype, panel in profiles.items()
+                    for kind, profile in panel.items()
+                ]
+            )[["problem_type", "profile", "solver_name", "x", "fraction"]].to_csv(args.csv, index=False)
+        if args.plot:
+            plot_profiles(profiles, args.plot)
+
+    elif args.report == "phases":
+        breakdown = phase_breakdown(frame, problem_type=args.problem_type)
+        print(format_phase_breakdown(breakdown))
+        if args.csv:
+            breakdown.to_csv(args.csv)
+
+    elif args.report == "scaling":
+        fits = scaling_exponents(frame, metric=args.metric, by=args.scale_by)
+        print(format_scaling(fits, metric=args.metric, by=args.scale_by))
+        if args.csv:
+            rows = [
+                {"family": family, "solver": solver, **fit}
+                for family, by_solver in fits.items()
+                for solver, fit in by_solver.items()
+            ]
+            pd.DataFrame(rows).to_csv(args.csv, index=False)
+
+    elif args.report == "resolve":
+        summary = resolve_summary(frame, problem_type=args.problem_type)
+        print(format_resolve_summary(summary))
+        if args.csv:
+            rows = [
+                {"problem": problem, "solver": solver, **entry}
+                for problem, by_solver in summary.items()
+                for solver, entry in by_solver.items()
+            ]
+            pd.DataFrame(rows).to_csv(args.csv, index=False)
+
+    elif args.report == "latency":
+        summary = latency_summary(frame, problem_type=args.problem_type)
+        print(format_latency_summary(summary))
+        if args.csv:
+            rows = [
+                {"problem": problem, "solver": solver, "part": name, **entry}
+                for problem, by_solver in summary.items()
+                for solver, parts in by_solver.items()
+                for name, entry in parts.items()
+            ]
+            pd.DataFrame(rows).to_csv(args.csv, index=False)
+
+    elif args.report == "direct":
+        summary = direct_summary(frame, problem_type=args.problem_type)
+        print(format_direct_summary(summary))
+        if args.csv:
+            rows = [
+                {"problem": problem, "solver": solver, **entry}
+                for problem, by_solver in summary.items()
+                for solver, entry in by_solver.items()
+            ]
+            pd.DataFrame(rows).to_csv(args.csv, index=False)
+
+    elif args.report == "accuracy":
+        tolerance = args.tolerance if args.tolerance is not None else 1e-6
+        table = accuracy_table(
+            frame, tolerance=tolerance, metric=args.metric, references=references, problem_type=args.problem_type
+        )
+        print(format_accuracy_table(table, tolerance, metric=args.metric))
+        if args.csv:
+            rows = [
+                {"problem": problem, "solver": solver, **entry}
+                for problem, by_solver in table.items()
+                for solver, entry in by_solver.items()
+            ]
+            pd.DataFrame(rows).to_csv(args.csv, index=False)
+
+    elif args.report == "seeds":
+        summary = seed_summary(frame, metric=args.metric, problem_type=args.problem_type)
+        print(format_seed_summary(summary, metric=args.metric))
+        if args.csv:
+            rows = [
+                {"problem": problem, "solver": solver, **entry}
+                for problem, by_solver in summary.items()
+                for solver, entry in by_solver.items()
+            ]
+            pd.DataFrame(rows).to_csv(args.csv, index=False)
+
+    elif args.report == "machines":
+        machines = machine_summary(frame)
+        print(format_machine_summary(machines))
+        if args.csv:
+            machines.to_csv(args.csv)
+
+    elif args.report == "regressions":
+        comparisons = compare_runs(
+            frame[select(frame, args.baseline)],
+            frame[select(frame, args.candidate)],
+            metrics=args.metrics,
+            alpha=args.alpha,
+            threshold=args.threshold,
+        )
+        print(format_comparisons(comparisons))
+        if args.csv:
+            pd.DataFrame([asdict(c) for c in comparisons]).to_csv(args.csv, index=False)
+        if any(c.regressed for c in comparisons):
+            sys.exit(1)
+
 
 if __name__ == "__main__":
     main()
@@ -1,91 +1,878 @@
-"""Summary and comparison tools for benchmark results."""
+"""Summary and comparison tools for benchmark results.
+
+Reports work on a pandas DataFrame with one row per result (see
+:func:`results_frame`). They also accept a list of results or a
+:class:`~solver_benchmarks.table.ResultTable`, but when running several
+reports over a large archive build the frame once and reuse it.
+"""
 
 from __future__ import annotations
 
-from collections import defaultdict
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
 
+from solver_benchmarks.latency import PERCENTILES
+from solver_benchmarks.profiling import ordered_phases
+from solver_benchmarks.quality import objective_gap, reference_objective
 from solver_benchmarks.results import BenchmarkResult
+from solver_benchmarks.table import ResultTable
+from solver_benchmarks.timing import split_metric
+
+# Suffix of machine-normalized metrics: ``"solve_time_norm"`` is the solve
+# time divided by the run's calibration time.
+NORM_SUFFIX = "_norm"
+
+
+def _normalized(metric: str) -> str | None:
+    """``"solve_time:min"`` for ``"solve_time_norm:min"``, None if not normalized."""
+    name, _, stat = metric.partition(":")
+    if not name.endswith(NORM_SUFFIX):
+        return None
+    base = name[: -len(NORM_SUFFIX)]
+    return f"{base}:{stat}" if stat else base
+
+
+def metric_value(r: BenchmarkResult, metric: str) -> float | None:
+    """Return the value of ``metric`` for a single result.
+
+    Timing metrics accept a ``":<stat>"`` suffix (e.g. ``"solve_time:min"``)
+    selecting a statistic over repeated trials. Without a suffix the stored
+    value is used, which is the median for repeated runs. Single-trial
+    results report their one sample for every statistic.
+
+    A ``"_norm"`` suffix on the name (e.g. ``"solve_time_norm:min"``) divides
+    by the run's calibration time, giving times comparable across machines;
+    it is None for runs recorded without calibration.
+    """
+    base = _normalized(metric)
+    if base is not None:
+        value = metric_value(r, base)
+        if value is None or not r.calibration_time:
+            return None
+        return value / r.calibration_time
+    name, stat = split_metric(metric)
+    if stat is not None and r.timing_stats and name in r.timing_stats:
+        return r.timing_stats[name][stat]
+    value = getattr(r, name, None)
+    if value is not None and stat in ("std", "iqr"):
+        return 0.0
+    return value
+
+
+def results_frame(
+    results: list[BenchmarkResult] | ResultTable | pd.DataFrame,
+) -> pd.DataFrame:
+    """Build the columnar table shared by all reports, one row per result.
+
+    Build it once after loading and pass it to every report; a frame passed
+    in is returned as is. Columns are the ``BenchmarkResult`` fields, stored
+    as in :class:`~solver_benchmarks.table.ResultTable`, plus
+    ``"<metric>:<stat>"`` columns added on demand by :func:`metric_series`.
+    """
+    if isinstance(results, pd.DataFrame):
+        return results
+    if not isinstance(results, ResultTable):
+        results = ResultTable.from_results(results)
+    return results.to_frame()
+
+
+def _stat_column(frame: pd.DataFrame, name: str, stat: str) -> pd.Series:
+    """Vectorized :func:`metric_value` over a whole frame."""
+    values = pd.to_numeric(frame[name], errors="coerce")
+    if stat in ("std", "iqr"):
+        values = values.where(values.isna(), 0.0)
+    stats = frame["timing_stats"].to_numpy(dtype=object)
+    has_stats = pd.notna(stats)
+    if has_stats.any():
+        values = values.to_numpy(dtype=float, copy=True)
+        # Stored as JSON text; one array decodes much faster than one call per row.
+        decoded = json.loads("[" + ",".join(stats[has_stats]) + "]")
+        values[has_stats] = [
+            s[name][stat] if name in s else fallback
+            for s, fallback in zip(decoded, values[has_stats])
+        ]
+        values = pd.Series(values, index=frame.index)
+    return values
+
+
+def metric_series(frame: pd.DataFrame, metric: str) -> pd.Series:
+    """Return ``metric`` for every row of ``frame`` as a float series.
+
+    Same semantics as :func:`metric_value`; missing values are NaN.
+    Statistic columns are computed once and kept on ``frame``.
+    """
+    base = _normalized(metric)
+    if base is not None:
+        calibration = pd.to_numeric(frame["calibration_time"], errors="coerce")
+        return metric_series(frame, base) / calibration.where(calibration > 0)
+    name, stat = split_metric(metric)
+    if stat is None:
+        return pd.to_numeric(frame[name], errors="coerce")
+    column = f"{name}:{stat}"
+    if column not in frame.columns:
+        frame[column] = _stat_column(frame, name, stat)
+    return frame[column]
+
+
+def split_solver_versions(frame: pd.DataFrame) -> pd.DataFrame:
+    """Label each solver with its version, e.g. ``"CLARABEL 0.11.1"``.
+
+    Every report then treats each solver version as a separate solver.
+    Runs without a recorded version keep the bare name. Returns a copy.
+    """
+    solver = frame["solver_name"].astype(str)
+    version = frame["solver_version"].astype(object).fillna("").astype(str)
+    # Records from before real versions were captured stored the solver name.
+    known = (version != "") & (version.str.upper() != solver.str.upper())
+    frame = frame.copy()
+    frame["solver_name"] = pd.Categorical(solver.where(~known, solver + " " + version))
+    return frame
+
+
+def _none_if_nan(value: float) -> float | None:
+    return None if np.isnan(value) else float(value)
+
+
+def _seeds(frame: pd.DataFrame) -> pd.Series:
+    """Seed of every run; records from before the seed field used seed 0."""
+    return pd.to_numeric(frame["seed"], errors="coerce").fillna(0).astype(int)
+
+
+def _codes(column: pd.Series) -> tuple[np.ndarray, pd.Index]:
+    """Integer codes (-1 for missing) and categories of a string column.
+
+    Columns of a :func:`results_frame` are categorical, so this is free.
+    """
+    if not isinstance(column.dtype, pd.CategoricalDtype):
+        column = column.astype("category")
+    return column.cat.codes.to_numpy(), column.cat.categories
+
+
+def _sorted_labels(codes: np.ndarray, categories: pd.Index) -> tuple[list[str], np.ndarray]:
+    """Sorted names of the categories in use and each code's position among them."""
+    used, inverse = np.unique(codes, return_inverse=True)
+    names = [str(c) for c in categories[used]]
+    order = np.argsort(names, kind="stable")
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    return [names[i] for i in order], rank[inverse]
+
+
+def _problem_solver_matrix(
+    frame: pd.DataFrame,
+    values: pd.Series,
+    problem_type: str | None = None,
+    per_seed: bool = False,
+) -> tuple[list[str], list[str], np.ndarray]:
+    """Pivot per-run ``values`` into a (problem x solver) float matrix.
+
+    Problems and solvers are sorted. If a (problem, solver, seed) has
+    several runs, the last one is used. Runs on several seeds of a problem
+    give one row per seed with ``per_seed`` (the returned problem names
+    repeat), and otherwise one row holding the median over seeds. Pairs
+    without a run are NaN.
+    """
+    problem, problem_names = _codes(frame["problem_name"])
+    solver, solver_names = _codes(frame["solver_name"])
+    seed = _seeds(frame).to_numpy()
+    value = values.to_numpy(dtype=float)
+    if problem_type:
+        keep = (frame["problem_type"] == problem_type).to_numpy()
+        problem, solver, seed, value = problem[keep], solver[keep], seed[keep], value[keep]
+
+    # Last run of each (problem, solver, seed): first in reversed order.
+    seeds, seed = np.unique(seed, return_inverse=True)
+    key = (problem.astype(np.int64) * len(solver_names) + solver) * len(seeds) + seed
+    _, last = np.unique(key[::-1], return_index=True)
+    last = len(key) - 1 - last
+    problem, solver, seed, value = problem[last], solver[last], seed[last], value[last]
+
+    problems, row = _sorted_labels(problem, problem_names)
+    solvers, column = _sorted_labels(solver, solver_names)
+    if per_seed:
+        instances, row = np.unique(row * len(seeds) + seed, return_inverse=True)
+        problems = [problems[i] for i in instances // len(seeds)]
+    else:
+        pairs, cell = np.unique(row * len(solvers) + column, return_inverse=True)
+        if len(pairs) < len(cell):
+            # Some pairs ran on several seeds: take the median over seeds.
+            value = pd.Series(value).groupby(cell).median().to_numpy()
+            row, column = pairs // len(solvers), pairs % len(solvers)
+    matrix = np.full((len(problems), len(solvers)), np.nan)
+    matrix[row, column] = value
+    return problems, solvers, matrix
 
 
 def solver_comparison_table(
-    results: list[BenchmarkResult],
+    results: list[BenchmarkResult] | ResultTable | pd.DataFrame,
     metric: str = "solve_time",
     problem_type: str | None = None,
 ) -> dict[str, dict[str, float | None]]:
     """Build a comparison table: rows=problems, cols=solvers.
 
+    If a (problem, solver, seed) has several results, the last one is used;
+    values of problems run on several seeds are the median over seeds.
+
     Returns ``{problem_name: {solver_name: metric_value}}``.
     """
-    filtered = results
-    if problem_type:
-        filtered = [r for r in filtered if r.problem_type == problem_type]
-
-    problems = sorted({r.problem_name for r in filtered})
-    solvers = sorted({r.solver_name for r in filtered})
-
-    table: dict[str, dict[str, float | None]] = {}
-    lookup: dict[tuple[str, str], BenchmarkResult] = {
-        (r.problem_name, r.solver_name): r for r in filtered
+    frame = results_frame(results)
+    problems, solvers, matrix = _problem_solver_matrix(
+        frame, metric_series(frame, metric), problem_type
+    )
+    return {
+        problem: {s: _none_if_nan(v) for s, v in zip(solvers, row)}
+        for problem, row in zip(problems, matrix)
     }
 
-    for p in problems:
-        row: dict[str, float | None] = {}
-        for s in solvers:
-            r = lookup.get((p, s))
-            if r is None:
-                row[s] = None
-            else:
-                row[s] = getattr(r, metric, None)
-        table[p] = row
-    return table
-
 
 def solver_reliability_summary(
-    results: list[BenchmarkResult],
+    results: list[BenchmarkResult] | ResultTable | pd.DataFrame,
 ) -> dict[str, dict[str, dict[str, int]]]:
     """Compute success rates per solver per problem type.
 
     Returns ``{solver: {problem_type: {"total": N, "optimal": M}}}``.
     """
-    counts: dict[str, dict[str, dict[str, int]]] = defaultdict(
-        lambda: defaultdict(lambda: {"total": 0, "optimal": 0})
-    )
-    for r in results:
-        entry = counts[r.solver_name][r.problem_type]
-        entry["total"] += 1
-        if r.status == "optimal":
-            entry["optimal"] += 1
-    return dict(counts)
+    frame = results_frame(results)
+    optimal = frame["status"] == "optimal"
+    counts = optimal.groupby(
+        [frame["solver_name"], frame["problem_type"]], observed=True, sort=False
+    ).agg(["size", "sum"])
+
+    summary: dict[str, dict[str, dict[str, int]]] = {}
+    for (solver, ptype), total, n_optimal in zip(
+        counts.index, counts["size"], counts["sum"]
+    ):
+        summary.setdefault(solver, {})[ptype] = {
+            "total": int(total),
+            "optimal": int(n_optimal),
+        }
+    return summary
 
 
 def fastest_solver_per_problem(
-    results: list[BenchmarkResult],
+    results: list[BenchmarkResult] | ResultTable | pd.DataFrame,
     metric: str = "solve_time",
 ) -> dict[str, tuple[str, float]]:
     """Return the fastest solver for each problem.
 
+    Only optimal runs are considered. A solver's value on a problem run on
+    several seeds is the median over seeds of its best run per seed; ties go
+    to the earliest result.
+
     Returns ``{problem_name: (solver_name, metric_value)}``.
     """
-    by_problem: dict[str, list[BenchmarkResult]] = defaultdict(list)
-    for r in results:
-        if r.status == "optimal":
-            by_problem[r.problem_name].append(r)
+    frame = results_frame(results)
+    values = metric_series(frame, metric)
+    mask = (frame["status"] == "optimal") & values.notna()
+    problem, problem_names = _codes(frame["problem_name"])
+    solver, solver_names = _codes(frame["solver_name"])
+    runs = pd.DataFrame(
+        {
+            "problem": problem,
+            "solver": solver,
+            "seed": _seeds(frame).to_numpy(),
+            "value": values.to_numpy(),
+        }
+    )[mask.to_numpy()]
+    per_seed = runs.groupby(["problem", "solver", "seed"], sort=False)["value"].min()
+    per_solver = per_seed.groupby(level=["problem", "solver"], sort=False).median().reset_index()
+    best = per_solver.loc[per_solver.groupby("problem", sort=False)["value"].idxmin()]
+    return {
+        str(problem_names[p]): (str(solver_names[s]), float(v))
+        for p, s, v in zip(best["problem"], best["solver"], best["value"])
+    }
 
-    best: dict[str, tuple[str, float]] = {}
-    for problem, runs in by_problem.items():
-        valid = [(r, getattr(r, metric, None)) for r in runs]
-        valid = [(r, v) for r, v in valid if v is not None]
-        if valid:
-            r, v = min(valid, key=lambda x: x[1])
-            best[problem] = (r.solver_name, v)
-    return best
 
+# Statuses counted as solved by the SGM and profile reports.
+SOLVED_STATUSES = ("optimal",)
 
-def results_to_dataframe(results: list[BenchmarkResult]):
-    """Convert results to a pandas DataFrame."""
-    import pandas as pd
 
-    return pd.DataFrame([r.to_dict() for r in results])
+def _solved_matrix(
+    frame: pd.DataFrame, metric: str, problem_type: str | None
+) -> tuple[list[str], list[str], np.ndarray]:
+    """(instance x solver) ``metric`` matrix with NaN wherever a run failed.
+
+    Every seed of a problem is a separate instance (row).
+    """
+    values = metric_series(frame, metric)
+    values = values.where(frame["status"].isin(SOLVED_STATUSES).to_numpy())
+    return _problem_solver_matrix(frame, values, problem_type, per_seed=True)
+
+
+def shifted_geometric_mean(
+    results: list[BenchmarkResult] | ResultTable | pd.DataFrame,
+    metric: str = "solve_time",
+    shift: float = 0.01,
+    time_limit: float | None = None,
+    problem_type: str | None = None,
+) -> dict[str, dict[str, float | int | None]]:
+    """Shifted geometric mean of ``metric`` per solver, penalizing failures.
+
+    The mean is ``exp(mean(log(t + shift))) - shift`` over every problem in
+    the selection. A run that did not finish with a status in
+    ``SOLVED_STATUSES``, or a problem the solver never ran, counts as
+    ``time_limit`` (default: the largest solved value in the selection).
+
+    Returns ``{solver: {"sgm": x, "relative": x / best, "solved": n,
+    "total": N}}``.
+    """
+    problems, solvers, matrix = _solved_matrix(
+        results_frame(results), metric, problem_type
+    )
+    solved = ~np.isnan(matrix)
+    if time_limit is None:
+        time_limit = float(matrix[solved].max()) if solved.any() else None
+    if time_limit is None:
+        sgm = np.full(len(solvers), np.nan)
+    else:
+        penalized = np.where(solved, matrix, time_limit)
+        sgm = np.exp(np.log(penalized + shift).mean(axis=0)) - shift
+    best = np.nanmin(sgm) if not np.isnan(sgm).all() else np.nan
+    return {
+        s: {
+            "sgm": _none_if_nan(sgm[j]),
+            "relative": _none_if_nan(sgm[j] / best),
+            "solved": int(solved[:, j].sum()),
+            "total": len(problems),
+        }
+        for j, s in enumerate(solvers)
+    }
+
+
+def _step_profile(values: np.ndarray, solvers: list[str], xs) -> pd.DataFrame:
+    """Fraction of rows of ``values`` at or below each x, per solver column.
+
+    NaN entries never count; with ``xs=None`` every distinct finite value
+    is used, so the result holds each curve's exact steps.
+    """
+    values = np.where(np.isnan(values), np.inf, values)
+    if xs is None:
+        xs = np.unique(values[np.isfinite(values)])
+    xs = np.asarray(xs, dtype=float)
+    ordered = np.sort(values, axis=0)
+    n = max(len(values), 1)
+    return pd.DataFrame(
+        {
+            s: np.searchsorted(ordered[:, j], xs, side="right") / n
+            for j, s in enumerate(solvers)
+        },
+        index=pd.Index(xs),
+    )
+
+
+def performance_profile(
+    results: list[BenchmarkResult] | ResultTable | pd.DataFrame,
+    metric: str = "solve_time",
+    problem_type: str | None = None,
+    taus=None,
+) -> pd.DataFrame:
+    """Dolan–Moré performance profile.
+
+    For each problem, a solver's performance ratio is its ``metric`` over
+    the best solver's. The profile of a solver at ``tau`` is the fraction of
+    problems whose ratio is at most ``tau``; failed runs never count.
+
+    Returns a frame indexed by ``tau`` with one column per solver. By
+    default the index holds 1 and every ratio at which a curve steps.
+    """
+    problems, solvers, matrix = _solved_matrix(
+        results_frame(results), metric, problem_type
+    )
+    with np.errstate(all="ignore"):
+        best = np.fmin.reduce(matrix, axis=1, initial=np.inf)
+        ratios = matrix / np.maximum(best, np.finfo(float).tiny)[:, None]
+    if taus is None:
+        taus = np.union1d([1.0], ratios[np.isfinite(ratios)])
+    profile = _step_profile(ratios, solvers, taus)
+    profile.index.name = "tau"
+    return profile
+
+
+def data_profile(
+    results: list[BenchmarkResult] | ResultTable | pd.DataFrame,
+    metric: str = "solve_time",
+    problem_type: str | None = None,
+    budgets=None,
+    per_variable: bool = False,
+) -> pd.DataFrame:
+    """Data profile: fraction of problems each solver solves within a budget.
+
+    Budgets are in the units of ``metric`` (seconds for timings). With
+    ``per_variable`` the cost of each problem is divided by its number of
+    scalar variables plus one, following Moré and Wild's normalization by
+    problem dimension.
+
+    Returns a frame indexed by ``budget`` with one column per solver.
+    """
+    frame = results_frame(results)
+    problems, solvers, matrix = _solved_matrix(frame, metric, problem_type)
+    if per_variable:
+        sizes = (
+            frame.groupby("problem_name", observed=True)["num_scalar_variables"]
+            .max()
+            .reindex(problems)
+            .to_numpy(dtype=float)
+        )
+        matrix = matrix / (np.nan_to_num(sizes) + 1)[:, None]
+    profile = _step_profile(matrix, solvers, budgets)
+    profile.index.name = "budget"
+    return profile
+
+
+def plot_profiles(
+    profiles: dict[str, dict[str, pd.DataFrame]], path: str | Path
+) -> None:
+    """Plot profiles as step curves on a log x axis and save them to ``path``.
+
+    ``profiles`` maps a panel title (e.g. a problem type) to named profiles
+    (e.g. ``{"performance": ..., "data": ...}``), drawn side by side.
+    Requires matplotlib (``uv sync --extra analysis``).
+    """
+    from matplotlib.figure import Figure
+
+    kinds = list(dict.fromkeys(k for panel in profiles.values() for k in panel))
+    fig = Figure(figsize=(5 * len(kinds), 3.5 * len(profiles)), layout="constrained")
+    axes = fig.subplots(len(profiles), len(kinds), squeeze=False)
+    for row, (title, panel) in zip(axes, profiles.items()):
+        for ax, kind in zip(row, kinds):
+            profile = panel.get(kind)
+            if profile is None or profile.empty:
+                ax.set_visible(False)
+                continue
+            # Carry the last step on past the final breakpoint so that
+            # single-step curves are visible.
+            xs = np.append(profile.index, profile.index[-1] * 2)
+            for solver in profile.columns:
+                ys = np.append(profile[solver], profile[solver].iloc[-1])
+                ax.step(xs, ys, where="post", label=solver)
+            ax.set_xscale("log")
+            ax.set_ylim(0, 1.02)
+            ax.set_xlabel(profile.index.name)
+            ax.set_ylabel("fraction of problems")
+            ax.set_title(f"{title}: {kind} profile")
+            ax.legend(fontsize="small")
+    fig.savefig(path)
+
+
+def phase_breakdown(
+    results: list[BenchmarkResult] | ResultTable | pd.DataFrame,
+    problem_type: str | None = None,
+) -> pd.DataFrame:
+    """Median wall time of each run phase per (problem, solver).
+
+    Runs recorded without a phase breakdown are skipped. Returns a frame
+    indexed by ``(problem_name, solver_name)`` with one column per phase,
+    in :data:`~solver_benchmarks.profiling.PHASES` order.
+    """
+    frame = results_frame(results)
+    mask = frame["phases"].notna().to_numpy()
+    if problem_type:
+        mask &= (frame["problem_type"] == problem_type).to_numpy()
+    phases = pd.DataFrame(
+        [json.loads(p) for p in frame["phases"][mask]],  # stored as JSON text
+        index=pd.MultiIndex.from_arrays(
+            [
+                frame["problem_name"][mask].astype(str),
+                frame["solver_name"][mask].astype(str),
+            ]
+        ),
+    )
+    if phases.empty:
+        return phases
+    phases = phases.groupby(level=[0, 1]).median()
+    return phases[list(ordered_phases(dict.fromkeys(phases.columns, 0.0)))]
+
+
+def _last_runs(frame: pd.DataFrame, mask: np.ndarray, columns: list[str]) -> pd.DataFrame:
+    """``columns`` of the last run per (problem, solver) among ``mask`` rows."""
+    runs = pd.DataFrame(
+        {
+            "problem_name": frame["problem_name"].astype(str),
+            "solver_name": frame["solver_name"].astype(str),
+            **{c: pd.to_numeric(frame[c], errors="coerce") for c in columns},
+        }
+    )[mask]
+    runs = runs.drop_duplicates(["problem_name", "solver_name"], keep="last")
+    return runs.set_index(["problem_name", "solver_name"]).sort_index()
+
+
+def resolve_summary(
+    results: list[BenchmarkResult] | ResultTable | pd.DataFrame,
+    problem_type: str | None = None,
+) -> dict[str, dict[str, dict]]:
+    """First solve vs steady-state re-solve latency per problem and solver.
+
+    Uses solved runs recorded with ``mode="resolve"``; if a pair has several,
+    the last one is used. Returns ``{problem: {solver: {"first", "steady",
+    "speedup", "cold"}}}``: the first solve's wall time, the median wall time
+    per re-solve, their ratio, and the total time of the pair's last solved
+    cold run (None without one) for comparison with solving from scratch.
+    """
+    frame = results_frame(results)
+    solved = frame["status"].isin(SOLVED_STATUSES).to_numpy()
+    if problem_type:
+        solved &= (frame["problem_type"] == problem_type).to_numpy()
+    mode = frame["mode"].astype(str).to_numpy()
+    resolve = _last_runs(
+        frame, solved & (mode == "resolve"), ["first_solve_time", "total_time"]
+    )
+    cold = _last_runs(frame, solved & (mode != "resolve"), ["total_time"])["total_time"]
+
+    summary: dict[str, dict[str, dict]] = {}
+    for (problem, solver), row in resolve.iterrows():
+        first, steady = _none_if_nan(row["first_solve_time"]), _none_if_nan(row["total_time"])
+        summary.setdefault(problem, {})[solver] = {
+            "first": first,
+            "steady": steady,
+            "speedup": first / steady if first is not None and steady else None,
+            "cold": _none_if_nan(cold.get((problem, solver), np.nan)),
+        }
+    return summary
+
+
+def latency_summary(
+    results: list[BenchmarkResult] | ResultTable | pd.DataFrame,
+    problem_type: str | None = None,
+) -> dict[str, dict[str, dict]]:
+    """Latency percentiles per problem and solver from latency-mode runs.
+
+    If a pair has several runs, the last one is used. Returns ``{problem:
+    {solver: {"total": summary, "native": summary, "overhead": summary}}}``
+    with the summaries of :meth:`~solver_benchmarks.latency.LatencyHistogram.summary`;
+    ``"native"`` and ``"overhead"`` are missing for solvers that do not
+    report their own times.
+    """
+    frame = results_frame(results)
+    mask = frame["latency"].notna().to_numpy()
+    if problem_type:
+        mask &= (frame["problem_type"] == problem_type).to_numpy()
+    summary: dict[str, dict[str, dict]] = {}
+    for problem, solver, latency in zip(
+        frame["problem_name"][mask], frame["solver_name"][mask], frame["latency"][mask]
+    ):
+        latency = json.loads(latency)  # stored as JSON text
+        summary.setdefault(problem, {})[solver] = {
+            name: {k: v for k, v in entry.items() if k != "histogram"}
+            for name, entry in latency.items()
+            if isinstance(entry, dict)
+        }
+    return {problem: summary[problem] for problem in sorted(summary)}
+
+
+def direct_summary(
+    results: list[BenchmarkResult] | ResultTable | pd.DataFrame,
+    problem_type: str | None = None,
+) -> dict[str, dict[str, dict]]:
+    """End-to-end vs direct-to-solver time per problem and solver.
+
+    Uses solved runs recorded with ``mode="direct"``; if a pair has several,
+    the last one is used. Returns ``{problem: {solver: {"total", "direct",
+    "native", "overhead", "overhead_share"}}}``: the end-to-end solve time,
+    the wall time of the solver call on CVXPY's data, the solver's own
+    setup plus solve time (None if not reported), the time spent in CVXPY
+    (total - direct) and its share of the total.
+    """
+    frame = results_frame(results)
+    solved = frame["status"].isin(SOLVED_STATUSES).to_numpy()
+    if problem_type:
+        solved &= (frame["problem_type"] == problem_type).to_numpy()
+    mode = frame["mode"].astype(str).to_numpy()
+    runs = _last_runs(
+        frame,
+        solved & (mode == "direct"),
+        ["total_time", "direct_time", "setup_time", "solve_time"],
+    )
+
+    summary: dict[str, dict[str, dict]] = {}
+    for (problem, solver), row in runs.iterrows():
+        total, direct = _none_if_nan(row["total_time"]), _none_if_nan(row["direct_time"])
+        native = row["solve_time"] + (0.0 if np.isnan(row["setup_time"]) else row["setup_time"])
+        overhead = total - direct if total is not None and direct is not None else None
+        summary.setdefault(problem, {})[solver] = {
+            "total": total,
+            "direct": direct,
+            "native": _none_if_nan(native),
+            "overhead": overhead,
+            "overhead_share": overhead / total if overhead is not None and total else None,
+        }
+    return summary
+
+
+# Robust z-score above which a seed is reported as an outlier, and the
+# number of seeds needed before looking for outliers.
+OUTLIER_Z = 3.5
+MIN_OUTLIER_SEEDS = 3
+
+
+def seed_summary(
+    results: list[BenchmarkResult] | ResultTable | pd.DataFrame,
+    metric: str = "solve_time",
+    problem_type: str | None = None,
+) -> dict[str, dict[str, dict]]:
+    """Spread of ``metric`` over the seeds of each problem and solver.
+
+    If a (problem, solver, seed) has several runs, the last one is used.
+    Returns ``{problem: {solver: {"seeds", "solved", "median", "min", "max",
+    "iqr", "failed", "outliers"}}}`` where the statistics are over solved
+    seeds, ``failed`` lists the seeds that were not solved and ``outliers``
+    the solved seeds whose robust z-score (distance to the median in units
+    of 1.4826 x the median absolute deviation) exceeds :data:`OUTLIER_Z`.
+    """
+    frame = results_frame(results)
+    runs = pd.DataFrame(
+        {
+            "problem_name": frame["problem_name"].astype(str),
+            "solver_name": frame["solver_name"].astype(str),
+            "seed": _seeds(frame),
+            "solved": frame["status"].isin(SOLVED_STATUSES).to_numpy(),
+            "value": metric_series(frame, metric),
+        }
+    )
+    if problem_type:
+        runs = runs[(frame["problem_type"] == problem_type).to_numpy()]
+    runs = runs.drop_duplicates(["problem_name", "solver_name", "seed"], keep="last")
+
+    summary: dict[str, dict[str, dict]] = {}
+    for (problem, solver), group in runs.sort_values("seed").groupby(
+        ["problem_name", "solver_name"], sort=True
+    ):
+        solved = group[group["solved"] & group["value"].notna()]
+        values = solved["value"].to_numpy(dtype=float)
+        entry = {
+            "seeds": len(group),
+            "solved": len(solved),
+            "median": None,
+            "min": None,
+            "max": None,
+            "iqr": None,
+            "failed": [int(s) for s in group["seed"][~group["solved"]]],
+            "outliers": [],
+        }
+        if len(values):
+            median = float(np.median(values))
+            q1, q3 = np.percentile(values, [25, 75])
+            entry.update(
+                median=median, min=float(values.min()), max=float(values.max()), iqr=float(q3 - q1)
+            )
+            mad = 1.4826 * np.median(np.abs(values - median))
+            if len(values) >= MIN_OUTLIER_SEEDS and mad > 0:
+                z = np.abs(values - median) / mad
+                entry["outliers"] = [int(s) for s in solved["seed"][z > OUTLIER_Z]]
+        summary.setdefault(problem, {})[solver] = entry
+    return summary
+
+
+def objective_gaps(frame: pd.DataFrame, references: dict | None = None) -> pd.Series:
+    """Relative objective gap of every run, NaN where unknown.
+
+    With ``references`` (see :func:`solver_benchmarks.quality.load_references`)
+    gaps are recomputed from ``objective_value``, so runs recorded before a
+    reference existed are covered; otherwise the recorded gap is used.
+    """
+    if references is None:
+        return pd.to_numeric(frame["objective_gap"], errors="coerce")
+    # Records from before the seed field used the problems' default seed, 0.
+    seeds = pd.to_numeric(frame["seed"], errors="coerce").fillna(0).astype(int)
+    gaps = [
+        objective_gap(value, reference_objective(references, problem, seed))
+        for problem, seed, value in zip(
+            frame["problem_name"].astype(str),
+            seeds,
+            pd.to_numeric(frame["objective_value"], errors="coerce"),
+        )
+    ]
+    return pd.Series([np.nan if g is None else g for g in gaps], index=frame.index, dtype=float)
+
+
+def accurate_runs(
+    frame: pd.DataFrame, tolerance: float, references: dict | None = None
+) -> np.ndarray:
+    """Mask of solved runs whose objective gap and primal residual are within ``tolerance``.
+
+    A run without a reference objective or residual is judged on the
+    measures it has.
+    """
+    solved = frame["status"].isin(SOLVED_STATUSES).to_numpy()
+    gap = objective_gaps(frame, references).to_numpy()
+    residual = pd.to_numeric(frame["primal_residual"], errors="coerce").to_numpy()
+    with np.errstate(invalid="ignore"):
+        within = ~(gap > tolerance) & ~(residual > tolerance)
+    return solved & within
+
+
+def mark_inaccurate(
+    results: list[BenchmarkResult] | ResultTable | pd.DataFrame,
+    tolerance: float,
+    references: dict | None = None,
+) -> pd.DataFrame:
+    """Copy of the results with inaccurate solved runs given status ``"inaccurate"``.
+
+    The SGM and profile reports then count those runs as failures, so they
+    compare the time to reach accuracy ``tolerance`` instead of raw times.
+    """
+    frame = results_frame(results)
+    solved = frame["status"].isin(SOLVED_STATUSES).to_numpy()
+    inaccurate = solved & ~accurate_runs(frame, tolerance, references)
+    frame = frame.copy()
+    status = frame["status"].astype(str).to_numpy(copy=True)
+    status[inaccurate] = "inaccurate"
+    frame["status"] = pd.Categorical(status)
+    return frame
+
+
+def accuracy_table(
+    results: list[BenchmarkResult] | ResultTable | pd.DataFrame,
+    tolerance: float = 1e-6,
+    metric: str = "solve_time",
+    references: dict | None = None,
+    problem_type: str | None = None,
+) -> dict[str, dict[str, dict]]:
+    """Time to reach accuracy ``tolerance`` per problem and solver.
+
+    Returns ``{problem: {solver: {"time", "gap", "primal", "dual",
+    "accurate", "status"}}}`` for the last run of each pair: ``time`` is
+    ``metric`` if the run is accurate (see :func:`accurate_runs`) and None
+    otherwise, ``gap`` the objective gap and ``primal`` / ``dual`` the
+    residuals.
+    """
+    frame = results_frame(results)
+    mask = np.ones(len(frame), dtype=bool)
+    if problem_type:
+        mask &= (frame["problem_type"] == problem_type).to_numpy()
+    accurate = accurate_runs(frame, tolerance, references)
+    runs = pd.DataFrame(
+        {
+            "problem_name": frame["problem_name"].astype(str),
+            "solver_name": frame["solver_name"].astype(str),
+            "time": metric_series(frame, metric).where(accurate),
+            "gap": objective_gaps(frame, references),
+            "primal": pd.to_numeric(frame["primal_residual"], errors="coerce"),
+            "dual": pd.to_numeric(frame["dual_residual"], errors="coerce"),
+            "accurate": accurate,
+            "status": frame["status"].astype(str),
+        }
+    )[mask]
+    runs = runs.drop_duplicates(["problem_name", "solver_name"], keep="last")
+
+    table: dict[str, dict[str, dict]] = {}
+    for row in runs.sort_values(["problem_name", "solver_name"]).itertuples(index=False):
+        table.setdefault(row.problem_name, {})[row.solver_name] = {
+            "time": _none_if_nan(row.time),
+            "gap": _none_if_nan(row.gap),
+            "primal": _none_if_nan(row.primal),
+            "dual": _none_if_nan(row.dual),
+            "accurate": bool(row.accurate),
+            "status": row.status,
+        }
+    return table
+
+
+# Size measures a scaling fit can use, and the result field holding each.
+SCALING_MEASURES = {
+    "size": "size",
+    "nnz": "num_nonzeros",
+    "variables": "num_scalar_variables",
+}
+
+
+def scaling_exponents(
+    results: list[BenchmarkResult] | ResultTable | pd.DataFrame,
+    metric: str = "solve_time",
+    by: str = "size",
+) -> dict[str, dict[str, dict]]:
+    """Fit ``metric ≈ c * x**k`` per problem family and solver.
+
+    Uses the solved runs of scaling sweeps (results with a ``size``; the
+    family is the problem name before ``"@"``), where ``x`` is the
+    measure named by ``by``: ``"size"``, ``"nnz"`` or ``"variables"``. The
+    fit is least squares in log-log space over at least two distinct sizes.
+    Returns ``{family: {solver: {"exponent", "coefficient", "r2", "points",
+    "largest", "largest_value"}}}``, where ``largest`` is the largest ``x``
+    solved and ``largest_value`` its metric value.
+    """
+    if by not in SCALING_MEASURES:
+        raise ValueError(f"Unknown size measure {by!r}, expected one of {list(SCALING_MEASURES)}")
+    frame = results_frame(results)
+    values = metric_series(frame, metric).to_numpy()
+    x = pd.to_numeric(frame[SCALING_MEASURES[by]], errors="coerce").to_numpy()
+    mask = (
+        frame["size"].notna().to_numpy()
+        & frame["status"].isin(SOLVED_STATUSES).to_numpy()
+        & (values > 0)
+        & (x > 0)
+    )
+    if not mask.any():
+        return {}
+    runs = pd.DataFrame(
+        {
+            "family": frame["problem_name"][mask].astype(str).str.split("@").str[0].to_numpy(),
+            "solver_name": frame["solver_name"][mask].astype(str).to_numpy(),
+            "log_x": np.log(x[mask]),
+            "log_value": np.log(values[mask]),
+        }
+    )
+
+    fits: dict[str, dict[str, dict]] = {}
+    for (family, solver), group in runs.groupby(["family", "solver_name"], sort=True):
+        if group["log_x"].nunique() < 2:
+            continue
+        log_x, log_value = group["log_x"].to_numpy(), group["log_value"].to_numpy()
+        exponent, intercept = np.polyfit(log_x, log_value, 1)
+        residual = log_value - (exponent * log_x + intercept)
+        spread = ((log_value - log_value.mean()) ** 2).sum()
+        largest = log_x.argmax()
+        fits.setdefault(family, {})[solver] = {
+            "exponent": float(exponent),
+            "coefficient": float(np.exp(intercept)),
+            "r2": float(1 - (residual**2).sum() / spread) if spread > 0 else 1.0,
+            "points": len(group),
+            "largest": float(np.exp(log_x[largest])),
+            "largest_value": float(np.exp(log_value[largest])),
+        }
+    return fits
+
+
+def machine_summary(
+    results: list[BenchmarkResult] | ResultTable | pd.DataFrame,
+) -> pd.DataFrame:
+    """One row per machine (host fingerprint and CPU) that contributed runs.
+
+    Columns: contributors, cores, memory, BLAS, number of runs and the median
+    calibration time, the divisor of the ``*_norm`` metrics. Details come
+    from the machine's most recent run that recorded them.
+    """
+    frame = results_frame(results)
+    rows = []
+    groups = frame.groupby(["host_fingerprint", "cpu_info"], observed=True)
+    for (host, cpu), idx in groups.indices.items():
+        runs = frame.iloc[idx]
+        recorded = runs["machine"].dropna()
+        machine = json.loads(recorded.iloc[-1]) if len(recorded) else {}  # JSON text
+        calibration = pd.to_numeric(runs["calibration_time"], errors="coerce")
+        rows.append(
+            {
+                "host_fingerprint": host or "—",
+                "contributor": ", ".join(sorted(runs["contributor"].astype(str).unique())),
+                "cpu": cpu,
+                "cores": machine.get("physical_cores"),
+                "threads": machine.get("logical_cpus"),
+                "memory_gb": machine.get("memory_gb"),
+                "blas": machine.get("blas"),
+                "runs": len(runs),
+                "calibration_time": _none_if_nan(calibration.median()),
+            }
+        )
+    if not rows:
+        return pd.DataFrame()
+    return pd.DataFrame(rows).set_index("host_fingerprint").sort_values("calibration_time")
+
+
+def results_to_dataframe(results: list[BenchmarkResult]) -> pd.DataFrame:
+    """Convert results to a pandas DataFrame."""
+    return results_frame(results)
 
 
 def format_comparison_table(
@@ -133,3 +920,228 @@ def format_reliability_summary(
             pct = (optimal / total * 100) if total > 0 else 0
             lines.append(f"  {ptype:>6}: {optimal}/{total} ({pct:.0f}%)")
     return "\n".join(lines)
+
+
+def format_sgm(summaries: dict[str, dict[str, dict]], metric: str = "solve_time") -> str:
+    """Format shifted geometric means, one block per problem type."""
+    lines = [f"Shifted geometric mean of {metric} (failures at the time limit)"]
+    for ptype, summary in summaries.items():
+        lines.append(f"\n{ptype}:")
+        ranked = sorted(summary.items(), key=lambda kv: (kv[1]["sgm"] is None, kv[1]["sgm"] or 0))
+        for solver, entry in ranked:
+            if entry["sgm"] is None:
+                lines.append(f"  {solver:<12} {'—':>10}")
+                continue
+            lines.append(
+                f"  {solver:<12} {entry['sgm']:>10.4f}  x{entry['relative']:<7.2f} "
+                f"solved {entry['solved']}/{entry['total']}"
+            )
+    return "\n".join(lines)
+
+
+def format_profile(profile: pd.DataFrame, points=(1, 2, 4, 10, 100, 1000)) -> str:
+    """Format a profile sampled at a few ``points`` of its index."""
+    if profile.empty:
+        return "No solved runs."
+    values = profile.reindex(np.asarray(points, dtype=float), method="ffill").fillna(0.0)
+    name = profile.index.name or "x"
+    header = f"{name:>8}  " + "  ".join(f"{s:>10}" for s in profile.columns)
+    lines = [header, "-" * len(header)]
+    for x, row in zip(values.index, values.to_numpy()):
+        lines.append(f"{x:>8g}  " + "  ".join(f"{v:>10.2f}" for v in row))
+    return "\n".join(lines)
+
+
+def format_phase_breakdown(breakdown: pd.DataFrame) -> str:
+    """Format a phase breakdown with each phase's share of the run."""
+    if breakdown.empty:
+        return "No results with a phase breakdown."
+    lines = ["Time per phase (median over runs)", "=" * 40]
+    for (problem, solver), row in breakdown.iterrows():
+        row = row.dropna()
+        total = row.sum()
+        lines.append(f"\n{problem} with {solver}: {total:.4f}s")
+        for phase, seconds in row.items():
+            share = seconds / total * 100 if total > 0 else 0
+            lines.append(f"  {phase:<18} {seconds:>10.4f}s {share:>5.1f}%")
+    return "\n".join(lines)
+
+
+def format_scaling(
+    fits: dict[str, dict[str, dict]], metric: str = "solve_time", by: str = "size"
+) -> str:
+    """Format scaling fits, solvers ordered by exponent within each family."""
+    if not fits:
+        return "No scaling sweeps with at least two solved sizes."
+    lines = [f"Scaling of {metric} with {by}: {metric} ~ c * {by}^k"]
+    for family, by_solver in fits.items():
+        lines.append(f"\n{family}:")
+        lines.append(
+            f"  {'Solver':<12} {'k':>6} {'R^2':>6} {'points':>6} {'largest ' + by:>16} {metric:>14}"
+        )
+        for solver, fit in sorted(by_solver.items(), key=lambda kv: kv[1]["exponent"]):
+            lines.append(
+                f"  {solver:<12} {fit['exponent']:>6.2f} {fit['r2']:>6.2f} {fit['points']:>6} "
+                f"{fit['largest']:>16g} {fit['largest_value']:>14.4g}"
+            )
+    return "\n".join(lines)
+
+
+def format_resolve_summary(summary: dict[str, dict[str, dict]]) -> str:
+    """Format first-solve vs steady-state re-solve latencies."""
+    if not summary:
+        return "No solved runs in resolve mode."
+
+    def cell(value: float | None, fmt: str) -> str:
+        return f"{'—':>10}" if value is None else f"{value:>10{fmt}}"
+
+    lines = ["Re-solve latency: first solve vs steady state (seconds)"]
+    for problem, by_solver in summary.items():
+        lines.append(f"\n{problem}:")
+        lines.append(f"  {'Solver':<12} {'first':>10} {'steady':>10} {'speedup':>10} {'cold':>10}")
+        for solver, entry in sorted(by_solver.items(), key=lambda kv: kv[1]["steady"] or np.inf):
+            lines.append(
+                f"  {solver:<12} {cell(entry['first'], '.4f')} {cell(entry['steady'], '.4f')} "
+                f"{cell(entry['speedup'], '.1f')} {cell(entry['cold'], '.4f')}"
+            )
+    return "\n".join(lines)
+
+
+def format_latency_summary(summary: dict[str, dict[str, dict]]) -> str:
+    """Format latency percentiles in milliseconds, fastest p99 first."""
+    if not summary:
+        return "No latency-mode runs."
+    columns = [f"p{q:g}" for q in PERCENTILES]
+    lines = ["Latency per call (ms): total = native solver time + CVXPY overhead"]
+    for problem, by_solver in summary.items():
+        lines.append(f"\n{problem}:")
+        lines.append(
+            f"  {'Solver':<12} {'part':<9} {'calls':>7} " + " ".join(f"{c:>9}" for c in columns)
+        )
+        ranked = sorted(by_solver.items(), key=lambda kv: kv[1]["total"].get("p99", np.inf))
+        for solver, parts in ranked:
+            for name in ("total", "native", "overhead"):
+                if name not in parts:
+                    continue
+                entry = parts[name]
+                values = " ".join(f"{entry[c] * 1e3:>9.3f}" for c in columns)
+                label = solver if name == "total" else ""
+                lines.append(f"  {label:<12} {name:<9} {entry['count']:>7} {values}")
+    return "\n".join(lines)
+
+
+def format_direct_summary(summary: dict[str, dict[str, dict]]) -> str:
+    """Format end-to-end vs direct-to-solver times in milliseconds, fastest first."""
+    if not summary:
+        return "No direct-mode runs."
+
+    def cell(value: float | None, scale: float = 1e3, fmt: str = ".3f") -> str:
+        return f"{'—':>10}" if value is None else f"{value * scale:>10{fmt}}"
+
+    lines = ["Time per solve (ms): total = direct solver call + CVXPY overhead"]
+    for problem, by_solver in summary.items():
+        lines.append(f"\n{problem}:")
+        lines.append(
+            f"  {'Solver':<12} {'total':>10} {'direct':>10} {'native':>10} "
+            f"{'overhead':>10} {'share':>10}"
+        )
+        ranked = sorted(
+            by_solver.items(),
+            key=lambda kv: kv[1]["total"] if kv[1]["total"] is not None else np.inf,
+        )
+        for solver, entry in ranked:
+            lines.append(
+                f"  {solver:<12} {cell(entry['total'])} {cell(entry['direct'])} "
+                f"{cell(entry['native'])} {cell(entry['overhead'])} "
+                f"{cell(entry['overhead_share'], 100, '.1f')}%"
+            )
+    return "\n".join(lines)
+
+
+def format_machine_summary(machines: pd.DataFrame) -> str:
+    """Format the machines that contributed runs, fastest calibration first."""
+    if machines.empty:
+        return "No results."
+
+    def cell(value, width: int, fmt: str = "") -> str:
+        return f"{'—':>{width}}" if value is None or pd.isna(value) else f"{value:>{width}{fmt}}"
+
+    lines = [
+        "Machines (calibration: seconds for the reference workload, lower is faster)",
+        f"{'Host':<12} {'Contributor':<16} {'Cores':>5} {'Threads':>7} {'RAM GB':>7} "
+        f"{'Calibration':>11} {'Runs':>6}  CPU / BLAS",
+    ]
+    for host, row in machines.iterrows():
+        lines.append(
+            f"{host:<12} {row['contributor'][:16]:<16} {cell(row['cores'], 5, '.0f')} "
+            f"{cell(row['threads'], 7, '.0f')} {cell(row['memory_gb'], 7, '.1f')} "
+            f"{cell(row['calibration_time'], 11, '.4f')} {row['runs']:>6}  "
+            f"{row['cpu']} / {row['blas'] or '—'}"
+        )
+    return "\n".join(lines)
+
+
+def format_accuracy_table(
+    table: dict[str, dict[str, dict]], tolerance: float, metric: str = "solve_time"
+) -> str:
+    """Format times to accuracy, accurate solvers fastest first."""
+    if not table:
+        return "No results."
+
+    def cell(value: float | None) -> str:
+        return f"{'—':>10}" if value is None else f"{value:>10.2e}"
+
+    lines = [f"{metric} to reach accuracy {tolerance:g} (objective gap and primal residual)"]
+    for problem, by_solver in table.items():
+        lines.append(f"\n{problem}:")
+        lines.append(
+            f"  {'Solver':<12} {metric:>12} {'gap':>10} {'primal':>10} {'dual':>10}"
+        )
+        ranked = sorted(
+            by_solver.items(),
+            key=lambda kv: kv[1]["time"] if kv[1]["time"] is not None else np.inf,
+        )
+        for solver, entry in ranked:
+            if entry["time"] is not None:
+                time_cell = f"{entry['time']:>12.4f}"
+            elif entry["status"] not in SOLVED_STATUSES:
+                time_cell = f"{entry['status'][:12]:>12}"
+            else:
+                time_cell = f"{'—' if entry['accurate'] else 'inaccurate':>12}"
+            lines.append(
+                f"  {solver:<12} {time_cell} {cell(entry['gap'])} "
+                f"{cell(entry['primal'])} {cell(entry['dual'])}"
+            )
+    return "\n".join(lines)
+
+
+def format_seed_summary(summary: dict[str, dict[str, dict]], metric: str = "solve_time") -> str:
+    """Format the spread over seeds, lowest median first."""
+    if not summary:
+        return "No results."
+
+    def cell(value: float | None) -> str:
+        return f"{'—':>10}" if value is None else f"{value:>10.4f}"
+
+    def seeds(values: list[int]) -> str:
+        return ",".join(map(str, values)) or "—"
+
+    lines = [f"{metric} over seeds (solved seeds only; outliers: robust z > {OUTLIER_Z:g})"]
+    for problem, by_solver in summary.items():
+        lines.append(f"\n{problem}:")
+        lines.append(
+            f"  {'Solver':<12} {'solved':>8} {'median':>10} {'min':>10} {'max':>10} "
+            f"{'IQR':>10}  failed / outlier seeds"
+        )
+        ranked = sorted(
+            by_solver.items(),
+            key=lambda kv: kv[1]["median"] if kv[1]["median"] is not None else np.inf,
+        )
+        for solver, entry in ranked:
+            solved = f"{entry['solved']}/{entry['seeds']}"
+            lines.append(
+                f"  {solver:<12} {solved:>8} {cell(entry['median'])} {cell(entry['min'])} "
+                f"{cell(entry['max'])} {cell(entry['iqr'])}  "
+                f"{seeds(entry['failed'])} / {seeds(entry['outliers'])}"
+            )
+    return "\n".join(lines)
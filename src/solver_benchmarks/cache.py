@@ -0,0 +1,216 @@
+"""Cache of built problems and their canonicalized form.
+
+Building a problem and canonicalizing it (the CVXPY reduction chain up to, but
+not including, the solver) often costs more than solving it. A
+:class:`ProblemCache` builds each (problem, seed) once and canonicalizes it
+once per distinct reduction chain; every solver whose chain matches, e.g. the
+conic solvers, then only pays its own solver-specific data formatting.
+
+The cache primes CVXPY's per-problem compilation cache, so the solve itself
+still goes through ``problem.solve()``. Entries can optionally be persisted to
+a directory as pickles, which skips both steps on later runs.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import cvxpy as cp
+from cvxpy.reductions.chain import Chain
+from cvxpy.reductions.eval_params import EvalParams
+from cvxpy.reductions.solvers.solving_chain import SolvingChain
+
+from solver_benchmarks.problems import ProblemSpec
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CanonicalForm:
+    """Output of the solver-independent part of a solving chain."""
+
+    reductions: list
+    param_prog: object
+    inverse_data: list
+    canonicalization_time: float
+
+
+@dataclass
+class CacheEntry:
+    problem: cp.Problem
+    construction_time: float
+    chains: dict[tuple[str, ...], CanonicalForm] = field(default_factory=dict)
+
+
+def chain_key(reductions: list) -> tuple[str, ...]:
+    """Describe the reductions that determine the canonical form."""
+    key = []
+    for r in reductions:
+        opts = [
+            f"{attr}={getattr(r, attr)!r}"
+            for attr in ("quad_obj", "canon_backend")
+            if hasattr(r, attr)
+        ]
+        key.append(f"{type(r).__name__}({', '.join(opts)})")
+    return tuple(key)
+
+
+_SHARED: dict[str | None, ProblemCache] = {}
+
+
+def _shared_cache(directory: str | None, max_problems: int) -> ProblemCache:
+    """Return the per-process cache for ``directory``."""
+    if directory not in _SHARED:
+        _SHARED[directory] = ProblemCache(directory, max_problems)
+    return _SHARED[directory]
+
+
+class ProblemCache:
+    """Build and canonicalize each benchmark problem once.
+
+    Entries are keyed on (problem name, seed, cvxpy version), plus the
+    problem source and instance directory for problems loaded from exported
+    instances (see :func:`~solver_benchmarks.export.instance_spec`), and hold the
+    built ``cp.Problem`` plus one canonical form per reduction chain. Only the
+    ``max_problems`` most recently used problems are kept in memory. If
+    ``directory`` is given, entries are also pickled there and reloaded on a
+    miss.
+
+    A cache sent to a worker process is replaced by that process's own cache
+    for the same directory, so pooled workers reuse their entries across jobs.
+    """
+
+    def __init__(self, directory: str | Path | None = None, max_problems: int = 2):
+        self.directory = Path(directory) if directory is not None else None
+        self.max_problems = max_problems
+        self.builds = 0
+        self.canonicalizations = 0
+        self._entries: OrderedDict[tuple, CacheEntry] = OrderedDict()
+
+    def __reduce__(self):
+        directory = str(self.directory) if self.directory is not None else None
+        return _shared_cache, (directory, self.max_problems)
+
+    def _key(self, spec: ProblemSpec, seed: int) -> tuple:
+        key = (spec.name, seed, cp.__version__)
+        if spec.source != "native":
+            key += (spec.source, getattr(spec.func, "directory", None))
+        return key
+
+    def _path(self, key: tuple) -> Path:
+        digest = hashlib.sha256(repr(key).encode()).hexdigest()[:16]
+        safe_name = key[0].replace("/", "__")
+        return self.directory / f"{safe_name}_{key[1]}_{digest}.pkl"
+
+    def _load(self, key: tuple) -> CacheEntry | None:
+        if self.directory is None:
+            return None
+        path = self._path(key)
+        if not path.exists():
+            return None
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except Exception as exc:
+            logger.warning("Ignoring unreadable cache file %s: %s", path, exc)
+            return None
+
+    def _save(self, key: tuple, entry: CacheEntry) -> None:
+        if self.directory is None:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        # CVXPY's own compilation and solver caches may hold solver objects
+        # that can't be pickled; they are rebuilt by prepare() anyway.
+        problem = entry.problem
+        saved = problem._cache, problem._solver_cache
+        problem._cache, problem._solver_cache = type(problem._cache)(), {}
+        # Write then rename so concurrent workers never see a partial file.
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+        finally:
+            problem._cache, problem._solver_cache = saved
+        os.replace(tmp, path)
+
+    def entry(self, spec: ProblemSpec, seed: int) -> CacheEntry:
+        """Return the cache entry for ``spec``, building it on a miss."""
+        key = self._key(spec, seed)
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._load(key)
+            if entry is None:
+                t0 = time.perf_counter()
+                problem = spec.func(seed)
+                entry = CacheEntry(problem, time.perf_counter() - t0)
+                self.builds += 1
+                self._save(key, entry)
+            self._entries[key] = entry
+            while len(self._entries) > self.max_problems:
+                self._entries.popitem(last=False)
+        self._entries.move_to_end(key)
+        return entry
+
+    def problem(self, spec: ProblemSpec, seed: int) -> cp.Problem:
+        """Return the cached problem for ``spec`` and ``seed``."""
+        return self.entry(spec, seed).problem
+
+    def prepare(self, spec: ProblemSpec, seed: int, solver_name: str) -> cp.Problem:
+        """Return the cached problem, ready to be solved by ``solver_name``.
+
+        CVXPY's compilation cache is filled from the shared canonical form,
+        so ``problem.solve(solver=solver_name)`` only runs the solver's own
+        data formatting before solving.
+        """
+        entry = self.entry(spec, seed)
+        problem = entry.problem
+        cache_key = problem._cache.make_key(solver_name, False, False, None)
+        if problem._cache.key == cache_key:
+            return problem
+
+        chain = problem._construct_chain(solver=solver_name)
+        prefix = chain.reductions[:-1]
+        if any(isinstance(r, EvalParams) for r in prefix):
+            # Parameter values are baked in; the canonical form can't be reused.
+            return problem
+
+        ck = chain_key(prefix)
+        canon = entry.chains.get(ck)
+        if canon is None:
+            t0 = time.perf_counter()
+            param_prog, inverse_data = Chain(problem, prefix).apply(problem)
+            canon = CanonicalForm(
+                prefix, param_prog, inverse_data, time.perf_counter() - t0
+            )
+            entry.chains[ck] = canon
+            self.canonicalizations += 1
+            self._save(self._key(spec, seed), entry)
+
+        solving_chain = SolvingChain(
+            problem=problem, reductions=[*canon.reductions, chain.solver]
+        )
+        solver_context = getattr(chain, "solver_context", None)
+        if solver_context is not None:
+            solving_chain.solver_context = solver_context
+            problem.solver_context = solver_context
+        problem._cache.invalidate()
+        problem._cache.key = cache_key
+        problem._cache.solving_chain = solving_chain
+        problem._cache.param_prog = canon.param_prog
+        problem._cache.inverse_data = canon.inverse_data
+        problem._solver_cache = {}
+        return problem
+
+    def problem_data(self, spec: ProblemSpec, seed: int, solver_name: str):
+        """Return ``get_problem_data`` output for ``solver_name`` from the cache."""
+        problem = self.prepare(spec, seed, solver_name)
+        return problem.get_problem_data(solver_name)
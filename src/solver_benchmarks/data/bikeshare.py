@@ -1,29 +1,202 @@
-"""Download and prepare the bikeshare dataset."""
+"""Download, cache and prepare the bikeshare dataset.
+
+The raw archive is downloaded once into a local data directory (see
+:func:`data_dir`). Derived artifacts are stored next to it under a
+subdirectory named after the archive's SHA-256 digest, so they are rebuilt
+automatically if the archive changes:
+
+- the parsed frame as Parquet (when ``pyarrow`` is installed) or a pickle,
+- the feature matrices as ``.npy`` arrays that are loaded memory-mapped.
+
+To work offline, copy ``2011-capitalbikeshare-tripdata.zip`` into the data
+directory before the first run.
+"""
+
+import functools
+import hashlib
+import os
+from pathlib import Path
+from zipfile import ZipFile
 
-import pandas as pd
 import numpy as np
+import pandas as pd
 import requests
-from io import BytesIO
-from zipfile import ZipFile
 import scipy as sp
 
+URL = "https://s3.amazonaws.com/capitalbikeshare-data/2011-capitalbikeshare-tripdata.zip"
+ARCHIVE_NAME = "2011-capitalbikeshare-tripdata.zip"
+CSV_NAME = "2011-capitalbikeshare-tripdata.csv"
+
+# Environment variable overriding the data directory.
+DATA_DIR_ENV = "SOLVER_BENCHMARKS_DATA_DIR"
+
 
-def load_bikeshare_data():
-    """Load and return the bikeshare dataset from a public URL.
+def data_dir(directory=None):
+    """Return the local data directory.
 
-    Returns pandas DataFrame.
+    Uses ``directory`` if given, else ``$SOLVER_BENCHMARKS_DATA_DIR``, else
+    ``$XDG_CACHE_HOME/solver_benchmarks/data`` (``~/.cache`` by default).
     """
-    URL = "https://s3.amazonaws.com/capitalbikeshare-data/2011-capitalbikeshare-tripdata.zip"
-    resp = requests.get(URL)
-    resp.raise_for_status()
+    if directory is not None:
+        return Path(directory)
+    if os.environ.get(DATA_DIR_ENV):
+        return Path(os.environ[DATA_DIR_ENV])
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "solver_benchmarks" / "data"
+
+
+def _write_atomic(path, write):
+    tmp = path.with_name(path.name + ".tmp")
+    write(tmp)
+    os.replace(tmp, path)
+
+
+def _download(directory):
+    try:
+        resp = requests.get(URL)
+        resp.raise_for_status()
+    except requests.RequestException as exc:
+        raise RuntimeError(
+            f"Could not download the bikeshare dataset ({exc}). To run "
+            f"offline, place {ARCHIVE_NAME} in {directory} or point "
+            f"{DATA_DIR_ENV} at a directory containing it."
+        ) from exc
+    directory.mkdir(parents=True, exist_ok=True)
+    _write_atomic(directory / ARCHIVE_NAME, lambda p: p.write_bytes(resp.content))
+
+
+def _archive_digest(directory):
+    """Return the SHA-256 of the local archive, downloading it if needed."""
+    archive = directory / ARCHIVE_NAME
+    stamp = directory / (ARCHIVE_NAME + ".sha256")
+    if not archive.exists():
+        if stamp.exists():
+            # Derived artifacts may outlive the archive itself.
+            digest = stamp.read_text().split()[0]
+            artifacts = _artifacts(directory, digest)
+            if artifacts.is_dir() and any(artifacts.iterdir()):
+                return digest
+        _download(directory)
+
+    st = archive.stat()
+    if stamp.exists():
+        digest, size, mtime = stamp.read_text().split()
+        if int(size) == st.st_size and int(mtime) == st.st_mtime_ns:
+            return digest
+    digest = hashlib.sha256(archive.read_bytes()).hexdigest()
+    stamp.write_text(f"{digest} {st.st_size} {st.st_mtime_ns}\n")
+    return digest
+
+
+def _artifacts(directory, digest):
+    return directory / f"bikeshare-{digest[:16]}"
+
+
+def _artifact_dir(directory):
+    return _artifacts(directory, _archive_digest(directory))
+
+
+def _read_frame(path):
+    if path.with_suffix(".parquet").exists():
+        return pd.read_parquet(path.with_suffix(".parquet"))
+    return pd.read_pickle(path.with_suffix(".pkl"))
+
+
+def _write_frame(df, path):
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        _write_atomic(path.with_suffix(".pkl"), lambda p: df.to_pickle(p))
+    else:
+        _write_atomic(
+            path.with_suffix(".parquet"), lambda p: df.to_parquet(p, index=False)
+        )
 
-    with ZipFile(BytesIO(resp.content)) as zf:
-        csv_name = "2011-capitalbikeshare-tripdata.csv"
-        with zf.open(csv_name) as f:
+
+@functools.lru_cache(maxsize=None)
+def _load_frame(directory):
+    artifacts = _artifact_dir(directory)
+    frame = artifacts / "frame"
+    if frame.with_suffix(".parquet").exists() or frame.with_suffix(".pkl").exists():
+        return _read_frame(frame)
+
+    if not (directory / ARCHIVE_NAME).exists():
+        # Only the features outlived the archive: fetch it again.
+        _download(directory)
+        artifacts = _artifact_dir(directory)
+        frame = artifacts / "frame"
+    with ZipFile(directory / ARCHIVE_NAME) as zf:
+        with zf.open(CSV_NAME) as f:
             df_bikeshare = pd.read_csv(f)
+    artifacts.mkdir(parents=True, exist_ok=True)
+    _write_frame(df_bikeshare, frame)
     return df_bikeshare
 
 
+def _save_array(path, arr):
+    with open(path, "wb") as f:
+        np.save(f, arr)
+
+
+_FEATURE_ARRAYS = ("data", "indices", "indptr", "shape", "dense")
+
+
+@functools.lru_cache(maxsize=None)
+def _load_features(directory):
+    features = _artifact_dir(directory) / "features"
+    paths = {name: features / f"{name}.npy" for name in _FEATURE_ARRAYS}
+    if all(p.exists() for p in paths.values()):
+        arrays = {name: np.load(p, mmap_mode="r") for name, p in paths.items()}
+        A_sparse = sp.sparse.csr_matrix(
+            (arrays["data"], arrays["indices"], arrays["indptr"]),
+            shape=tuple(arrays["shape"]),
+        )
+        return A_sparse, arrays["dense"]
+
+    A_sparse, A_dense = get_bikeshare_features(_load_frame(directory))
+    features.mkdir(parents=True, exist_ok=True)
+    for name, arr in [
+        ("data", A_sparse.data),
+        ("indices", A_sparse.indices),
+        ("indptr", A_sparse.indptr),
+        ("shape", np.array(A_sparse.shape)),
+        ("dense", A_dense),
+    ]:
+        _write_atomic(paths[name], functools.partial(_save_array, arr=arr))
+    return A_sparse, A_dense
+
+
+def load_bikeshare_data(directory=None):
+    """Load and return the bikeshare dataset.
+
+    The archive is fetched from a public URL on first use and the parsed
+    frame is cached on disk and in memory (see the module docstring).
+
+    Returns a pandas DataFrame, a copy of the cached one, so callers may
+    modify it.
+    """
+    return _load_frame(data_dir(directory).resolve()).copy()
+
+
+def load_bikeshare_features(directory=None):
+    """Return cached ``(A_sparse, A_dense)`` from :func:`get_bikeshare_features`.
+
+    The arrays are memory-mapped read-only from the data directory.
+    """
+    return _load_features(data_dir(directory).resolve())
+
+
+def _one_hot(column):
+    """Sparse one-hot encoding with one column per sorted unique value."""
+    categorical = pd.Categorical(column)
+    codes = categorical.codes
+    rows = np.flatnonzero(codes >= 0)  # missing values get an all-zero row
+    return sp.sparse.csr_matrix(
+        (np.ones(len(rows)), (rows, codes[rows])),
+        shape=(len(codes), len(categorical.categories)),
+    )
+
+
 def get_bikeshare_features(df_bikeshare):
     """Extract features from the bikeshare DataFrame.
 
@@ -31,13 +204,9 @@ def get_bikeshare_features(df_bikeshare):
         - A_sparse is a one-hot encoding of start and end station numbers.
         - A_dense is a dense matrix of sine and cosine features for the start time.
     """
-    A_start_location = sp.sparse.csr_matrix(
-        pd.get_dummies(df_bikeshare["Start station number"], sparse=True).values
-    )
-    A_end_location = sp.sparse.csr_matrix(
-        pd.get_dummies(df_bikeshare["End station number"], sparse=True).values
-    )
-    A_sparse = sp.sparse.hstack([A_start_location, A_end_location])
+    A_start_location = _one_hot(df_bikeshare["Start station number"])
+    A_end_location = _one_hot(df_bikeshare["End station number"])
+    A_sparse = sp.sparse.hstack([A_start_location, A_end_location], format="csr")
 
     t = pd.to_datetime(df_bikeshare["Start date"])
     sec = (t.dt.hour * 3600 + t.dt.minute * 60 + t.dt.second).to_numpy()
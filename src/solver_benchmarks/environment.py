@@ -0,0 +1,238 @@
+"""Describe and calibrate the machine running the benchmarks.
+
+:func:`machine_info` collects what affects solver timings besides the code:
+CPU model, core and thread counts, clock frequency, cache sizes, memory,
+the BLAS/LAPACK NumPy is built against and the versions of the numerical
+packages. Everything is best effort: values that cannot be read on a
+platform are None. ``psutil`` is used when installed.
+
+:func:`calibration_time` times a fixed linear-algebra workload (dense matrix
+products and a Cholesky factorization, sparse matrix-vector products and a
+sparse LU solve). Dividing a timing by it gives a machine-normalized time,
+the ``*_norm`` metrics of :mod:`solver_benchmarks.analysis`.
+"""
+
+from __future__ import annotations
+
+import os
+import platform
+import subprocess
+import time
+from functools import lru_cache
+from importlib import metadata
+from pathlib import Path
+
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.linalg import splu
+
+from solver_benchmarks.solvers import SOLVER_DISTRIBUTIONS, solver_distributions
+
+# Packages whose versions are recorded when installed.
+PACKAGES = tuple(
+    dict.fromkeys(["cvxpy", "numpy", "scipy", *solver_distributions(SOLVER_DISTRIBUTIONS)])
+)
+
+GB = 1024**3
+_UNITS = {"K": 1024, "M": 1024**2, "G": 1024**3}
+
+
+def _sysctl(name: str) -> str | None:
+    try:
+        out = subprocess.run(
+            ["sysctl", "-n", name], capture_output=True, text=True, timeout=5
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if out.returncode != 0:
+        return None
+    return out.stdout.strip() or None
+
+
+def _cpuinfo() -> list[dict[str, str]]:
+    """Entries of ``/proc/cpuinfo``, one dict per logical CPU."""
+    try:
+        text = Path("/proc/cpuinfo").read_text()
+    except OSError:
+        return []
+    entries = []
+    for block in text.strip().split("\n\n"):
+        entry = {}
+        for line in block.splitlines():
+            key, _, value = line.partition(":")
+            entry[key.strip()] = value.strip()
+        entries.append(entry)
+    return entries
+
+
+def _int(value) -> int | None:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _cpu_model(cpuinfo: list[dict[str, str]]) -> str:
+    for entry in cpuinfo:
+        for key in ("model name", "Model", "Hardware"):
+            if entry.get(key):
+                return entry[key]
+    if platform.system() == "Darwin":
+        model = _sysctl("machdep.cpu.brand_string")
+        if model:
+            return model
+    if platform.system() == "Windows":
+        try:
+            import winreg
+
+            key = winreg.OpenKey(
+                winreg.HKEY_LOCAL_MACHINE,
+                r"HARDWARE\DESCRIPTION\System\CentralProcessor\0",
+            )
+            return winreg.QueryValueEx(key, "ProcessorNameString")[0].strip()
+        except OSError:
+            pass
+    return platform.processor() or platform.machine()
+
+
+def _physical_cores(cpuinfo: list[dict[str, str]]) -> int | None:
+    cores = {
+        (e.get("physical id"), e.get("core id")) for e in cpuinfo if "core id" in e
+    }
+    if cores:
+        return len(cores)
+    return _int(_sysctl("hw.physicalcpu")) if platform.system() == "Darwin" else None
+
+
+def _cpu_freq_mhz(cpuinfo: list[dict[str, str]]) -> float | None:
+    max_freq = Path("/sys/devices/system/cpu/cpu0/cpufreq/cpuinfo_max_freq")
+    try:
+        return int(max_freq.read_text()) / 1000
+    except (OSError, ValueError):
+        pass
+    for entry in cpuinfo:
+        if "cpu MHz" in entry:
+            return float(entry["cpu MHz"])
+    if platform.system() == "Darwin":
+        hz = _int(_sysctl("hw.cpufrequency_max"))
+        return hz / 1e6 if hz else None
+    return None
+
+
+def _cache_sizes() -> dict[str, int]:
+    """Cache sizes in bytes by level, e.g. ``{"L1d": 49152, "L2": ...}``."""
+    sizes = {}
+    for index in sorted(Path("/sys/devices/system/cpu/cpu0/cache").glob("index*")):
+        try:
+            level = (index / "level").read_text().strip()
+            kind = (index / "type").read_text().strip()
+            size = (index / "size").read_text().strip()
+        except OSError:
+            continue
+        if kind == "Instruction":
+            continue
+        label = f"L{level}d" if kind == "Data" else f"L{level}"
+        unit = _UNITS.get(size[-1], 1)
+        sizes[label] = int(size.rstrip("".join(_UNITS))) * unit
+    if not sizes and platform.system() == "Darwin":
+        for label in ("L1d", "L2", "L3"):
+            value = _int(_sysctl(f"hw.{label.lower()}cachesize"))
+            if value:
+                sizes[label] = value
+    return sizes
+
+
+def _memory_bytes() -> int | None:
+    try:
+        for line in Path("/proc/meminfo").read_text().splitlines():
+            if line.startswith("MemTotal:"):
+                return int(line.split()[1]) * 1024
+    except (OSError, ValueError):
+        pass
+    if platform.system() == "Darwin":
+        return _int(_sysctl("hw.memsize"))
+    return None
+
+
+def _blas() -> dict[str, str | None]:
+    try:
+        deps = np.show_config(mode="dicts").get("Build Dependencies", {})
+    except TypeError:  # NumPy < 1.26 has no mode argument
+        return {"blas": None, "lapack": None}
+    info = {}
+    for name in ("blas", "lapack"):
+        dep = deps.get(name, {})
+        parts = [dep.get("name"), dep.get("version")]
+        info[name] = " ".join(p for p in parts if p) or None
+    return info
+
+
+def package_versions(packages=PACKAGES) -> dict[str, str]:
+    """Versions of the installed ``packages``."""
+    versions = {}
+    for package in packages:
+        try:
+            versions[package] = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            pass
+    return versions
+
+
+@lru_cache(maxsize=None)
+def machine_info() -> dict:
+    """Hardware and software description of this machine (computed once)."""
+    cpuinfo = _cpuinfo()
+    physical_cores = _physical_cores(cpuinfo)
+    freq = _cpu_freq_mhz(cpuinfo)
+    memory = _memory_bytes()
+    try:
+        import psutil
+    except ImportError:
+        pass
+    else:
+        physical_cores = physical_cores or psutil.cpu_count(logical=False)
+        if freq is None and psutil.cpu_freq() is not None:
+            freq = psutil.cpu_freq().max or psutil.cpu_freq().current
+        memory = memory or psutil.virtual_memory().total
+    return {
+        "cpu_model": _cpu_model(cpuinfo),
+        "machine": platform.machine(),
+        "physical_cores": physical_cores,
+        "logical_cpus": os.cpu_count(),
+        "cpu_freq_mhz": freq,
+        "caches": _cache_sizes(),
+        "memory_gb": round(memory / GB, 1) if memory else None,
+        **_blas(),
+        "packages": package_versions(),
+    }
+
+
+def _calibration_kernel(
+    dense: np.ndarray, laplacian: sp.csc_matrix, x: np.ndarray
+) -> None:
+    gram = dense @ dense.T
+    np.linalg.cholesky(gram + dense.shape[0] * np.eye(dense.shape[0]))
+    for _ in range(20):
+        x = laplacian @ x
+        x /= np.linalg.norm(x)
+    splu(laplacian).solve(x)
+
+
+@lru_cache(maxsize=None)
+def calibration_time(repeat: int = 5) -> float:
+    """Best wall time of a fixed dense and sparse linear-algebra workload.
+
+    Computed once per process; takes a few tenths of a second.
+    """
+    rng = np.random.default_rng(0)
+    dense = rng.standard_normal((400, 400))
+    n = 100  # 2-D Laplacian on an n x n grid
+    path = sp.diags([-1.0, 2.0, -1.0], [-1, 0, 1], shape=(n, n))
+    laplacian = (sp.kron(path, sp.eye(n)) + sp.kron(sp.eye(n), path)).tocsc()
+    x = rng.standard_normal(n * n)
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        _calibration_kernel(dense, laplacian, x)
+        best = min(best, time.perf_counter() - t0)
+    return best
@@ -0,0 +1,559 @@
+"""Export benchmark instances to standard formats and cache them on disk.
+
+An instance is canonicalized once into CVXPY's conic form
+
+    minimize    1/2 x'Px + c'x + offset
+    subject to  b - Ax in K,  x_i integer for i in int_idx
+
+where K is a product of zero, nonnegative, second-order, exponential and
+PSD cones in that order (PSD blocks as the upper triangle, column by column,
+with off-diagonal entries scaled by sqrt(2)). Continuous problems take the
+form CVXPY builds for Clarabel, integer problems the one for HiGHS (so
+mixed-integer conic problems cannot be exported); both are CVXPY
+dependencies. Variable bounds that HiGHS takes separately are added
+as rows of the nonnegative cone. Maximization problems are stored as the
+minimization of the negated objective with ``sense = "max"``.
+
+The conic form is always written as ``.npz``; the standard formats are
+written when they can represent the instance:
+
+- ``.mps`` (free MPS, with a QUADOBJ section for QPs): linear constraints only,
+- ``.cbf`` (Conic Benchmark Format, version 3): no quadratic objective,
+- ``.dat-s`` (sparse SDPA): zero, nonnegative and PSD cones, continuous and
+  no quadratic objective; equalities become pairs of inequalities. SDPA
+  only minimizes and has no objective constant, so the file holds the
+  stored minimization and a comment gives the sense and offset.
+
+MPS and CBF files keep the problem's own sense and objective.
+
+Files are stored as ``<directory>/cvxpy-<version>/<problem>/seed<seed>.<ext>``.
+A spec wrapped by :func:`instance_spec` loads its instance from there and
+rebuilds a standard-form ``cp.Problem`` from the matrices, which skips the
+problem's own construction on repeat runs.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from dataclasses import dataclass, replace
+from pathlib import Path
+
+import cvxpy as cp
+import numpy as np
+import scipy.sparse as sp
+from cvxpy.reductions.flip_objective import FlipObjective
+
+from solver_benchmarks.problems import ProblemSpec
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INSTANCE_DIR = Path("instances")
+FORMATS = ("npz", "mps", "cbf", "sdpa")
+EXTENSIONS = {"npz": ".npz", "mps": ".mps", "cbf": ".cbf", "sdpa": ".dat-s"}
+
+_SQRT2 = np.sqrt(2.0)
+
+
+def _svec_entries(n: int) -> tuple[np.ndarray, np.ndarray]:
+    """Row and column of each svec entry of an ``n x n`` PSD block."""
+    rows, cols = [], []
+    for j in range(n):
+        rows.extend(range(j + 1))
+        cols.extend([j] * (j + 1))
+    return np.array(rows, dtype=int), np.array(cols, dtype=int)
+
+
+def _with_bounds(
+    A: sp.csr_array, b: np.ndarray, stop: int, lower: np.ndarray | None, upper: np.ndarray | None
+) -> tuple[sp.csr_array, np.ndarray]:
+    """Insert ``lower <= x <= upper`` as rows ``b - Ax >= 0`` before row ``stop``."""
+    n = A.shape[1]
+    rows, rhs = [], []
+    for bound, sign in ((lower, -1.0), (upper, 1.0)):
+        if bound is None:
+            continue
+        finite = np.flatnonzero(np.isfinite(bound))
+        rows.append(
+            sp.csr_array(
+                (np.full(finite.size, sign), (np.arange(finite.size), finite)),
+                shape=(finite.size, n),
+            )
+        )
+        rhs.append(sign * bound[finite])
+    if not rows:
+        return A, b
+    return (
+        sp.csr_array(sp.vstack([A[:stop], *rows, A[stop:]])),
+        np.concatenate([b[:stop], *rhs, b[stop:]]),
+    )
+
+
+@dataclass
+class ConicInstance:
+    """A problem in conic form; see the module docstring for the convention."""
+
+    name: str
+    seed: int
+    c: np.ndarray
+    A: sp.csc_array
+    b: np.ndarray
+    P: sp.csc_array | None = None
+    offset: float = 0.0
+    sense: str = "min"
+    zero: int = 0
+    nonneg: int = 0
+    soc: tuple[int, ...] = ()
+    exp: int = 0
+    psd: tuple[int, ...] = ()
+    int_idx: np.ndarray | None = None
+    bool_idx: np.ndarray | None = None
+    cvxpy_version: str = cp.__version__
+
+    @classmethod
+    def from_problem(cls, problem: cp.Problem, name: str, seed: int) -> ConicInstance:
+        """Canonicalize ``problem`` into conic form."""
+        solver = cp.HIGHS if problem.is_mixed_integer() else cp.CLARABEL
+        try:
+            data, chain, _ = problem.get_problem_data(solver)
+        except cp.SolverError as exc:
+            raise ValueError(f"{name}: no conic form for export ({exc})") from exc
+        dims = data["dims"]
+        if dims.p3d or getattr(dims, "pnd", None):
+            raise ValueError(f"{name}: power cones cannot be exported")
+        flipped = any(isinstance(r, FlipObjective) for r in chain.reductions)
+        A, b = _with_bounds(
+            sp.csr_array(data["A"]),
+            np.asarray(data["b"], dtype=float),
+            dims.zero + dims.nonneg,
+            data.get("lower_bounds"),
+            data.get("upper_bounds"),
+        )
+        P = data.get("P")
+        return cls(
+            name=name,
+            seed=seed,
+            c=np.asarray(data["c"], dtype=float),
+            A=sp.csc_array(A),
+            b=b,
+            P=sp.csc_array(P) if P is not None and P.nnz else None,
+            offset=float(data["param_prob"].apply_parameters()[1]),
+            sense="max" if flipped else "min",
+            zero=dims.zero,
+            nonneg=dims.nonneg + A.shape[0] - data["A"].shape[0],
+            soc=tuple(dims.soc),
+            exp=dims.exp,
+            psd=tuple(dims.psd),
+            int_idx=np.asarray(data.get("int_vars_idx", []), dtype=int),
+            bool_idx=np.asarray(data.get("bool_vars_idx", []), dtype=int),
+        )
+
+    @property
+    def num_vars(self) -> int:
+        return self.c.size
+
+    @property
+    def is_mixed_integer(self) -> bool:
+        return bool(len(self.int_idx) or len(self.bool_idx))
+
+    def formats(self) -> tuple[str, ...]:
+        """The formats in :data:`FORMATS` that can represent this instance."""
+        linear = not (self.soc or self.exp or self.psd)
+        supported = ["npz"]
+        if linear:
+            supported.append("mps")
+        if self.P is None:
+            supported.append("cbf")
+            if not (self.soc or self.exp or self.is_mixed_integer):
+                supported.append("sdpa")
+        return tuple(supported)
+
+    def _variable(self) -> cp.Expression:
+        """The vector x, stacked from continuous, integer and boolean parts."""
+        integer = np.zeros(self.num_vars, dtype=int)
+        integer[self.int_idx] = 1
+        integer[self.bool_idx] = 2
+        if not integer.any():
+            return cp.Variable(self.num_vars)
+        parts, order = [], []
+        for kind, attributes in enumerate([{}, {"integer": True}, {"boolean": True}]):
+            idx = np.flatnonzero(integer == kind)
+            if idx.size:
+                parts.append(cp.Variable(idx.size, **attributes))
+                order.append(idx)
+        if len(parts) == 1:
+            return parts[0]
+        return cp.hstack(parts)[np.argsort(np.concatenate(order))]
+
+    def to_problem(self) -> cp.Problem:
+        """Build a standard-form ``cp.Problem`` with the same optimal value."""
+        x = self._variable()
+
+        objective = self.c @ x + self.offset
+        if self.P is not None:
+            objective = objective + 0.5 * cp.quad_form(x, self.P, assume_PSD=True)
+
+        A = self.A.tocsr()
+        constraints = []
+
+        def rows(start: int, stop: int):
+            return self.b[start:stop] - A[start:stop] @ x
+
+        start = 0
+        if self.zero:
+            constraints.append(rows(0, self.zero) == 0)
+            start = self.zero
+        if self.nonneg:
+            constraints.append(rows(start, start + self.nonneg) >= 0)
+            start += self.nonneg
+        for dim in self.soc:
+            constraints.append(cp.SOC(rows(start, start + 1)[0], rows(start + 1, start + dim)))
+            start += dim
+        if self.exp:
+            cones = rows(start, start + 3 * self.exp)
+            constraints.append(cp.ExpCone(cones[0::3], cones[1::3], cones[2::3]))
+            start += 3 * self.exp
+        for n in self.psd:
+            size = n * (n + 1) // 2
+            i, j = _svec_entries(n)
+            scale = np.where(i == j, 1.0, 1.0 / _SQRT2)
+            # Map svec entries to the full matrix, column-major.
+            unpack = sp.csc_array(
+                (
+                    np.concatenate([scale, scale[i != j]]),
+                    (
+                        np.concatenate([j * n + i, (i * n + j)[i != j]]),
+                        np.concatenate([np.arange(size), np.arange(size)[i != j]]),
+                    ),
+                ),
+                shape=(n * n, size),
+            )
+            matrix = cp.reshape(unpack @ rows(start, start + size), (n, n), order="F")
+            constraints.append(matrix >> 0)
+            start += size
+        if self.sense == "max":
+            return cp.Problem(cp.Maximize(-objective), constraints)
+        return cp.Problem(cp.Minimize(objective), constraints)
+
+    # -- .npz ------------------------------------------------------------------
+
+    def save_npz(self, path: str | Path) -> None:
+        arrays = {
+            "c": self.c,
+            "A_data": self.A.data,
+            "A_indices": self.A.indices,
+            "A_indptr": self.A.indptr,
+            "A_shape": np.array(self.A.shape),
+            "b": self.b,
+            "offset": np.array(self.offset),
+            "sense": np.array(self.sense),
+            "zero": np.array(self.zero),
+            "nonneg": np.array(self.nonneg),
+            "soc": np.array(self.soc, dtype=int),
+            "exp": np.array(self.exp),
+            "psd": np.array(self.psd, dtype=int),
+            "int_idx": self.int_idx,
+            "bool_idx": self.bool_idx,
+            "name": np.array(self.name),
+            "seed": np.array(self.seed),
+            "cvxpy_version": np.array(self.cvxpy_version),
+        }
+        if self.P is not None:
+            arrays.update(P_data=self.P.data, P_indices=self.P.indices, P_indptr=self.P.indptr)
+        _atomic_write(Path(path), lambda f: np.savez_compressed(f, **arrays), binary=True)
+
+    @classmethod
+    def load_npz(cls, path: str | Path) -> ConicInstance:
+        with np.load(path) as f:
+            shape = tuple(f["A_shape"])
+            P = None
+            if "P_data" in f:
+                P = sp.csc_array(
+                    (f["P_data"], f["P_indices"], f["P_indptr"]), shape=(shape[1],) * 2
+                )
+            return cls(
+                name=str(f["name"]),
+                seed=int(f["seed"]),
+                c=f["c"],
+                A=sp.csc_array((f["A_data"], f["A_indices"], f["A_indptr"]), shape=shape),
+                b=f["b"],
+                P=P,
+                offset=float(f["offset"]),
+                sense=str(f["sense"]),
+                zero=int(f["zero"]),
+                nonneg=int(f["nonneg"]),
+                soc=tuple(int(d) for d in f["soc"]),
+                exp=int(f["exp"]),
+                psd=tuple(int(d) for d in f["psd"]),
+                int_idx=f["int_idx"],
+                bool_idx=f["bool_idx"],
+                cvxpy_version=str(f["cvxpy_version"]),
+            )
+
+    # -- MPS -------------------------------------------------------------------
+
+    def write_mps(self, path: str | Path) -> None:
+        """Write free MPS, with a QUADOBJ section if the objective is quadratic."""
+        if "mps" not in self.formats():
+            raise ValueError(f"{self.name}: MPS only holds linear constraints")
+        m = self.A.shape[0]
+        integer = np.zeros(self.num_vars, dtype=bool)
+        integer[self.int_idx] = integer[self.bool_idx] = True
+        binary = np.zeros(self.num_vars, dtype=bool)
+        binary[self.bool_idx] = True
+
+        sign = -1.0 if self.sense == "max" else 1.0  # undo the stored negation
+
+        lines = [f"NAME {self.name.replace('/', '__')}_seed{self.seed}"]
+        lines += ["OBJSENSE", f"    {self.sense.upper()}", "ROWS", " N obj"]
+        lines += [f" {'E' if i < self.zero else 'L'} c{i}" for i in range(m)]
+        lines.append("COLUMNS")
+        in_marker = False
+        for j in range(self.num_vars):
+            if integer[j] != in_marker:
+                kind = "INTORG" if integer[j] else "INTEND"
+                lines.append(f"    MARKER 'MARKER' '{kind}'")
+                in_marker = integer[j]
+            lines.append(f"    x{j} obj {sign * self.c[j]:.17g}")
+            start, stop = self.A.indptr[j], self.A.indptr[j + 1]
+            for i, value in zip(self.A.indices[start:stop], self.A.data[start:stop]):
+                lines.append(f"    x{j} c{i} {value:.17g}")
+        if in_marker:
+            lines.append("    MARKER 'MARKER' 'INTEND'")
+        lines.append("RHS")
+        if self.offset:
+            lines.append(f"    RHS obj {-sign * self.offset:.17g}")
+        lines += [f"    RHS c{i} {v:.17g}" for i, v in enumerate(self.b) if v]
+        lines.append("BOUNDS")
+        lines += [f" {'BV' if binary[j] else 'FR'} BND x{j}" for j in range(self.num_vars)]
+        if self.P is not None:
+            lines.append("QUADOBJ")
+            lower = sp.tril(self.P, format="coo")
+            order = np.lexsort((lower.row, lower.col))
+            lines += [
+                f"    x{j} x{i} {sign * v:.17g}"
+                for i, j, v in zip(lower.row[order], lower.col[order], lower.data[order])
+            ]
+        lines.append("ENDATA")
+        _write_lines(Path(path), lines)
+
+    # -- CBF -------------------------------------------------------------------
+
+    def write_cbf(self, path: str | Path) -> None:
+        """Write the Conic Benchmark Format, version 3."""
+        if "cbf" not in self.formats():
+            raise ValueError(f"{self.name}: CBF has no quadratic objective")
+        scalar_rows = self.zero + self.nonneg + sum(self.soc) + 3 * self.exp
+        # CBF cones are A x + b in K: negate A. Exponential cones are ordered
+        # (z, y, x) there for CVXPY's (x, y, z).
+        order = np.arange(scalar_rows)
+        start = self.zero + self.nonneg + sum(self.soc)
+        for k in range(self.exp):
+            order[start + 3 * k : start + 3 * k + 3] = order[start + 3 * k : start + 3 * k + 3][
+                ::-1
+            ]
+        A = self.A.tocsr()
+        scalar = sp.coo_array(-A[order])
+        cones = []
+        if self.zero:
+            cones.append(f"L= {self.zero}")
+        if self.nonneg:
+            cones.append(f"L+ {self.nonneg}")
+        cones += [f"Q {d}" for d in self.soc]
+        cones += ["EXP 3"] * self.exp
+
+        sign = -1.0 if self.sense == "max" else 1.0  # undo the stored negation
+        lines = [
+            "VER",
+            "3",
+            "",
+            "OBJSENSE",
+            self.sense.upper(),
+            "",
+            "VAR",
+            f"{self.num_vars} 1",
+            f"F {self.num_vars}",
+            "",
+        ]
+        integer = np.union1d(self.int_idx, self.bool_idx)
+        if len(integer):
+            lines += ["INT", str(len(integer)), *map(str, integer), ""]
+        if cones:
+            lines += ["CON", f"{scalar_rows} {len(cones)}", *cones, ""]
+        if self.psd:
+            lines += ["PSDCON", str(len(self.psd)), *map(str, self.psd), ""]
+        objective = [(j, sign * v) for j, v in enumerate(self.c) if v]
+        lines += ["OBJACOORD", str(len(objective)), *(f"{j} {v:.17g}" for j, v in objective), ""]
+        if self.offset:
+            lines += ["OBJBCOORD", f"{sign * self.offset:.17g}", ""]
+        if scalar.nnz:
+            lines += ["ACOORD", str(scalar.nnz)]
+            lines += [f"{i} {j} {v:.17g}" for i, j, v in zip(scalar.row, scalar.col, scalar.data)]
+            lines.append("")
+        b = self.b[order]
+        if b.any():
+            lines += ["BCOORD", str(np.count_nonzero(b))]
+            lines += [f"{i} {v:.17g}" for i, v in enumerate(b) if v]
+            lines.append("")
+        if self.psd:
+            hcoord, dcoord = [], []
+            start = scalar_rows
+            for k, n in enumerate(self.psd):
+                i, j = _svec_entries(n)
+                scale = np.where(i == j, 1.0, 1.0 / _SQRT2)
+                block = sp.coo_array(A[start : start + len(i)])
+                for r, var, v in zip(block.row, block.col, block.data):
+                    hcoord.append(f"{k} {var} {j[r]} {i[r]} {-v * scale[r]:.17g}")
+                for r in np.flatnonzero(self.b[start : start + len(i)]):
+                    dcoord.append(f"{k} {j[r]} {i[r]} {self.b[start + r] * scale[r]:.17g}")
+                start += len(i)
+            lines += ["HCOORD", str(len(hcoord)), *hcoord, ""]
+            if dcoord:
+                lines += ["DCOORD", str(len(dcoord)), *dcoord, ""]
+        _write_lines(Path(path), lines)
+
+    # -- SDPA ------------------------------------------------------------------
+
+    def write_sdpa(self, path: str | Path) -> None:
+        """Write sparse SDPA: minimize c'x s.t. sum_i F_i x_i - F_0 PSD."""
+        if "sdpa" not in self.formats():
+            raise ValueError(f"{self.name}: SDPA holds continuous LPs and SDPs only")
+        m = self.num_vars
+        linear = 2 * self.zero + self.nonneg
+        blocks = ([-linear] if linear else []) + list(self.psd)
+        A = self.A.tocsr()
+        entries = []  # (matrix number, block, row, column, value), 1-based
+
+        def add(rows: sp.csr_array, b: np.ndarray, block: int, positions, scale) -> None:
+            # F_i holds -A[:, i] and F_0 holds -b, since sum_i F_i x_i - F_0 = b - Ax.
+            coo = sp.coo_array(rows)
+            for r, var, v in zip(coo.row, coo.col, coo.data):
+                entries.append((var + 1, block, *positions[r], -v * scale[r]))
+            for r in np.flatnonzero(b):
+                entries.append((0, block, *positions[r], -b[r] * scale[r]))
+
+        block = 1
+        if linear:
+            lp_rows = sp.vstack(
+                [A[: self.zero], -A[: self.zero], A[self.zero : self.zero + self.nonneg]]
+            )
+            lp_b = np.concatenate(
+                [
+                    self.b[: self.zero],
+                    -self.b[: self.zero],
+                    self.b[self.zero : self.zero + self.nonneg],
+                ]
+            )
+            add(
+                sp.csr_array(lp_rows),
+                lp_b,
+                block,
+                [(r + 1, r + 1) for r in range(linear)],
+                np.ones(linear),
+            )
+            block += 1
+        start = self.zero + self.nonneg
+        for n in self.psd:
+            i, j = _svec_entries(n)
+            scale = np.where(i == j, 1.0, 1.0 / _SQRT2)
+            add(
+                A[start : start + len(i)],
+                self.b[start : start + len(i)],
+                block,
+                list(zip(i + 1, j + 1)),
+                scale,
+            )
+            start += len(i)
+            block += 1
+
+        lines = [
+            f'"{self.name} seed {self.seed}, sense {self.sense}, objective offset {self.offset:.17g}'
+        ]
+        lines += [
+            str(m),
+            str(len(blocks)),
+            " ".join(map(str, blocks)),
+            " ".join(f"{v:.17g}" for v in self.c),
+        ]
+        lines += [f"{k} {blk} {r} {c} {v:.17g}" for k, blk, r, c, v in sorted(entries)]
+        _write_lines(Path(path), lines)
+
+
+def _atomic_write(path: Path, write, binary: bool = False) -> None:
+    """Write through a temporary file so readers never see a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "wb" if binary else "w") as f:
+        write(f)
+    os.replace(tmp, path)
+
+
+def _write_lines(path: Path, lines: list[str]) -> None:
+    _atomic_write(path, lambda f: f.write("\n".join(lines) + "\n"))
+
+
+def instance_path(directory: str | Path, problem_name: str, seed: int, fmt: str = "npz") -> Path:
+    """Path of the ``fmt`` file of an instance for the installed CVXPY."""
+    safe_name = problem_name.replace("/", "__")
+    return Path(directory) / f"cvxpy-{cp.__version__}" / safe_name / f"seed{seed}{EXTENSIONS[fmt]}"
+
+
+def export_instance(
+    spec: ProblemSpec,
+    seed: int,
+    directory: str | Path = DEFAULT_INSTANCE_DIR,
+    formats: tuple[str, ...] = FORMATS,
+) -> dict[str, Path]:
+    """Build ``spec`` for ``seed`` once and write it in each of ``formats``.
+
+    Formats that cannot represent the instance are skipped. Returns
+    ``{format: path}`` for the files written.
+    """
+    unknown = set(formats) - set(FORMATS)
+    if unknown:
+        raise ValueError(f"Unknown formats {sorted(unknown)}, expected some of {FORMATS}")
+    instance = ConicInstance.from_problem(spec.func(seed), spec.name, seed)
+    writers = {
+        "npz": instance.save_npz,
+        "mps": instance.write_mps,
+        "cbf": instance.write_cbf,
+        "sdpa": instance.write_sdpa,
+    }
+    paths = {}
+    for fmt in formats:
+        if fmt not in instance.formats():
+            logger.info("%s cannot be written as %s, skipped", spec.name, fmt)
+            continue
+        paths[fmt] = instance_path(directory, spec.name, seed, fmt)
+        writers[fmt](paths[fmt])
+    return paths
+
+
+def load_instance(
+    spec: ProblemSpec, seed: int, directory: str | Path = DEFAULT_INSTANCE_DIR
+) -> cp.Problem:
+    """Standard-form problem of the cached instance, exported on a miss."""
+    path = instance_path(directory, spec.name, seed)
+    if not path.exists():
+        export_instance(spec, seed, directory, formats=("npz",))
+    return ConicInstance.load_npz(path).to_problem()
+
+
+@dataclass(frozen=True)
+class InstanceLoader:
+    """Loads ``spec``'s instances from the instance cache in ``directory``."""
+
+    spec: ProblemSpec
+    directory: str
+
+    def __call__(self, seed: int) -> cp.Problem:
+        return load_instance(self.spec, seed, self.directory)
+
+
+def instance_spec(spec: ProblemSpec, directory: str | Path = DEFAULT_INSTANCE_DIR) -> ProblemSpec:
+    """Return a spec building ``spec``'s problems from the instance cache.
+
+    Its runs are recorded with ``problem_source="instance"``, apart from
+    native runs.
+    """
+    return replace(spec, func=InstanceLoader(spec, str(directory)), source="instance")
@@ -0,0 +1,163 @@
+"""Latency distributions of repeated solves of small problems.
+
+:func:`measure_latency` solves one problem thousands of times in a tight
+loop and records the wall time of every call, the time the solver reports
+for itself ("native") and the difference, CVXPY's overhead, in
+:class:`LatencyHistogram` objects.
+
+The histograms are log-linear like HdrHistogram: values are recorded in
+nanoseconds, exactly below 256 ns and with a relative error below 1/128
+(two significant digits) above, so millions of samples fit in a few hundred
+counters and the tail percentiles stay accurate.
+
+Garbage collection pauses land on whichever call happens to trigger them.
+With ``gc_mode="controlled"`` the collector is disabled while calls are
+timed and run between batches of calls instead, so the histograms show the
+solve path alone; ``"enabled"`` leaves it on to include those pauses.
+"""
+
+from __future__ import annotations
+
+import gc
+import time
+from typing import TYPE_CHECKING, Callable
+
+import numpy as np
+
+from solver_benchmarks.settings import GC_MODES
+
+if TYPE_CHECKING:
+    import cvxpy as cp
+
+# Percentiles reported for every histogram.
+PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+_SUB_BITS = 8  # 256 exact values, then 128 buckets per power of two
+_HALF = 1 << (_SUB_BITS - 1)
+
+
+def _bucket_index(ns: np.ndarray) -> np.ndarray:
+    ns = np.maximum(ns.astype(np.int64), 0)
+    # Bit length of each value: floor(log2(v)) + 1, computed exactly.
+    bits = np.zeros(ns.shape, dtype=np.int64)
+    nonzero = ns > 0
+    bits[nonzero] = np.frexp(ns[nonzero].astype(np.float64))[1]
+    shift = np.maximum(bits - _SUB_BITS, 0)
+    return shift * _HALF + (ns >> shift)
+
+
+def _bucket_value(index: np.ndarray) -> np.ndarray:
+    """Midpoint of each bucket, in nanoseconds."""
+    index = np.asarray(index, dtype=np.int64)
+    shift = np.maximum(index // _HALF - 1, 0)
+    low = (index - shift * _HALF) << shift
+    return low + ((1 << shift) - 1) / 2
+
+
+class LatencyHistogram:
+    """Log-linear histogram of latencies (see the module docstring)."""
+
+    def __init__(self, counts: dict[int, int] | None = None):
+        self.counts: dict[int, int] = dict(counts or {})
+
+    def record(self, seconds) -> None:
+        """Record one latency or an array of latencies, in seconds."""
+        ns = np.round(np.atleast_1d(np.asarray(seconds, dtype=float)) * 1e9)
+        indices, counts = np.unique(_bucket_index(ns), return_counts=True)
+        for i, c in zip(indices.tolist(), counts.tolist()):
+            self.counts[i] = self.counts.get(i, 0) + c
+
+    def merge(self, other: LatencyHistogram) -> None:
+        for i, c in other.counts.items():
+            self.counts[i] = self.counts.get(i, 0) + c
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts.values())
+
+    def _arrays(self) -> tuple[np.ndarray, np.ndarray]:
+        indices = np.array(sorted(self.counts), dtype=np.int64)
+        counts = np.array([self.counts[i] for i in indices.tolist()], dtype=np.int64)
+        return _bucket_value(indices) / 1e9, counts
+
+    def percentile(self, q: float) -> float | None:
+        """Smallest recorded value (in seconds) at or above ``q`` percent of calls."""
+        if not self.counts:
+            return None
+        values, counts = self._arrays()
+        rank = max(int(np.ceil(q / 100 * counts.sum())), 1)
+        return float(values[np.searchsorted(np.cumsum(counts), rank)])
+
+    def summary(self) -> dict:
+        """Count, mean, min, max and :data:`PERCENTILES`, in seconds."""
+        if not self.counts:
+            return {"count": 0}
+        values, counts = self._arrays()
+        summary = {
+            "count": int(counts.sum()),
+            "mean": float((values * counts).sum() / counts.sum()),
+            "min": float(values[0]),
+            "max": float(values[-1]),
+        }
+        for q in PERCENTILES:
+            summary[f"p{q:g}"] = self.percentile(q)
+        return summary
+
+    def to_dict(self) -> dict:
+        indices = sorted(self.counts)
+        return {"index": indices, "count": [self.counts[i] for i in indices]}
+
+    @classmethod
+    def from_dict(cls, d: dict) -> LatencyHistogram:
+        return cls(dict(zip(d["index"], d["count"])))
+
+
+def measure_latency(
+    problem: cp.Problem,
+    solve: Callable[[], None],
+    calls: int = 1000,
+    warmup: int = 100,
+    gc_mode: str = "controlled",
+    batch: int = 100,
+) -> dict[str, LatencyHistogram]:
+    """Time ``calls`` calls of ``solve()`` on ``problem`` after ``warmup`` untimed ones.
+
+    Returns histograms of the wall time per call (``"total"``), the
+    solver's own setup plus solve time (``"native"``) and their difference
+    (``"overhead"``). ``"native"`` and ``"overhead"`` are omitted when the
+    solver does not report its times. With ``gc_mode="controlled"`` the
+    garbage collector runs between batches of ``batch`` calls only.
+    """
+    if gc_mode not in GC_MODES:
+        raise ValueError(f"Unknown gc_mode {gc_mode!r}, expected one of {GC_MODES}")
+    for _ in range(warmup):
+        solve()
+
+    total = np.empty(calls)
+    native = np.full(calls, np.nan)
+    was_enabled = gc.isenabled()
+    if gc_mode == "controlled":
+        gc.collect()
+        gc.disable()
+    try:
+        for i in range(calls):
+            if gc_mode == "controlled" and i and i % batch == 0:
+                gc.collect()
+            t0 = time.perf_counter()
+            solve()
+            total[i] = time.perf_counter() - t0
+            stats = problem.solver_stats
+            if stats is not None and stats.solve_time is not None:
+                native[i] = stats.solve_time + (stats.setup_time or 0.0)
+    finally:
+        if was_enabled:
+            gc.enable()
+
+    histograms = {"total": LatencyHistogram()}
+    histograms["total"].record(total)
+    if not np.isnan(native).any():
+        histograms["native"] = LatencyHistogram()
+        histograms["native"].record(native)
+        histograms["overhead"] = LatencyHistogram()
+        histograms["overhead"].record(np.maximum(total - native, 0.0))
+    return histograms
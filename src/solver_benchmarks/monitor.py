@@ -0,0 +1,143 @@
+"""Lightweight resource monitoring for benchmark runs.
+
+:class:`ResourceMonitor` measures the block it wraps:
+
+- peak resident memory (RSS) of the whole process, which includes the
+  interpreter and everything already loaded. On Linux the kernel's
+  high-water mark is reset on entry and read on exit; elsewhere a
+  background thread samples the RSS every ``interval`` seconds,
+- optionally, the peak memory allocated by Python code, from
+  :mod:`tracemalloc`. Tracing slows down every allocation, so the runner
+  measures it on a separate, untimed solve,
+- user and system CPU time of all threads of the process, so that threads
+  started by native solver code are counted,
+- parallelism: CPU time divided by wall time, about 1 for a single-threaded
+  solve and higher when the solver keeps several cores busy.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+
+from solver_benchmarks.sandbox import rss_bytes
+
+MB = 1024 * 1024
+
+
+def cpu_times() -> tuple[float, float]:
+    """User and system CPU seconds used so far by this process."""
+    try:
+        import resource
+    except ImportError:  # Windows: os.times() has a coarser resolution
+        times = os.times()
+        return times.user, times.system
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime, usage.ru_stime
+
+
+def parallelism(cpu_time: float, wall_time: float) -> float | None:
+    """Average number of busy cores: CPU time over wall time."""
+    return cpu_time / wall_time if wall_time > 0 else None
+
+
+def _reset_peak_rss() -> bool:
+    """Reset the kernel's RSS high-water mark for this process, if supported."""
+    try:
+        Path("/proc/self/clear_refs").write_text("5")
+    except OSError:
+        return False
+    return _peak_rss() is not None
+
+
+def _peak_rss() -> int | None:
+    """The kernel's RSS high-water mark (``VmHWM``) for this process."""
+    try:
+        for line in Path("/proc/self/status").read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) * 1024
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+@dataclass
+class ResourceUsage:
+    wall_time: float = 0.0
+    cpu_user_time: float = 0.0
+    cpu_system_time: float = 0.0
+    peak_rss_mb: float | None = None
+    python_peak_mb: float | None = None  # only when tracing Python allocations
+
+    @property
+    def parallelism(self) -> float | None:
+        return parallelism(self.cpu_user_time + self.cpu_system_time, self.wall_time)
+
+
+class ResourceMonitor:
+    """Context manager measuring the resources used by the enclosed block.
+
+    ``with ResourceMonitor() as usage:`` yields a :class:`ResourceUsage` that
+    is filled in when the block exits. With ``trace_python`` the peak of
+    Python allocations made inside the block is recorded as well.
+    """
+
+    def __init__(self, interval: float = 0.01, trace_python: bool = False):
+        self.interval = interval
+        self.trace_python = trace_python
+
+    def _sample(self) -> None:
+        pid = os.getpid()
+        while not self._stop.wait(self.interval):
+            rss = rss_bytes(pid)
+            if rss is not None:
+                self._peak = max(self._peak or 0, rss)
+
+    def __enter__(self) -> ResourceUsage:
+        self.usage = ResourceUsage()
+        self._high_water_mark = _reset_peak_rss()
+        self._peak = None if self._high_water_mark else rss_bytes(os.getpid())
+        self._stop = threading.Event()
+        self._sampler = None
+        if not self._high_water_mark:
+            self._sampler = threading.Thread(target=self._sample, daemon=True)
+            self._sampler.start()
+
+        self._started_tracing = False
+        if self.trace_python:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+            tracemalloc.reset_peak()
+            self._traced_before = tracemalloc.get_traced_memory()[0]
+
+        self._cpu = cpu_times()
+        self._t0 = time.perf_counter()
+        return self.usage
+
+    def __exit__(self, *exc) -> None:
+        usage = self.usage
+        usage.wall_time = time.perf_counter() - self._t0
+        user, system = cpu_times()
+        usage.cpu_user_time = user - self._cpu[0]
+        usage.cpu_system_time = system - self._cpu[1]
+
+        if self.trace_python:
+            peak = tracemalloc.get_traced_memory()[1]
+            usage.python_peak_mb = max(peak - self._traced_before, 0) / MB
+            if self._started_tracing:
+                tracemalloc.stop()
+
+        if self._sampler is not None:
+            self._stop.set()
+            self._sampler.join()
+            rss = rss_bytes(os.getpid())
+            if rss is not None:
+                self._peak = max(self._peak or 0, rss)
+        else:
+            self._peak = _peak_rss()
+        usage.peak_rss_mb = self._peak / MB if self._peak is not None else None
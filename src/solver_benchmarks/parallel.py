@@ -0,0 +1,158 @@
+"""Process-pool execution of benchmark jobs.
+
+Jobs run in worker processes started with the ``spawn`` method so that each
+worker initializes its own BLAS/OpenMP runtime under the requested thread
+limit. Workers can optionally be pinned to disjoint blocks of CPUs so that
+concurrent runs do not compete for the same cores.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+# Environment variables read by the common OpenMP and BLAS/LAPACK runtimes
+# when they size their thread pools.
+THREAD_ENV_VARS = (
+    "OMP_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "BLIS_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+)
+
+
+def available_cpus() -> list[int]:
+    """Return the CPU ids this process is allowed to run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def default_threads_per_job(jobs: int) -> int:
+    """Split the available CPUs evenly between ``jobs`` workers."""
+    return max(1, len(available_cpus()) // max(1, jobs))
+
+
+def thread_limit_env(threads: int) -> dict[str, str]:
+    """Environment variables limiting native thread pools to ``threads``."""
+    return {var: str(threads) for var in THREAD_ENV_VARS}
+
+
+def cpu_slots(
+    jobs: int,
+    threads: int,
+    cpus: list[int] | None = None,
+) -> list[list[int]]:
+    """Partition CPUs into one disjoint block of ``threads`` CPUs per worker.
+
+    If there are fewer CPUs than ``jobs * threads`` the blocks wrap around and
+    some CPUs are shared between workers.
+    """
+    if cpus is None:
+        cpus = available_cpus()
+    if jobs * threads > len(cpus):
+        logger.warning(
+            "Requested %d jobs x %d threads but only %d CPUs are available; "
+            "pinned workers will share CPUs",
+            jobs,
+            threads,
+            len(cpus),
+        )
+    return [
+        [cpus[(i * threads + k) % len(cpus)] for k in range(threads)]
+        for i in range(jobs)
+    ]
+
+
+@contextmanager
+def _environ(overrides: dict[str, str]):
+    """Temporarily set environment variables inherited by spawned workers."""
+    saved = {k: os.environ.get(k) for k in overrides}
+    os.environ.update(overrides)
+    try:
+        yield
+    finally:
+        for k, v in saved.items():
+            if v is None:
+                os.environ.pop(k, None)
+            else:
+                os.environ[k] = v
+
+
+def _init_worker(slot_queue) -> None:
+    if slot_queue is None:
+        return
+    cpus = slot_queue.get()
+    if hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, cpus)
+    else:
+        logger.warning("CPU pinning is not supported on this platform")
+
+
+def map_as_completed(
+    func: Callable,
+    args: Iterable[tuple],
+    jobs: int = 1,
+    threads_per_job: int | None = None,
+    pin_cpus: bool = False,
+    submit_order: Iterable[int] | None = None,
+) -> Iterator[tuple[int, object]]:
+    """Run ``func(*a)`` for each ``a`` in ``args`` on a process pool.
+
+    Yields ``(index, result)`` pairs, ``index`` being the position in
+    ``args``, as soon as each run finishes, so the caller can save every
+    result before the slower runs are done. ``submit_order`` lists the
+    indices of ``args`` in the order they are handed to idle workers
+    (default: in order). ``func`` and its arguments must be picklable.
+
+    If the caller is interrupted (e.g. by Ctrl-C) or stops iterating, the
+    workers are killed, abandoning the runs in progress.
+    """
+    args = list(args)
+    submit_order = list(range(len(args)) if submit_order is None else submit_order)
+    jobs = max(1, min(jobs, len(args) or 1))
+    if threads_per_job is None:
+        threads_per_job = default_threads_per_job(jobs)
+
+    ctx = multiprocessing.get_context("spawn")
+    slot_queue = None
+    if pin_cpus:
+        slot_queue = ctx.Queue()
+        for slot in cpu_slots(jobs, threads_per_job):
+            slot_queue.put(slot)
+
+    with _environ(thread_limit_env(threads_per_job)):
+        # Not a context manager: leaving one waits for the runs in progress,
+        # which on Ctrl-C could mean hours.
+        executor = ProcessPoolExecutor(
+            max_workers=jobs,
+            mp_context=ctx,
+            initializer=_init_worker,
+            initargs=(slot_queue,),
+        )
+        try:
+            futures = {executor.submit(func, *args[i]): i for i in submit_order}
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        except BaseException:
+            _terminate(executor)
+            raise
+        executor.shutdown()
+
+
+def _terminate(executor: ProcessPoolExecutor) -> None:
+    """Cancel pending runs and kill the workers without waiting for them."""
+    workers = list((executor._processes or {}).values())
+    executor.shutdown(wait=False, cancel_futures=True)
+    for process in workers:
+        process.terminate()
+    for process in workers:
+        process.join()
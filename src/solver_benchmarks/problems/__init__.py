@@ -1,11 +1,55 @@
+"""Problem registry.
+
+Problem modules in this package register factories with
+:func:`register_problem`. Importing them all pulls in CVXPY, NumPy and the
+data loaders, so the registry is first filled from ``manifest.json``: specs
+whose factories import their module on the first call. Listing and
+filtering problems then imports no problem module. The manifest also
+holds size hints, the size metrics of each problem's default instance, so
+that run costs can be estimated without building problems. It records a
+hash of each module's source and is ignored, falling back to importing the
+modules, when a module changed since it was written; regenerate it with
+``scripts/make_manifest.py`` after adding or editing a problem.
+"""
+
 from __future__ import annotations
 
+import hashlib
 import importlib
+import json
+import logging
 import pkgutil
-from dataclasses import dataclass, field
-from typing import Callable
+from dataclasses import dataclass, field, replace
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    import cvxpy as cp
+    import numpy as np
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_PATH = Path(__file__).with_name("manifest.json")
+
+# Size metrics recorded in the manifest for each problem's seed-0 instance.
+SIZE_HINTS = ("num_scalar_variables", "num_scalar_eq_constr", "num_scalar_leq_constr")
+
+# A parameterized problem and a function drawing new parameter values.
+ParametricProblem = tuple["cp.Problem", Callable[["np.random.Generator"], None]]
+
+
+@dataclass(frozen=True)
+class LazyFactory:
+    """Calls ``module.attribute``, importing ``module`` on the first call."""
+
+    module: str
+    attribute: str
+
+    def __call__(self, *args, **kwargs):
+        func = getattr(importlib.import_module(self.module), self.attribute)
+        return func(*args, **kwargs)
 
-import cvxpy as cp
 
 @dataclass
 class ProblemSpec:
@@ -13,6 +57,33 @@ class ProblemSpec:
     func: Callable[[int], cp.Problem]
     tags: list[str] = field(default_factory=list)
     description: str = ""
+    # Scaling: the factory's size keyword, the sizes a sweep tries in order,
+    # and the size this spec builds (None for the factory default).
+    size_param: str | None = None
+    sizes: tuple[int, ...] = ()
+    size: int | None = None
+    # Re-solve mode: builds a DPP version of the problem (see register_parametric).
+    parametric: Callable[[int], ParametricProblem] | None = None
+    # SIZE_HINTS of the default-size instance, from the manifest (None if unknown).
+    size_hints: dict[str, int] | None = None
+    # "native" (built by func's factory) or "instance" (see solver_benchmarks.export).
+    source: str = "native"
+
+    def scaled(self, size: int) -> ProblemSpec:
+        """Return a spec building this problem with ``size_param=size``.
+
+        The scaled problem is named ``"<name>@<size_param>=<size>"`` so that
+        its runs are kept apart from the default-size ones.
+        """
+        if self.size_param is None:
+            raise ValueError(f"{self.name} has no size parameter")
+        return replace(
+            self,
+            name=f"{self.name}@{self.size_param}={size}",
+            func=partial(self.func, **{self.size_param: size}),
+            size=size,
+            size_hints=None,
+        )
 
 
 _REGISTRY: dict[str, ProblemSpec] = {}
@@ -23,11 +94,15 @@ def register_problem(
     name: str,
     tags: list[str] | None = None,
     description: str = "",
+    size_param: str | None = None,
+    sizes: tuple[int, ...] = (),
 ):
     """Decorator to register a problem factory function.
 
     The decorated function must accept a single `seed` argument and return
-    a ``cp.Problem``.
+    a ``cp.Problem``. Problems that can be built at other sizes name the
+    keyword argument controlling the size in ``size_param`` and list the
+    sizes a scaling sweep tries, smallest first, in ``sizes``.
     """
 
     def decorator(func: Callable[[int], cp.Problem]) -> Callable[[int], cp.Problem]:
@@ -36,21 +111,154 @@ def register_problem(
             func=func,
             tags=tags or [],
             description=description,
+            size_param=size_param,
+            sizes=tuple(sizes),
         )
+        if name in _REGISTRY:  # loaded from the manifest, keep its size hints
+            spec.size_hints = _REGISTRY[name].size_hints
         _REGISTRY[name] = spec
         return func
 
     return decorator
 
 
+def register_parametric(name: str):
+    """Decorator to register the parameterized version of problem ``name``.
+
+    The decorated function takes a ``seed`` and returns ``(problem,
+    update)``: the problem built from ``cp.Parameter`` objects so that it is
+    DPP, and ``update(rng)``, which draws new values for the parameters as
+    a production loop would receive new data. Register it after the problem
+    itself.
+    """
+
+    def decorator(
+        func: Callable[[int], ParametricProblem],
+    ) -> Callable[[int], ParametricProblem]:
+        _REGISTRY[name].parametric = func
+        return func
+
+    return decorator
+
+
+def _modules() -> list[str]:
+    return sorted(
+        info.name for info in pkgutil.walk_packages(__path__, prefix=__name__ + ".")
+    )
+
+
+def _source_hashes(modules) -> dict[str, str]:
+    hashes = {}
+    for module in modules:
+        path = Path(__path__[0], *module.split(".")[2:]).with_suffix(".py")
+        hashes[module] = hashlib.sha256(path.read_bytes()).hexdigest()
+    return hashes
+
+
+def _import_all():
+    # Import all sub-modules of this package so decorators execute.
+    for module in _modules():
+        importlib.import_module(module)
+
+
+def _measure_size(spec: ProblemSpec) -> dict[str, int] | None:
+    try:
+        metrics = spec.func(0).size_metrics
+    except Exception as exc:  # e.g. a dataset that cannot be downloaded
+        logger.warning("No size hints for %s: %s", spec.name, exc)
+        return None
+    return {name: int(getattr(metrics, name)) for name in SIZE_HINTS}
+
+
+def build_manifest(size_hints: bool = True) -> dict:
+    """Import every problem module and describe the registered problems.
+
+    With ``size_hints`` every problem is also built (seed 0) to record its
+    :data:`SIZE_HINTS`; problems that fail to build get ``None``.
+    """
+    _import_all()
+    problems = []
+    for spec in sorted(_REGISTRY.values(), key=lambda s: s.name):
+        if isinstance(spec.func, LazyFactory):
+            continue  # loaded from an earlier manifest, no module registers it
+        problems.append(
+            {
+                "name": spec.name,
+                "tags": list(spec.tags),
+                "description": spec.description,
+                "module": spec.func.__module__,
+                "factory": spec.func.__name__,
+                "parametric": spec.parametric.__name__ if spec.parametric else None,
+                "size_param": spec.size_param,
+                "sizes": list(spec.sizes),
+            }
+        )
+        if size_hints:
+            problems[-1]["size_hints"] = _measure_size(spec)
+    return {"sources": _source_hashes(_modules()), "problems": problems}
+
+
+def write_manifest(path: str | Path = MANIFEST_PATH) -> Path:
+    """Write :func:`build_manifest` to ``path`` as JSON.
+
+    Problems that cannot be built here keep the size hints of the manifest
+    being replaced.
+    """
+    path = Path(path)
+    manifest = build_manifest()
+    try:
+        entries = json.loads(path.read_text())["problems"]
+        previous = {entry["name"]: entry.get("size_hints") for entry in entries}
+    except (OSError, ValueError, KeyError):
+        previous = {}
+    for entry in manifest["problems"]:
+        if entry["size_hints"] is None:
+            entry["size_hints"] = previous.get(entry["name"])
+    path.write_text(json.dumps(manifest, indent=2) + "\n")
+    return path
+
+
+def _load_manifest(path: Path = MANIFEST_PATH) -> list[ProblemSpec] | None:
+    """Lazy specs from the manifest, or None if it is missing or stale."""
+    try:
+        manifest = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+    if manifest.get("sources") != _source_hashes(_modules()):
+        logger.info("Problem manifest %s is stale, importing problem modules", path)
+        return None
+    return [
+        ProblemSpec(
+            name=entry["name"],
+            func=LazyFactory(entry["module"], entry["factory"]),
+            tags=entry["tags"],
+            description=entry["description"],
+            size_param=entry["size_param"],
+            sizes=tuple(entry["sizes"]),
+            parametric=(
+                LazyFactory(entry["module"], entry["parametric"])
+                if entry["parametric"]
+                else None
+            ),
+            size_hints=entry.get("size_hints"),
+        )
+        for entry in manifest["problems"]
+    ]
+
+
 def _discover():
     global _discovered
     if _discovered:
         return
-    # Import all sub-modules of this package so decorators execute.
-    package = importlib.import_module(__name__)
-    for info in pkgutil.walk_packages(package.__path__, prefix=package.__name__ + "."):
-        importlib.import_module(info.name)
+    specs = _load_manifest()
+    if specs is None:
+        _import_all()
+    else:
+        for spec in specs:
+            # Modules imported already registered their real factories.
+            registered = _REGISTRY.setdefault(spec.name, spec)
+            if registered.size_hints is None:
+                registered.size_hints = spec.size_hints
     _discovered = True
 
 
@@ -64,7 +272,17 @@ def list_problems(tag: str | None = None) -> list[ProblemSpec]:
 
 
 def get_problem(name: str) -> ProblemSpec:
-    """Look up a problem by name."""
+    """Look up a problem by name.
+
+    ``"<name>@<size_param>=<size>"`` returns the problem scaled to ``size``.
+    """
     _discover()
-    return _REGISTRY[name]
+    base, _, scale = name.partition("@")
+    if not scale:
+        return _REGISTRY[name]
+    spec = _REGISTRY[base]
+    param, _, size = scale.partition("=")
+    if param != spec.size_param or not size.isdigit():
+        raise KeyError(name)
+    return spec.scaled(int(size))
 
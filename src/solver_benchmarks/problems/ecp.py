@@ -6,7 +6,7 @@ import cvxpy as cp
 import numpy as np
 
 from solver_benchmarks.problems import register_problem
-from solver_benchmarks.data.bikeshare import load_bikeshare_data, get_bikeshare_features
+from solver_benchmarks.data.bikeshare import load_bikeshare_data, load_bikeshare_features
 
 
 @register_problem(
@@ -16,7 +16,7 @@ from solver_benchmarks.data.bikeshare import load_bikeshare_data, get_bikeshare_
 )
 def logistic_bikeshare(seed: int = 0) -> cp.Problem:
     df_bikeshare = load_bikeshare_data()
-    A_sparse, A_dense = get_bikeshare_features(df_bikeshare)
+    A_sparse, A_dense = load_bikeshare_features()
     y = (df_bikeshare["Member type"] == "Member").to_numpy().astype(float)
 
     m, n_sparse = A_sparse.shape
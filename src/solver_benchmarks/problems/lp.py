@@ -22,10 +22,16 @@ def diet_small(seed: int = 0) -> cp.Problem:
     return cp.Problem(cp.Minimize(costs @ x), constraints)
 
 
-@register_problem("lp/transportation_medium", tags=["lp", "medium"], description="Transportation problem (50 sources, 100 sinks)")
-def transportation_medium(seed: int = 0) -> cp.Problem:
+@register_problem(
+    "lp/transportation_medium",
+    tags=["lp", "medium"],
+    description="Transportation problem (50 sources, 100 sinks)",
+    size_param="n",
+    sizes=(25, 50, 100, 200, 400, 800, 1600),
+)
+def transportation_medium(seed: int = 0, n: int = 100) -> cp.Problem:
     rng = np.random.default_rng(seed)
-    m, n = 50, 100
+    m = n // 2
     costs = rng.uniform(1, 20, size=(m, n))
     supply = rng.uniform(10, 50, size=m)
     demand = rng.uniform(1, 10, size=n)
@@ -40,10 +46,16 @@ def transportation_medium(seed: int = 0) -> cp.Problem:
     return cp.Problem(cp.Minimize(cp.sum(cp.multiply(costs, X))), constraints)
 
 
-@register_problem("lp/basis_pursuit_large", tags=["lp", "large"], description="Basis pursuit via LP (m=200, n=1000)")
-def basis_pursuit_large(seed: int = 0) -> cp.Problem:
+@register_problem(
+    "lp/basis_pursuit_large",
+    tags=["lp", "large"],
+    description="Basis pursuit via LP (m=200, n=1000)",
+    size_param="n",
+    sizes=(250, 500, 1000, 2000, 4000, 8000, 16000),
+)
+def basis_pursuit_large(seed: int = 0, n: int = 1000) -> cp.Problem:
     rng = np.random.default_rng(seed)
-    m, n = 200, 1000
+    m = n // 5
     A = rng.standard_normal((m, n))
     x_true = rng.standard_normal(n)
     x_true[rng.random(n) > 0.1] = 0  # ~90% sparse
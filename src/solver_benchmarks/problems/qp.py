@@ -5,18 +5,19 @@ from __future__ import annotations
 import cvxpy as cp
 import numpy as np
 
-from solver_benchmarks.problems import register_problem
-from solver_benchmarks.data.bikeshare import load_bikeshare_data, get_bikeshare_features
+from solver_benchmarks.problems import ParametricProblem, register_parametric, register_problem
+from solver_benchmarks.data.bikeshare import load_bikeshare_data, load_bikeshare_features
 
 
 @register_problem(
     "qp/portfolio_small",
     tags=["qp", "small"],
     description="Small portfolio optimization (50 assets)",
+    size_param="n",
+    sizes=(50, 100, 200, 400, 800, 1600, 3200, 6400),
 )
-def portfolio_small(seed: int = 0) -> cp.Problem:
+def portfolio_small(seed: int = 0, n: int = 50) -> cp.Problem:
     rng = np.random.default_rng(seed)
-    n = 50
     mu = rng.standard_normal(n) * 0.05
     F = rng.standard_normal((n, 10)) * 0.1
     Sigma_sqrt = F
@@ -49,14 +50,45 @@ def portfolio_medium(seed: int = 0) -> cp.Problem:
     return cp.Problem(cp.Minimize(-ret + gamma * risk), constraints)
 
 
+def _portfolio_parametric(seed: int, n: int, factors: int) -> ParametricProblem:
+    """Portfolio problem with the expected returns ``mu`` as a parameter."""
+    rng = np.random.default_rng(seed)
+    mu = cp.Parameter(n, value=rng.standard_normal(n) * 0.05)
+    F = rng.standard_normal((n, factors)) * 0.1
+    gamma = 1.0
+
+    x = cp.Variable(n)
+    risk = cp.sum_squares(F.T @ x)
+    constraints = [cp.sum(x) == 1, x >= 0]
+    problem = cp.Problem(cp.Minimize(-mu @ x + gamma * risk), constraints)
+
+    def update(rng: np.random.Generator) -> None:
+        # Return estimates drift a little between re-solves.
+        mu.value = mu.value + rng.standard_normal(n) * 0.005
+
+    return problem, update
+
+
+@register_parametric("qp/portfolio_small")
+def portfolio_small_parametric(seed: int = 0) -> ParametricProblem:
+    return _portfolio_parametric(seed, n=50, factors=10)
+
+
+@register_parametric("qp/portfolio_medium")
+def portfolio_medium_parametric(seed: int = 0) -> ParametricProblem:
+    return _portfolio_parametric(seed, n=500, factors=30)
+
+
 @register_problem(
     "qp/lasso_medium",
     tags=["qp", "medium"],
     description="Lasso regression (m=200, n=500)",
+    size_param="n",
+    sizes=(125, 250, 500, 1000, 2000, 4000, 8000),
 )
-def lasso_medium(seed: int = 0) -> cp.Problem:
+def lasso_medium(seed: int = 0, n: int = 500) -> cp.Problem:
     rng = np.random.default_rng(seed)
-    m, n = 200, 500
+    m = 2 * n // 5
     A = rng.standard_normal((m, n))
     b = rng.standard_normal(m)
     lam = 0.1
@@ -65,6 +97,24 @@ def lasso_medium(seed: int = 0) -> cp.Problem:
     return cp.Problem(cp.Minimize(cp.sum_squares(A @ x - b) + lam * cp.norm1(x)))
 
 
+@register_parametric("qp/lasso_medium")
+def lasso_medium_parametric(seed: int = 0) -> ParametricProblem:
+    rng = np.random.default_rng(seed)
+    m, n = 200, 500
+    A = rng.standard_normal((m, n))
+    b = cp.Parameter(m, value=rng.standard_normal(m))
+    lam = 0.1
+
+    x = cp.Variable(n)
+    problem = cp.Problem(cp.Minimize(cp.sum_squares(A @ x - b) + lam * cp.norm1(x)))
+
+    def update(rng: np.random.Generator) -> None:
+        # New observations arrive for the same design matrix.
+        b.value = b.value + rng.standard_normal(m) * 0.1
+
+    return problem, update
+
+
 @register_problem(
     "qp/lasso_bikeshare",
     tags=["qp", "large", "bikeshare"],
@@ -72,7 +122,7 @@ def lasso_medium(seed: int = 0) -> cp.Problem:
 )
 def lasso_bikeshare(seed: int = 0) -> cp.Problem:
     df_bikeshare = load_bikeshare_data()
-    A_sparse, A_dense = get_bikeshare_features(df_bikeshare)
+    A_sparse, A_dense = load_bikeshare_features()
     b = np.log(df_bikeshare["Duration"].to_numpy())
 
     m, n_sparse = A_sparse.shape
@@ -95,7 +145,7 @@ def lasso_bikeshare(seed: int = 0) -> cp.Problem:
 )
 def ridge_bikeshare(seed: int = 0) -> cp.Problem:
     df_bikeshare = load_bikeshare_data()
-    A_sparse, A_dense = get_bikeshare_features(df_bikeshare)
+    A_sparse, A_dense = load_bikeshare_features()
     b = np.log(df_bikeshare["Duration"].to_numpy())
 
     m, n_sparse = A_sparse.shape
@@ -118,7 +168,7 @@ def ridge_bikeshare(seed: int = 0) -> cp.Problem:
 )
 def elastic_net_bikeshare(seed: int = 0) -> cp.Problem:
     df_bikeshare = load_bikeshare_data()
-    A_sparse, A_dense = get_bikeshare_features(df_bikeshare)
+    A_sparse, A_dense = load_bikeshare_features()
     b = np.log(df_bikeshare["Duration"].to_numpy())
 
     m, n_sparse = A_sparse.shape
@@ -12,10 +12,11 @@ from solver_benchmarks.problems import register_problem
     "sdp/max_cut_small",
     tags=["sdp", "small"],
     description="Max-cut SDP relaxation (20 nodes)",
+    size_param="n",
+    sizes=(10, 20, 40, 80, 160, 320),
 )
-def max_cut_small(seed: int = 0) -> cp.Problem:
+def max_cut_small(seed: int = 0, n: int = 20) -> cp.Problem:
     rng = np.random.default_rng(seed)
-    n = 20
     # Random graph adjacency (symmetric, no self-loops)
     W = rng.uniform(0, 1, size=(n, n))
     W = (W + W.T) / 2
@@ -55,9 +56,10 @@ def matrix_completion(seed: int = 0) -> cp.Problem:
     "sdp/knockoff_ar_model",
     tags=["sdp", "medium"],
     description="Knockoff filter AR(1) model (n=100, rho=0.5)",
+    size_param="n",
+    sizes=(25, 50, 100, 200, 400, 800),
 )
-def knockoff_ar_model_medium(seed: int = 0) -> cp.Problem:
-    n = 100
+def knockoff_ar_model_medium(seed: int = 0, n: int = 100) -> cp.Problem:
     rho = 0.5
     Sigma = rho ** (np.abs(np.arange(n) - np.arange(n)[:, None]))
 
@@ -71,9 +73,10 @@ def knockoff_ar_model_medium(seed: int = 0) -> cp.Problem:
     "sdp/knockoff_equi",
     tags=["sdp", "medium"],
     description="Knockoff filter equi correlated model (n=100, rho = 0.9)",
+    size_param="n",
+    sizes=(25, 50, 100, 200, 400, 800),
 )
-def knockoff_equi(seed: int = 0) -> cp.Problem:
-    n = 100
+def knockoff_equi(seed: int = 0, n: int = 100) -> cp.Problem:
     rho = 0.9
 
     Sigma = rho * np.ones((n, n)) + (1 - rho) * np.eye(n)
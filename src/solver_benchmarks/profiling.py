@@ -0,0 +1,161 @@
+"""Phase-level timing and optional profiler output for benchmark runs.
+
+A run is split into the phases in :data:`PHASES`:
+
+- ``construction``: building the problem (``spec.func(seed)``, or fetching
+  it from the problem cache),
+- ``classification`` and ``size_metrics``: ``classify_problem`` and
+  ``problem.size_metrics``,
+- ``canonicalization``: CVXPY's ``compilation_time``, i.e. the reduction
+  chain including the solver's own data formatting,
+- ``solver_setup`` and ``solver_solve``: the setup and solve times reported
+  by the solver itself,
+- ``solver_interface``: the rest of CVXPY's call into the solver (the whole
+  call when the solver does not report its own times),
+- ``retrieval``: unpacking the solution into the problem's variables,
+- ``solve_overhead``: whatever else ``problem.solve()`` spent.
+
+:class:`PhaseTimer` records them and passes each one to its hooks, plain
+callables ``hook(phase, seconds)``.
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator
+
+if TYPE_CHECKING:
+    import cvxpy as cp
+
+PHASES = (
+    "construction",
+    "classification",
+    "size_metrics",
+    "canonicalization",
+    "solver_setup",
+    "solver_solve",
+    "solver_interface",
+    "retrieval",
+    "solve_overhead",
+)
+
+# Supported profilers and the suffix of the files they write.
+PROFILERS = {"cprofile": ".prof", "pyinstrument": ".html"}
+
+PhaseHook = Callable[[str, float], None]
+
+
+def ordered_phases(phases: dict[str, float]) -> dict[str, float]:
+    """Return ``phases`` in :data:`PHASES` order, unknown phases last."""
+    rank = {p: i for i, p in enumerate(PHASES)}
+    return dict(sorted(phases.items(), key=lambda kv: rank.get(kv[0], len(rank))))
+
+
+class PhaseTimer:
+    """Accumulate wall time per phase and report each phase to ``hooks``."""
+
+    def __init__(self, hooks: Iterable[PhaseHook] = ()):
+        self.hooks = list(hooks)
+        self.phases: dict[str, float] = {}
+
+    def add(self, phase: str, seconds: float) -> None:
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+        for hook in self.hooks:
+            hook(phase, seconds)
+
+    @contextmanager
+    def phase(self, phase: str) -> Iterator[None]:
+        """Time the enclosed block as ``phase``."""
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(phase, time.perf_counter() - t0)
+
+
+def timed_solve(problem: cp.Problem, timer: PhaseTimer, **solve_kwargs) -> float:
+    """Call ``problem.solve(**solve_kwargs)`` and record its phases.
+
+    Returns the wall time of the call. Solution retrieval is timed by
+    wrapping ``unpack_results`` on this problem instance only; the other
+    phases come from the timings CVXPY and the solver record. Nothing is
+    recorded if the solve raises.
+    """
+    unpack_results = problem.unpack_results
+    retrieval = 0.0
+
+    def timed_unpack(*args, **kwargs):
+        nonlocal retrieval
+        t0 = time.perf_counter()
+        try:
+            return unpack_results(*args, **kwargs)
+        finally:
+            retrieval += time.perf_counter() - t0
+
+    problem.unpack_results = timed_unpack
+    t0 = time.perf_counter()
+    try:
+        problem.solve(**solve_kwargs)
+    finally:
+        total = time.perf_counter() - t0
+        del problem.unpack_results
+
+    canonicalization = problem.compilation_time or 0.0
+    solver_call = getattr(problem, "_solve_time", None) or 0.0
+    stats = problem.solver_stats
+    native = 0.0
+    timer.add("canonicalization", canonicalization)
+    if stats is not None and stats.solve_time is not None:
+        if stats.setup_time is not None:
+            timer.add("solver_setup", stats.setup_time)
+            native += stats.setup_time
+        timer.add("solver_solve", stats.solve_time)
+        native += stats.solve_time
+    timer.add("solver_interface", max(solver_call - native, 0.0))
+    timer.add("retrieval", retrieval)
+    timer.add(
+        "solve_overhead", max(total - canonicalization - solver_call - retrieval, 0.0)
+    )
+    return total
+
+
+@contextmanager
+def profiled(profiler: str, path: str | Path) -> Iterator[None]:
+    """Profile the enclosed block with ``profiler`` and write its output to ``path``.
+
+    ``"cprofile"`` writes ``pstats`` data (open with ``python -m pstats`` or
+    snakeviz); ``"pyinstrument"`` writes an HTML report and needs the
+    ``profile`` extra.
+    """
+    if profiler not in PROFILERS:
+        raise ValueError(f"Unknown profiler {profiler!r}, expected one of {list(PROFILERS)}")
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    if profiler == "cprofile":
+        import cProfile
+
+        prof = cProfile.Profile()
+        prof.enable()
+        try:
+            yield
+        finally:
+            prof.disable()
+            prof.dump_stats(path)
+        return
+
+    try:
+        from pyinstrument import Profiler
+    except ImportError as exc:
+        raise ImportError(
+            "The pyinstrument profiler requires pyinstrument: uv sync --extra profile"
+        ) from exc
+    prof = Profiler()
+    prof.start()
+    try:
+        yield
+    finally:
+        prof.stop()
+        path.write_text(prof.output_html())
@@ -0,0 +1,198 @@
+"""Quality of the solutions returned by benchmark runs.
+
+A fast solve is only a win if the answer is accurate, so each run records:
+
+- ``primal_residual``: the largest constraint violation at the returned
+  point, from CVXPY's ``Constraint.violation``,
+- ``dual_residual``: the norm of the gradient of the Lagrangian built from
+  the returned dual values, following the convention of CVXPY's own KKT
+  checks. Objectives with nondifferentiable terms (norms, absolute values)
+  use CVXPY's choice of subgradient, so the residual is an upper bound there.
+  None when a constraint has no dual value (mixed-integer problems),
+- ``objective_gap``: the relative difference ``|f - f*| / max(1, |f*|)`` to a
+  high-accuracy reference objective ``f*`` for the same problem and seed,
+  from the references file written by ``scripts/make_references.py``.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from solver_benchmarks.settings import DEFAULT_REFERENCES
+
+if TYPE_CHECKING:
+    import cvxpy as cp
+
+logger = logging.getLogger(__name__)
+
+# Settings for reference solves: Clarabel at tight tolerances by default,
+# HiGHS with a tight gap for integer problems, and SCS for problems where
+# Clarabel stalls short of the tolerances.
+REFERENCE_SOLVERS = {
+    "CLARABEL": {
+        "tol_gap_abs": 1e-9,
+        "tol_gap_rel": 1e-9,
+        "tol_feas": 1e-9,
+        "max_iter": 500,
+    },
+    "HIGHS": {
+        "mip_rel_gap": 1e-9,
+        "primal_feasibility_tolerance": 1e-9,
+        "dual_feasibility_tolerance": 1e-9,
+    },
+    "SCS": {"eps_abs": 1e-9, "eps_rel": 1e-9, "max_iters": 200_000},
+}
+
+# Fields of BenchmarkResult filled in by :func:`solution_quality`.
+QUALITY_METRICS = ("primal_residual", "dual_residual", "objective_gap")
+
+
+def primal_residual(problem: cp.Problem) -> float | None:
+    """Largest constraint violation at the current point, None without one."""
+    if any(v.value is None for v in problem.variables()):
+        return None
+    violation = 0.0
+    for constraint in problem.constraints:
+        try:
+            value = np.max(constraint.violation())
+        except (ValueError, NotImplementedError):
+            return None
+        violation = max(violation, float(value))
+    return violation
+
+
+def dual_residual(problem: cp.Problem) -> float | None:
+    """Norm of the Lagrangian's gradient at the current primal and dual point.
+
+    For each variable without attributes the root mean square of its
+    gradient is used; for nonnegative and nonpositive variables, of the part
+    of the gradient outside the dual cone. Returns the largest over
+    variables, or None if it cannot be computed.
+    """
+    import cvxpy as cp
+
+    if any(v.value is None for v in problem.variables()):
+        return None
+    objective = problem.objective
+    lagrangian = objective.expr if isinstance(objective, cp.Minimize) else -objective.expr
+    for constraint in problem.constraints:
+        dual = constraint.dual_value
+        if dual is None:
+            return None
+        if isinstance(constraint, (cp.constraints.Inequality, cp.constraints.Equality)):
+            lagrangian = lagrangian + cp.vdot(dual, constraint.expr)
+        elif isinstance(
+            constraint,
+            (
+                cp.constraints.Zero,
+                cp.constraints.NonNeg,
+                cp.constraints.SOC,
+                cp.constraints.PSD,
+                cp.constraints.ExpCone,
+            ),
+        ):
+            lagrangian = lagrangian - cp.vdot(constraint.args, dual)
+        else:
+            return None
+    try:
+        gradient = lagrangian.grad
+    except (TypeError, ValueError):
+        return None
+
+    residual = 0.0
+    for variable, g in gradient.items():
+        if g is None:
+            return None
+        g = np.asarray(g.todense() if hasattr(g, "todense") else g).ravel()
+        if variable.attributes["nonneg"]:
+            g = np.minimum(g, 0.0)
+        elif variable.attributes["nonpos"]:
+            g = np.maximum(g, 0.0)
+        elif any(variable.attributes.values()):
+            continue  # other implicit constraints (PSD, integer, ...) are not checked
+        residual = max(residual, float(np.linalg.norm(g) / np.sqrt(g.size)))
+    return residual
+
+
+@lru_cache(maxsize=None)
+def _read_references(path: str) -> dict:
+    try:
+        return json.loads(Path(path).read_text())
+    except FileNotFoundError:
+        logger.warning("References file %s not found: objective gaps are not recorded", path)
+        return {}
+
+
+def load_references(path: str | Path = DEFAULT_REFERENCES) -> dict:
+    """Reference objectives as ``{problem: {seed: {"objective", ...}}}``.
+
+    Returns ``{}``, with a warning, if the file does not exist. Read once
+    per path.
+    """
+    return _read_references(str(path))
+
+
+def reference_objective(references: dict, problem_name: str, seed: int | None) -> float | None:
+    entry = references.get(problem_name, {}).get(str(seed))
+    return entry["objective"] if entry else None
+
+
+def compute_reference(problem: cp.Problem, solver: str | None = None) -> dict:
+    """Solve ``problem`` to high accuracy and describe the reference.
+
+    Integer problems default to HiGHS, others to Clarabel, with the
+    settings in :data:`REFERENCE_SOLVERS`.
+    """
+    import cvxpy as cp
+
+    if solver is None:
+        solver = "HIGHS" if problem.is_mixed_integer() else "CLARABEL"
+    problem.solve(solver=solver, **REFERENCE_SOLVERS.get(solver, {}))
+    return {
+        "objective": problem.value,
+        "status": problem.status,
+        "solver": solver,
+        "primal_residual": primal_residual(problem),
+        "cvxpy_version": cp.__version__,
+    }
+
+
+def save_references(references: dict, path: str | Path = DEFAULT_REFERENCES) -> None:
+    """Write ``references`` to ``path``, sorted for readable diffs."""
+    Path(path).write_text(json.dumps(references, indent=2, sort_keys=True) + "\n")
+    _read_references.cache_clear()
+
+
+def objective_gap(value: float | None, reference: float | None) -> float | None:
+    """Relative gap ``|value - reference| / max(1, |reference|)``."""
+    if value is None or reference is None or not np.isfinite(value):
+        return None
+    return abs(value - reference) / max(1.0, abs(reference))
+
+
+def solution_quality(
+    problem: cp.Problem,
+    problem_name: str | None = None,
+    seed: int | None = None,
+    references: str | Path = DEFAULT_REFERENCES,
+) -> dict:
+    """Residuals of the problem's current solution and its gap to the reference.
+
+    The gap is only computed when ``problem_name`` is given and has a
+    reference for ``seed``.
+    """
+    gap = None
+    if problem_name is not None:
+        reference = reference_objective(load_references(references), problem_name, seed)
+        gap = objective_gap(problem.value, reference)
+    return {
+        "primal_residual": primal_residual(problem),
+        "dual_residual": dual_residual(problem),
+        "objective_gap": gap,
+    }
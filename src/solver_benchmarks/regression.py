@@ -0,0 +1,223 @@
+"""Detect regressions between two sets of benchmark runs.
+
+Runs are split into a baseline and a candidate with selectors such as
+``"cvxpy_version==1.7.1"`` or ``"solver_version>=0.11,host_fingerprint=ab12"``
+(see :func:`parse_selector`), then paired by (problem, solver, seed), so
+both sides are measured on the same instances. For each pair
+and metric the candidate is flagged when it is slower by more than a
+threshold and, where both sides have enough samples, a one-sided
+Mann–Whitney U test finds the slowdown significant. A pair that was solved
+in the baseline but fails in the candidate is always flagged.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from solver_benchmarks.analysis import SOLVED_STATUSES, metric_series
+from solver_benchmarks.store import version_matches
+from solver_benchmarks.timing import TIMING_METRICS
+
+# Metrics compared by default: timings and iteration count.
+DEFAULT_METRICS = ("solve_time", "compilation_time", "num_iters")
+
+_CLAUSE = re.compile(r"^\s*(\w+)\s*(==|!=|>=|<=|>|<|=)\s*(.*?)\s*$")
+
+
+@dataclass
+class Comparison:
+    problem_name: str
+    solver_name: str
+    seed: int
+    metric: str
+    baseline: float | None  # median
+    candidate: float | None  # median
+    ratio: float | None
+    p_value: float | None
+    method: str  # "mann-whitney", "ratio" or "status"
+    n_baseline: int
+    n_candidate: int
+    regressed: bool
+
+
+def parse_selector(selector: str) -> list[tuple[str, str, str]]:
+    """Parse ``"field op value[,field op value...]"`` into clauses.
+
+    ``op`` is one of ``== = != >= <= > <``. Clauses are combined with AND.
+    """
+    clauses = []
+    for part in selector.split(","):
+        match = _CLAUSE.match(part)
+        if not match:
+            raise ValueError(
+                f"Invalid selector clause {part!r}, expected e.g. 'cvxpy_version>=1.8'"
+            )
+        field, op, value = match.groups()
+        clauses.append((field, "==" if op == "=" else op, value))
+    return clauses
+
+
+def select(frame: pd.DataFrame, selector: str) -> np.ndarray:
+    """Boolean mask of the rows of ``frame`` matching ``selector``.
+
+    Fields ending in ``_version`` compare as versions (see
+    :func:`~solver_benchmarks.store.version_matches`); other fields only
+    support ``==`` and ``!=``.
+    """
+    mask = np.ones(len(frame), dtype=bool)
+    for field, op, value in parse_selector(selector):
+        if field not in frame.columns:
+            raise ValueError(f"Unknown field {field!r} in selector")
+        column = frame[field].astype("category")
+        if field.endswith("_version"):
+            spec = op + value
+            allowed = [v for v in column.cat.categories if version_matches(v, spec)]
+            mask &= column.isin(allowed).to_numpy()
+        elif op == "==":
+            mask &= (column.astype(str) == value).to_numpy()
+        elif op == "!=":
+            mask &= (column.astype(str) != value).to_numpy()
+        else:
+            raise ValueError(f"Operator {op!r} is only supported for *_version fields")
+    return mask
+
+
+def _samples(runs: pd.DataFrame, metric: str, values: pd.Series) -> list[float]:
+    """Every sample of ``metric`` in ``runs``: repeated trials when recorded."""
+    samples = []
+    for stats, value in zip(runs["timing_stats"], values):
+        if metric in TIMING_METRICS and isinstance(stats, str):
+            stats = json.loads(stats)
+            if metric in stats:
+                samples.extend(stats[metric]["samples"])
+                continue
+        if not np.isnan(value):
+            samples.append(float(value))
+    return samples
+
+
+def _pairing_keys(frame: pd.DataFrame) -> list[pd.Series]:
+    # Records from before the seed field used seed 0.
+    seed = pd.to_numeric(frame["seed"], errors="coerce").fillna(0).astype(int)
+    return [frame["problem_name"], frame["solver_name"], seed]
+
+
+def compare_runs(
+    baseline: pd.DataFrame,
+    candidate: pd.DataFrame,
+    metrics=DEFAULT_METRICS,
+    alpha: float = 0.05,
+    threshold: float = 0.1,
+    min_samples: int = 3,
+) -> list[Comparison]:
+    """Compare matching (problem, solver, seed) runs of two result frames.
+
+    Seeds run on only one side are not compared.
+    A metric regresses when the candidate median exceeds the baseline median
+    by more than ``threshold`` (relative) and, if both sides have at least
+    ``min_samples`` samples, a one-sided Mann–Whitney U test rejects "not
+    slower" at level ``alpha``. With fewer samples the ratio alone decides,
+    so use a larger threshold for single-trial runs.
+    """
+    from scipy.stats import mannwhitneyu
+
+    base_groups = baseline.groupby(_pairing_keys(baseline), observed=True, sort=True)
+    cand_groups = candidate.groupby(_pairing_keys(candidate), observed=True, sort=True)
+    base_values = {m: metric_series(baseline, m) for m in metrics}
+    cand_values = {m: metric_series(candidate, m) for m in metrics}
+
+    comparisons = []
+    for key, base_idx in base_groups.indices.items():
+        cand_idx = cand_groups.indices.get(key)
+        if cand_idx is None:
+            continue
+        problem, solver, seed = key
+        base_runs, cand_runs = baseline.iloc[base_idx], candidate.iloc[cand_idx]
+        base_ok = base_runs["status"].isin(SOLVED_STATUSES).to_numpy()
+        cand_ok = cand_runs["status"].isin(SOLVED_STATUSES).to_numpy()
+        if base_ok.any() and not cand_ok.any():
+            comparisons.append(
+                Comparison(
+                    problem_name=problem,
+                    solver_name=solver,
+                    seed=seed,
+                    metric="status",
+                    baseline=None,
+                    candidate=None,
+                    ratio=None,
+                    p_value=None,
+                    method="status",
+                    n_baseline=int(base_ok.sum()),
+                    n_candidate=0,
+                    regressed=True,
+                )
+            )
+            continue
+
+        for metric in metrics:
+            b_values = base_values[metric].iloc[base_idx][base_ok]
+            c_values = cand_values[metric].iloc[cand_idx][cand_ok]
+            b = _samples(base_runs[base_ok], metric, b_values)
+            c = _samples(cand_runs[cand_ok], metric, c_values)
+            if not b or not c:
+                continue
+            b_med, c_med = float(np.median(b)), float(np.median(c))
+            ratio = c_med / b_med if b_med > 0 else (1.0 if c_med == 0 else np.inf)
+            slower = ratio > 1 + threshold
+            if len(b) >= min_samples and len(c) >= min_samples:
+                p_value = float(mannwhitneyu(c, b, alternative="greater").pvalue)
+                method, regressed = "mann-whitney", slower and p_value < alpha
+            else:
+                p_value, method, regressed = None, "ratio", slower
+            comparisons.append(
+                Comparison(
+                    problem_name=problem,
+                    solver_name=solver,
+                    seed=seed,
+                    metric=metric,
+                    baseline=b_med,
+                    candidate=c_med,
+                    ratio=ratio,
+                    p_value=p_value,
+                    method=method,
+                    n_baseline=len(b),
+                    n_candidate=len(c),
+                    regressed=regressed,
+                )
+            )
+    return comparisons
+
+
+def format_comparisons(
+    comparisons: list[Comparison], only_regressions: bool = True
+) -> str:
+    """Format comparisons as a readable string."""
+    shown = [c for c in comparisons if c.regressed or not only_regressions]
+    n_regressed = sum(c.regressed for c in comparisons)
+    pairs = len({(c.problem_name, c.solver_name, c.seed) for c in comparisons})
+    lines = [f"Compared {pairs} (problem, solver, seed) runs: {n_regressed} regressions"]
+    if shown:
+        lines.append("")
+        lines.append(
+            f"{'Problem':<30} {'Solver':<10} {'Seed':>4} {'Metric':<17} {'Baseline':>10} "
+            f"{'Candidate':>10} {'Ratio':>7} {'p':>7}  Method"
+        )
+    for c in shown:
+        if c.method == "status":
+            lines.append(
+                f"{c.problem_name:<30} {c.solver_name:<10} {c.seed:>4} {'status':<17} "
+                f"{'solved':>10} {'failed':>10}  REGRESSION"
+            )
+            continue
+        p = f"{c.p_value:.3f}" if c.p_value is not None else "—"
+        flag = "  REGRESSION" if c.regressed else ""
+        lines.append(
+            f"{c.problem_name:<30} {c.solver_name:<10} {c.seed:>4} {c.metric:<17} "
+            f"{c.baseline:>10.4g} {c.candidate:>10.4g} {c.ratio:>7.2f} {p:>7}  {c.method}{flag}"
+        )
+    return "\n".join(lines)
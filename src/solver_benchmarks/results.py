@@ -3,15 +3,23 @@
 from __future__ import annotations
 
 import json
+import logging
+import os
+import queue
+import threading
 from dataclasses import asdict, dataclass, fields
 from pathlib import Path
+from typing import Iterator
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+
+@dataclass(slots=True)
 class BenchmarkResult:
     # Identity
     problem_name: str
     solver_name: str
+    seed: int | None = None
 
     # Timing (seconds)
     compilation_time: float | None = None
@@ -19,23 +27,80 @@ class BenchmarkResult:
     setup_time: float | None = None
     total_time: float | None = None
 
-    # Outcome
+    # Repeated trials. With repeats > 1 the timing fields above hold medians
+    # and timing_stats maps each timing field to its min/median/mean/std/iqr
+    # and raw samples.
+    repeats: int = 1
+    warmup: int = 0
+    timing_stats: dict | None = None
+
+    # "cold": every trial solves a freshly built problem. "resolve": one
+    # parameterized problem is re-solved with new data and warm starts; the
+    # timings above are then per re-solve and first_solve_time is the
+    # initial solve, including the DPP compilation. "latency": one problem
+    # is solved many times in a loop; latency holds the distribution of the
+    # per-call time, the solver's own time and CVXPY's overhead (see
+    # solver_benchmarks.latency). "direct": the solver is called on CVXPY's
+    # problem data through solve_via_data, bypassing CVXPY; direct_time is
+    # the wall time per call and total_time that of an end-to-end solve.
+    mode: str = "cold"
+    # How the problem was built: "native" by its factory, or "instance"
+    # loaded from the exported instance cache (see solver_benchmarks.export).
+    # Instance runs solve a standard-form rebuild, so their construction and
+    # compilation times and problem type are not comparable to native runs.
+    problem_source: str = "native"
+    first_solve_time: float | None = None
+    latency: dict | None = None
+    direct_time: float | None = None
+
+    # Wall time per phase of the run (see solver_benchmarks.profiling), as
+    # medians over the recorded trials, and the profiler output if requested.
+    phases: dict | None = None
+    profile_path: str = ""
+
+    # Resources used by the run (see solver_benchmarks.monitor): peak RSS of
+    # the process and, if traced, peak Python allocations in MB; CPU times in
+    # seconds and parallelism (CPU time / wall time) as medians over trials.
+    peak_rss_mb: float | None = None
+    python_peak_mb: float | None = None
+    cpu_user_time: float | None = None
+    cpu_system_time: float | None = None
+    parallelism: float | None = None
+
+    # Outcome: a CVXPY status, "solver_error", or "timeout" / "memory_limit" /
+    # "crashed" for runs stopped by the sandbox supervisor.
     status: str = ""
     objective_value: float | None = None
     num_iters: int | None = None
+    # Solution quality (see quality.py): largest constraint violation,
+    # Lagrangian gradient norm and relative gap to the reference objective.
+    primal_residual: float | None = None
+    dual_residual: float | None = None
+    objective_gap: float | None = None
 
     # Problem size
     problem_type: str = ""
     num_scalar_variables: int | None = None
     num_scalar_eq_constr: int | None = None
     num_scalar_leq_constr: int | None = None
+    # Scaling sweeps: the value of the problem's size parameter (None at the
+    # factory default) and the nonzeros in the solver's problem data.
+    size: int | None = None
+    num_nonzeros: int | None = None
 
     # Environment
     cvxpy_version: str = ""
-    solver_version: str = ""
+    solver_version: str = ""  # of the solver's Python distribution
+    solver_native_version: str = ""  # of the wrapped library, when it reports one
     python_version: str = ""
     os_info: str = ""
-    cpu_info: str = ""
+    cpu_info: str = ""  # CPU model
+    host_fingerprint: str = ""
+    # Hardware and package details (see environment.machine_info) and the
+    # time of the calibration workload, to compare runs across machines.
+    # Results files hold ``machine`` once per host_fingerprint only.
+    machine: dict | None = None
+    calibration_time: float | None = None
     timestamp: str = ""
     contributor: str = ""
 
@@ -44,28 +109,192 @@ class BenchmarkResult:
 
     @classmethod
     def from_dict(cls, d: dict) -> BenchmarkResult:
-        valid_fields = {f.name for f in fields(cls)}
-        return cls(**{k: v for k, v in d.items() if k in valid_fields})
+        return cls(**{k: v for k, v in d.items() if k in _FIELD_NAMES})
+
+
+_FIELD_NAMES = frozenset(f.name for f in fields(BenchmarkResult))
+
+
+# Statuses of runs that did not produce a solver answer and should be retried.
+FAILED_STATUSES = frozenset({"solver_error", "timeout", "memory_limit", "crashed"})
+
+
+def run_key(
+    problem_name: str,
+    solver_name: str,
+    seed: int | None,
+    cvxpy_version: str,
+    solver_version: str,
+    host_fingerprint: str,
+    mode: str = "cold",
+    problem_source: str = "native",
+) -> tuple:
+    """Identify a run for resuming: what was solved, with what, and where."""
+    return (
+        problem_name,
+        solver_name,
+        seed,
+        cvxpy_version,
+        solver_version,
+        host_fingerprint,
+        mode,
+        problem_source,
+    )
+
+
+def completed_runs(results: list[BenchmarkResult]) -> set[tuple]:
+    """Return the :func:`run_key` of every run with a non-failed status."""
+    return {
+        run_key(
+            r.problem_name,
+            r.solver_name,
+            r.seed,
+            r.cvxpy_version,
+            r.solver_version,
+            r.host_fingerprint,
+            r.mode,
+            r.problem_source,
+        )
+        for r in results
+        if r.status and r.status not in FAILED_STATUSES
+    }
+
+
+def _recorded_machines(path: Path) -> set[str]:
+    """Host fingerprints whose ``machine`` is already recorded in ``path``."""
+    if not path.exists():
+        return set()
+    return {d.get("host_fingerprint", "") for d in iter_records(path) if d.get("machine")}
+
+
+def _record(result: BenchmarkResult, machines: set[str]) -> str:
+    """JSON line of ``result``, without ``machine`` if its host is in ``machines``.
+
+    The machine description is the same for every run on a host, so it is
+    written once per file; ``machines`` is updated.
+    """
+    d = result.to_dict()
+    if d["machine"] is not None:
+        if d["host_fingerprint"] in machines:
+            d["machine"] = None
+        else:
+            machines.add(d["host_fingerprint"])
+    return json.dumps(d) + "\n"
 
 
 def save_results(results: list[BenchmarkResult], path: str | Path) -> None:
     """Append results to a JSONL file."""
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
+    machines = _recorded_machines(path)
     with open(path, "a") as f:
         for r in results:
-            f.write(json.dumps(r.to_dict()) + "\n")
+            f.write(_record(r, machines))
 
 
-def load_results(path: str | Path) -> list[BenchmarkResult]:
-    """Load results from a single JSONL file."""
-    results = []
+_STOP = object()
+
+
+class ResultWriter:
+    """Append results to a JSONL file from a background thread.
+
+    Each record is written as a single line (with the ``machine`` of each
+    host only once per file), flushed and fsynced before the
+    next one, so a sweep that crashes or is interrupted leaves a valid JSONL
+    file containing every run that finished. Writing happens on a separate
+    thread so the caller never blocks on disk I/O. Use as a context manager,
+    or call :meth:`close` to drain pending records.
+    """
+
+    def __init__(self, path: str | Path, fsync: bool = True):
+        self.path = Path(path)
+        self.fsync = fsync
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        _truncate_partial_line(self.path)
+        self._machines = _recorded_machines(self.path)
+        self._queue: queue.Queue = queue.Queue()
+        self._error: BaseException | None = None
+        self._thread = threading.Thread(
+            target=self._run, name="ResultWriter", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        with open(self.path, "a") as f:
+            while True:
+                item = self._queue.get()
+                if item is _STOP:
+                    return
+                if self._error is not None:
+                    continue
+                try:
+                    f.write(_record(item, self._machines))
+                    f.flush()
+                    if self.fsync:
+                        os.fsync(f.fileno())
+                except Exception as exc:
+                    self._error = exc
+
+    def write(self, result: BenchmarkResult) -> None:
+        """Queue ``result`` to be appended to the file."""
+        if self._error is not None:
+            raise self._error
+        self._queue.put(result)
+
+    def close(self) -> None:
+        """Write all queued results and stop the writer thread."""
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+    def __enter__(self) -> ResultWriter:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _truncate_partial_line(path: Path) -> None:
+    """Drop a trailing record left half-written by an interrupted writer."""
+    if not path.exists() or path.stat().st_size == 0:
+        return
+    with open(path, "rb+") as f:
+        f.seek(-1, os.SEEK_END)
+        if f.read(1) == b"\n":
+            return
+        f.seek(0)
+        keep = f.read().rfind(b"\n") + 1
+        logger.warning("Dropping partial record at the end of %s", path)
+        f.truncate(keep)
+
+
+def iter_records(path: str | Path) -> Iterator[dict]:
+    """Yield the raw record dicts of a single JSONL file.
+
+    A malformed final line, as left by a writer that was killed mid-record,
+    is skipped with a warning.
+    """
     with open(path) as f:
+        pending = None
         for line in f:
             line = line.strip()
-            if line:
-                results.append(BenchmarkResult.from_dict(json.loads(line)))
-    return results
+            if not line:
+                continue
+            if pending is not None:
+                yield json.loads(pending)
+            pending = line
+    if pending is not None:
+        try:
+            yield json.loads(pending)
+        except json.JSONDecodeError:
+            logger.warning("Skipping partial record at the end of %s", path)
+
+
+def load_results(path: str | Path) -> list[BenchmarkResult]:
+    """Load results from a single JSONL file (see :func:`iter_records`)."""
+    return [BenchmarkResult.from_dict(d) for d in iter_records(path)]
 
 
 def load_all_results(directory: str | Path = "results") -> list[BenchmarkResult]:
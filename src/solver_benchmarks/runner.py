@@ -2,143 +2,1080 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import math
 import platform
+import statistics
 import time
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
+from typing import Callable, Iterable
 
 import cvxpy as cp
+import numpy as np
+import scipy.sparse as sp
 
+from solver_benchmarks.cache import ProblemCache
+from solver_benchmarks.export import instance_spec
 from solver_benchmarks.classify import classify_problem
-from solver_benchmarks.problems import ProblemSpec, list_problems
-from solver_benchmarks.results import BenchmarkResult, save_results
+from solver_benchmarks.environment import calibration_time, machine_info
+from solver_benchmarks.latency import measure_latency
+from solver_benchmarks.monitor import MB, ResourceMonitor, cpu_times, parallelism
+from solver_benchmarks.parallel import map_as_completed
+from solver_benchmarks.problems import ProblemSpec, get_problem, list_problems
+from solver_benchmarks.profiling import (
+    PROFILERS,
+    PhaseHook,
+    PhaseTimer,
+    ordered_phases,
+    profiled,
+    timed_solve,
+)
+from solver_benchmarks.quality import DEFAULT_REFERENCES, solution_quality
+from solver_benchmarks.results import (
+    BenchmarkResult,
+    ResultWriter,
+    completed_runs,
+    load_all_results,
+    run_key,
+)
+from solver_benchmarks.sandbox import run_supervised
+from solver_benchmarks.scheduler import CostModel, Job, Schedule, lpt_schedule
+from solver_benchmarks.solvers import installed_solvers, native_version, solver_version
+from solver_benchmarks.timing import TIMING_METRICS, summarize_trials
 
 logger = logging.getLogger(__name__)
 
 SEED = 0
 
 
-def _env_info() -> dict:
+def host_fingerprint() -> str:
+    """Short stable identifier of the machine running the benchmarks."""
+    parts = [
+        platform.node(),
+        platform.system(),
+        platform.release(),
+        platform.machine(),
+        platform.processor(),
+    ]
+    return hashlib.sha256("|".join(parts).encode()).hexdigest()[:12]
+
+
+def _env_info(calibration: float | None = None) -> dict:
+    """Environment fields of a result; ``calibration`` defaults to this process's."""
+    machine = machine_info()
     return {
         "cvxpy_version": cp.__version__,
         "python_version": platform.python_version(),
         "os_info": f"{platform.system()} {platform.release()}",
-        "cpu_info": platform.processor() or platform.machine(),
+        "cpu_info": machine["cpu_model"],
+        "host_fingerprint": host_fingerprint(),
+        "machine": machine,
+        "calibration_time": calibration if calibration is not None else calibration_time(),
+    }
+
+
+def _solver_info(solver_name: str) -> dict:
+    return {
+        "solver_version": solver_version(solver_name),
+        "solver_native_version": native_version(solver_name),
     }
 
 
-def _solver_version(problem: cp.Problem, solver_name: str) -> str:
-    try:
-        stats = problem.solver_stats
-        if stats is not None and hasattr(stats, "solver_name"):
-            return getattr(stats, "solver_name", "")
-    except Exception:
-        pass
-    return ""
+def _median_phases(samples: list[dict[str, float]]) -> dict[str, float]:
+    keys = dict.fromkeys(k for sample in samples for k in sample)
+    return {k: statistics.median(s.get(k, 0.0) for s in samples) for k in keys}
+
+
+def _untimed_run(
+    spec: ProblemSpec, solver_name: str, cache: ProblemCache | None, seed: int
+) -> None:
+    """One full run, outside the timed trials, for profilers and tracers."""
+    if cache is not None:
+        problem = cache.prepare(spec, seed, solver_name)
+    else:
+        problem = spec.func(seed)
+    classify_problem(problem)
+    problem.size_metrics
+    problem.solve(solver=solver_name, warm_start=False)
+
+
+def _profile_run(
+    spec: ProblemSpec,
+    solver_name: str,
+    cache: ProblemCache | None,
+    seed: int,
+    profiler: str,
+    profile_dir: str | Path,
+) -> str:
+    """Profile one extra, untimed run and return the path of the output."""
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%f")
+    safe_name = spec.name.replace("/", "__")
+    path = Path(profile_dir) / f"{safe_name}_{solver_name}_{stamp}{PROFILERS[profiler]}"
+    with profiled(profiler, path):
+        _untimed_run(spec, solver_name, cache, seed)
+    return str(path)
+
+
+def _python_peak_mb(
+    spec: ProblemSpec, solver_name: str, cache: ProblemCache | None, seed: int
+) -> float | None:
+    """Peak Python allocations of one extra, untimed run under tracemalloc."""
+    with ResourceMonitor(trace_python=True) as usage:
+        _untimed_run(spec, solver_name, cache, seed)
+    return usage.python_peak_mb
+
+
+def _num_nonzeros(problem: cp.Problem, solver_name: str) -> int:
+    """Nonzeros in the sparse matrices CVXPY passes to the solver."""
+    data, _, _ = problem.get_problem_data(solver_name)
+    return sum(v.nnz for v in data.values() if sp.issparse(v))
+
+
+def _check_trials(repeats: int, warmup: int) -> None:
+    if repeats < 1:
+        raise ValueError(f"repeats must be at least 1, got {repeats}")
+    if warmup < 0:
+        raise ValueError(f"warmup must be non-negative, got {warmup}")
 
 
 def run_single(
     spec: ProblemSpec,
     solver_name: str,
     contributor: str = "",
+    repeats: int = 1,
+    warmup: int = 0,
+    cache: ProblemCache | None = None,
+    phase_hooks: tuple[PhaseHook, ...] = (),
+    profiler: str | None = None,
+    profile_dir: str | Path = "profiles",
+    trace_memory: bool = False,
+    count_nonzeros: bool = False,
+    mode: str = "cold",
+    gc_mode: str = "controlled",
+    references: str | Path = DEFAULT_REFERENCES,
+    seed: int = SEED,
+    calibration: float | None = None,
 ) -> BenchmarkResult:
-    """Run a single (problem, solver) benchmark."""
-    env = _env_info()
-    problem = spec.func(SEED)
-    problem_type = classify_problem(problem)
-    metrics = problem.size_metrics
+    """Run a single (problem, solver) benchmark on the instance built with ``seed``.
+
+    The problem is solved ``warmup`` times without recording and then
+    ``repeats`` times (``ValueError`` unless ``repeats >= 1`` and
+    ``warmup >= 0``), each time on a freshly built instance so that every
+    trial pays the full compilation cost. With ``repeats > 1`` the timing
+    fields hold the median over trials and ``timing_stats`` holds the full
+    summary (see :func:`solver_benchmarks.timing.summarize_samples`).
+
+    With a ``cache`` every trial reuses the cached problem and its canonical
+    form instead, so ``compilation_time`` only covers the solver-specific
+    data formatting.
+
+    Every phase of the run is timed (see :mod:`solver_benchmarks.profiling`)
+    and passed to ``phase_hooks``. With ``profiler`` (``"cprofile"`` or
+    ``"pyinstrument"``) one extra run is profiled after the timed trials,
+    so that the profiler does not inflate the recorded timings, and its
+    output is written to ``profile_dir``.
 
-    t0 = time.perf_counter()
-    try:
-        problem.solve(solver=solver_name)
-    except Exception as exc:
-        total_time = time.perf_counter() - t0
-        logger.warning("Solver %s failed on %s: %s", solver_name, spec.name, exc)
+    The peak RSS over all trials and the CPU time of each solve are
+    recorded (see :mod:`solver_benchmarks.monitor`). With ``trace_memory``
+    the peak of Python allocations is measured on one more untimed run.
+    With ``count_nonzeros`` the nonzeros of the solver's problem data are
+    counted after the trials. The residuals of the last trial's solution and
+    its objective gap to the reference in ``references`` are recorded (see
+    :mod:`solver_benchmarks.quality`).
+
+    With ``mode="resolve"`` the run is delegated to :func:`run_resolve`,
+    which uses ``repeats``, ``warmup`` and ``phase_hooks`` only, with
+    ``mode="latency"`` to :func:`run_latency`, which uses ``repeats``,
+    ``warmup``, ``gc_mode`` and ``references``, and with ``mode="direct"``
+    to :func:`run_direct`, which uses ``repeats``, ``warmup`` and
+    ``references``.
+
+    ``calibration`` is the calibration time recorded with the result (see
+    :func:`~solver_benchmarks.environment.calibration_time`), measured in
+    this process if not given. :func:`run_benchmarks` measures it once before
+    any run starts, so that workers and sandboxed children do not
+    recalibrate while other runs load the machine.
+    """
+    _check_trials(repeats, warmup)
+    if mode == "resolve":
+        return run_resolve(
+            spec, solver_name, contributor, repeats, warmup, phase_hooks, seed, calibration
+        )
+    if mode == "latency":
+        return run_latency(
+            spec,
+            solver_name,
+            contributor,
+            repeats,
+            warmup,
+            gc_mode,
+            references,
+            seed,
+            calibration,
+        )
+    if mode == "direct":
+        return run_direct(
+            spec, solver_name, contributor, repeats, warmup, references, seed, calibration
+        )
+    env = _env_info(calibration)
+    trials: dict[str, list[float | None]] = {m: [] for m in TIMING_METRICS}
+    phase_trials: list[dict[str, float]] = []
+    parallelism_trials: list[float] = []
+    failed_time = None
+    with ResourceMonitor() as usage:
+        timer = PhaseTimer(phase_hooks)
+        with timer.phase("construction"):
+            if cache is not None:
+                problem = cache.prepare(spec, seed, solver_name)
+            else:
+                problem = spec.func(seed)
+        with timer.phase("classification"):
+            problem_type = classify_problem(problem)
+        with timer.phase("size_metrics"):
+            metrics = problem.size_metrics
+        static_phases = {
+            k: timer.phases.pop(k) for k in ("classification", "size_metrics")
+        }
+
+        for trial in range(warmup + repeats):
+            if trial > 0:
+                timer = PhaseTimer(phase_hooks)
+            if cache is not None:
+                with timer.phase("construction"):
+                    problem = cache.prepare(spec, seed, solver_name)
+            elif trial > 0:
+                with timer.phase("construction"):
+                    problem = spec.func(seed)
+            t0 = time.perf_counter()
+            user0, system0 = cpu_times()
+            try:
+                total_time = timed_solve(
+                    problem, timer, solver=solver_name, warm_start=False
+                )
+            except Exception as exc:
+                failed_time = time.perf_counter() - t0
+                logger.warning("Solver %s failed on %s: %s", solver_name, spec.name, exc)
+                break
+            user, system = cpu_times()
+            if trial < warmup:
+                continue
+
+            stats = problem.solver_stats
+            trials["compilation_time"].append(problem.compilation_time)
+            trials["setup_time"].append(stats.setup_time if stats else None)
+            trials["solve_time"].append(stats.solve_time if stats else None)
+            trials["total_time"].append(total_time)
+            trials["cpu_user_time"].append(user - user0)
+            trials["cpu_system_time"].append(system - system0)
+            parallelism_trials.append(
+                parallelism(user - user0 + system - system0, total_time)
+            )
+            phase_trials.append(timer.phases)
+
+    if failed_time is not None:
         return BenchmarkResult(
             problem_name=spec.name,
             solver_name=solver_name,
-            total_time=total_time,
+            seed=seed,
+            problem_source=spec.source,
+            total_time=failed_time,
+            phases=ordered_phases({**static_phases, **timer.phases}),
+            peak_rss_mb=usage.peak_rss_mb,
             status="solver_error",
             problem_type=problem_type,
             num_scalar_variables=metrics.num_scalar_variables,
             num_scalar_eq_constr=metrics.num_scalar_eq_constr,
             num_scalar_leq_constr=metrics.num_scalar_leq_constr,
+            size=spec.size,
             timestamp=datetime.now(timezone.utc).isoformat(),
             contributor=contributor,
             **env,
         )
-    total_time = time.perf_counter() - t0
+
+    summary = summarize_trials(trials)
+    timings = {m: s["median"] for m, s in summary.items()}
+    samples = [p for p in parallelism_trials if p is not None]
+
+    profile_path = ""
+    if profiler is not None:
+        profile_path = _profile_run(spec, solver_name, cache, seed, profiler, profile_dir)
+    python_peak_mb = None
+    if trace_memory:
+        python_peak_mb = _python_peak_mb(spec, solver_name, cache, seed)
+    num_nonzeros = _num_nonzeros(problem, solver_name) if count_nonzeros else None
 
     stats = problem.solver_stats
     return BenchmarkResult(
         problem_name=spec.name,
         solver_name=solver_name,
-        compilation_time=problem.compilation_time,
-        solve_time=stats.solve_time if stats else None,
-        setup_time=stats.setup_time if stats else None,
-        total_time=total_time,
+        seed=seed,
+        problem_source=spec.source,
+        compilation_time=timings.get("compilation_time"),
+        solve_time=timings.get("solve_time"),
+        setup_time=timings.get("setup_time"),
+        total_time=timings.get("total_time"),
+        repeats=repeats,
+        warmup=warmup,
+        timing_stats=summary if repeats > 1 else None,
+        phases=ordered_phases({**static_phases, **_median_phases(phase_trials)}),
+        profile_path=profile_path,
+        peak_rss_mb=usage.peak_rss_mb,
+        python_peak_mb=python_peak_mb,
+        cpu_user_time=timings.get("cpu_user_time"),
+        cpu_system_time=timings.get("cpu_system_time"),
+        parallelism=statistics.median(samples) if samples else None,
         status=problem.status,
         objective_value=problem.value if problem.value is not None else None,
         num_iters=stats.num_iters if stats else None,
+        **solution_quality(problem, spec.name, seed, references),
         problem_type=problem_type,
         num_scalar_variables=metrics.num_scalar_variables,
         num_scalar_eq_constr=metrics.num_scalar_eq_constr,
         num_scalar_leq_constr=metrics.num_scalar_leq_constr,
-        solver_version=_solver_version(problem, solver_name),
+        size=spec.size,
+        num_nonzeros=num_nonzeros,
+        **_solver_info(solver_name),
         timestamp=datetime.now(timezone.utc).isoformat(),
         contributor=contributor,
         **env,
     )
 
 
+def run_resolve(
+    spec: ProblemSpec,
+    solver_name: str,
+    contributor: str = "",
+    repeats: int = 1,
+    warmup: int = 0,
+    phase_hooks: tuple[PhaseHook, ...] = (),
+    seed: int = SEED,
+    calibration: float | None = None,
+) -> BenchmarkResult:
+    """Benchmark re-solving a parameterized problem with new data.
+
+    The DPP problem from ``spec.parametric`` is built and solved once; that
+    first solve, including the DPP compilation, is recorded as
+    ``first_solve_time``. Then its parameters are updated and the problem
+    re-solved with ``warm_start=True``, ``warmup`` times untimed and
+    ``repeats`` times timed. CVXPY reuses the compiled problem, so each
+    re-solve only maps the new parameter values to the solver data. The
+    timing fields and phases hold the median over the timed re-solves.
+    """
+    if spec.parametric is None:
+        raise ValueError(f"{spec.name} has no parameterized version")
+    env = _env_info(calibration)
+    rng = np.random.default_rng(seed + 1)  # parameter updates
+    trials: dict[str, list[float | None]] = {m: [] for m in TIMING_METRICS}
+    phase_trials: list[dict[str, float]] = []
+    parallelism_trials: list[float] = []
+    first_solve_time = failed_time = None
+    with ResourceMonitor() as usage:
+        timer = PhaseTimer(phase_hooks)
+        with timer.phase("construction"):
+            problem, update = spec.parametric(seed)
+        problem_type = classify_problem(problem)
+        metrics = problem.size_metrics
+        for trial in range(1 + warmup + repeats):
+            if trial > 0:
+                timer = PhaseTimer(phase_hooks)
+                with timer.phase("construction"):
+                    update(rng)
+            t0 = time.perf_counter()
+            user0, system0 = cpu_times()
+            try:
+                total_time = timed_solve(problem, timer, solver=solver_name, warm_start=True)
+            except Exception as exc:
+                failed_time = time.perf_counter() - t0
+                logger.warning("Solver %s failed on %s: %s", solver_name, spec.name, exc)
+                break
+            user, system = cpu_times()
+            if trial == 0:
+                first_solve_time = total_time
+            if trial <= warmup:
+                continue
+
+            stats = problem.solver_stats
+            trials["compilation_time"].append(problem.compilation_time)
+            trials["setup_time"].append(stats.setup_time if stats else None)
+            trials["solve_time"].append(stats.solve_time if stats else None)
+            trials["total_time"].append(total_time)
+            trials["cpu_user_time"].append(user - user0)
+            trials["cpu_system_time"].append(system - system0)
+            parallelism_trials.append(
+                parallelism(user - user0 + system - system0, total_time)
+            )
+            phase_trials.append(timer.phases)
+
+    common = {
+        "problem_name": spec.name,
+        "solver_name": solver_name,
+        "seed": seed,
+        "problem_source": spec.source,
+        "repeats": repeats,
+        "warmup": warmup,
+        "mode": "resolve",
+        "peak_rss_mb": usage.peak_rss_mb,
+        "problem_type": problem_type,
+        "num_scalar_variables": metrics.num_scalar_variables,
+        "num_scalar_eq_constr": metrics.num_scalar_eq_constr,
+        "num_scalar_leq_constr": metrics.num_scalar_leq_constr,
+        **_solver_info(solver_name),
+        "contributor": contributor,
+        **env,
+    }
+    if failed_time is not None:
+        return BenchmarkResult(
+            total_time=failed_time,
+            first_solve_time=first_solve_time,
+            phases=ordered_phases(timer.phases),
+            status="solver_error",
+            timestamp=datetime.now(timezone.utc).isoformat(),
+            **common,
+        )
+
+    summary = summarize_trials(trials)
+    timings = {m: s["median"] for m, s in summary.items()}
+    samples = [p for p in parallelism_trials if p is not None]
+    stats = problem.solver_stats
+    return BenchmarkResult(
+        compilation_time=timings.get("compilation_time"),
+        solve_time=timings.get("solve_time"),
+        setup_time=timings.get("setup_time"),
+        total_time=timings.get("total_time"),
+        timing_stats=summary if repeats > 1 else None,
+        first_solve_time=first_solve_time,
+        phases=ordered_phases(_median_phases(phase_trials)),
+        cpu_user_time=timings.get("cpu_user_time"),
+        cpu_system_time=timings.get("cpu_system_time"),
+        parallelism=statistics.median(samples) if samples else None,
+        status=problem.status,
+        objective_value=problem.value if problem.value is not None else None,
+        num_iters=stats.num_iters if stats else None,
+        **solution_quality(problem),  # the data changed, so no reference gap
+        timestamp=datetime.now(timezone.utc).isoformat(),
+        **common,
+    )
+
+
+def run_latency(
+    spec: ProblemSpec,
+    solver_name: str,
+    contributor: str = "",
+    repeats: int = 1000,
+    warmup: int = 100,
+    gc_mode: str = "controlled",
+    references: str | Path = DEFAULT_REFERENCES,
+    seed: int = SEED,
+    calibration: float | None = None,
+) -> BenchmarkResult:
+    """Measure the per-call latency distribution of solving a small problem.
+
+    The problem is built once, solved ``warmup`` times untimed and then
+    ``repeats`` times timed (see
+    :func:`solver_benchmarks.latency.measure_latency`). CVXPY keeps the
+    compiled problem between calls, so the calls measure the steady-state
+    solve path. ``latency`` holds the count, mean, min, max, percentiles and
+    histogram of the wall time per call (``"total"``) and of its split into
+    the solver's own time (``"native"``) and CVXPY's ``"overhead"``;
+    ``total_time`` is the median call.
+    """
+    env = _env_info(calibration)
+    problem = spec.func(seed)
+    problem_type = classify_problem(problem)
+    metrics = problem.size_metrics
+    result = BenchmarkResult(
+        problem_name=spec.name,
+        solver_name=solver_name,
+        seed=seed,
+        problem_source=spec.source,
+        repeats=repeats,
+        warmup=warmup,
+        mode="latency",
+        problem_type=problem_type,
+        num_scalar_variables=metrics.num_scalar_variables,
+        num_scalar_eq_constr=metrics.num_scalar_eq_constr,
+        num_scalar_leq_constr=metrics.num_scalar_leq_constr,
+        **_solver_info(solver_name),
+        contributor=contributor,
+        **env,
+    )
+    with ResourceMonitor() as usage:
+        try:
+            histograms = measure_latency(
+                problem,
+                partial(problem.solve, solver=solver_name, warm_start=False),
+                calls=repeats,
+                warmup=warmup,
+                gc_mode=gc_mode,
+            )
+        except Exception as exc:
+            logger.warning("Solver %s failed on %s: %s", solver_name, spec.name, exc)
+            histograms = None
+    result.peak_rss_mb = usage.peak_rss_mb
+    result.timestamp = datetime.now(timezone.utc).isoformat()
+    if histograms is None:
+        result.total_time = usage.wall_time
+        result.status = "solver_error"
+        return result
+
+    latency = {"gc_mode": gc_mode}
+    for name, histogram in histograms.items():
+        latency[name] = {**histogram.summary(), "histogram": histogram.to_dict()}
+    stats = problem.solver_stats
+    result.total_time = latency["total"]["p50"]
+    result.latency = latency
+    result.parallelism = usage.parallelism
+    result.status = problem.status
+    result.objective_value = problem.value
+    result.num_iters = stats.num_iters if stats else None
+    for name, value in solution_quality(problem, spec.name, seed, references).items():
+        setattr(result, name, value)
+    return result
+
+
+def run_direct(
+    spec: ProblemSpec,
+    solver_name: str,
+    contributor: str = "",
+    repeats: int = 1,
+    warmup: int = 0,
+    references: str | Path = DEFAULT_REFERENCES,
+    seed: int = SEED,
+    calibration: float | None = None,
+) -> BenchmarkResult:
+    """Time the solver on CVXPY's problem data, bypassing the CVXPY layer.
+
+    The problem is built and ``get_problem_data`` called once. The solving
+    chain's ``solve_via_data`` is then called on that data ``warmup`` times
+    untimed and ``repeats`` times timed: ``direct_time`` is the median wall
+    time per call, and ``setup_time`` and ``solve_time`` the solver's own
+    times. For comparison, freshly built instances are solved end to end
+    with ``problem.solve()`` as in a cold run; ``total_time`` and
+    ``compilation_time`` are the medians of those, so ``total_time -
+    direct_time`` is the time spent in CVXPY. Status, objective and quality
+    are those of the last direct call.
+    """
+    env = _env_info(calibration)
+    problem = spec.func(seed)
+    problem_type = classify_problem(problem)
+    metrics = problem.size_metrics
+    trials: dict[str, list[float | None]] = {
+        m: [] for m in ("direct_time", *TIMING_METRICS)
+    }
+    phase_trials: list[dict[str, float]] = []
+    parallelism_trials: list[float] = []
+    failed = False
+    with ResourceMonitor() as usage:
+        try:
+            solver_opts: dict = {}
+            data, chain, inverse_data = problem.get_problem_data(
+                solver_name, solver_opts=solver_opts
+            )
+            for trial in range(warmup + repeats):
+                t0 = time.perf_counter()
+                user0, system0 = cpu_times()
+                solution = chain.solve_via_data(problem, data, False, False, solver_opts)
+                direct_time = time.perf_counter() - t0
+                user, system = cpu_times()
+                if trial < warmup:
+                    continue
+                problem.unpack_results(solution, chain, inverse_data)
+                stats = problem.solver_stats
+                trials["direct_time"].append(direct_time)
+                trials["setup_time"].append(stats.setup_time if stats else None)
+                trials["solve_time"].append(stats.solve_time if stats else None)
+                trials["cpu_user_time"].append(user - user0)
+                trials["cpu_system_time"].append(system - system0)
+                parallelism_trials.append(
+                    parallelism(user - user0 + system - system0, direct_time)
+                )
+
+            for trial in range(warmup + repeats):
+                end_to_end = spec.func(seed)
+                timer = PhaseTimer()
+                total_time = timed_solve(end_to_end, timer, solver=solver_name, warm_start=False)
+                if trial < warmup:
+                    continue
+                trials["compilation_time"].append(end_to_end.compilation_time)
+                trials["total_time"].append(total_time)
+                phase_trials.append(timer.phases)
+        except Exception as exc:
+            failed = True
+            logger.warning("Solver %s failed on %s: %s", solver_name, spec.name, exc)
+
+    common = {
+        "problem_name": spec.name,
+        "solver_name": solver_name,
+        "seed": seed,
+        "problem_source": spec.source,
+        "repeats": repeats,
+        "warmup": warmup,
+        "mode": "direct",
+        "peak_rss_mb": usage.peak_rss_mb,
+        "problem_type": problem_type,
+        "num_scalar_variables": metrics.num_scalar_variables,
+        "num_scalar_eq_constr": metrics.num_scalar_eq_constr,
+        "num_scalar_leq_constr": metrics.num_scalar_leq_constr,
+        **_solver_info(solver_name),
+        "contributor": contributor,
+        **env,
+    }
+    if failed:
+        return BenchmarkResult(
+            total_time=usage.wall_time,
+            status="solver_error",
+            timestamp=datetime.now(timezone.utc).isoformat(),
+            **common,
+        )
+
+    summary = summarize_trials(trials)
+    timings = {m: s["median"] for m, s in summary.items()}
+    samples = [p for p in parallelism_trials if p is not None]
+    stats = problem.solver_stats
+    return BenchmarkResult(
+        compilation_time=timings.get("compilation_time"),
+        solve_time=timings.get("solve_time"),
+        setup_time=timings.get("setup_time"),
+        total_time=timings.get("total_time"),
+        direct_time=timings.get("direct_time"),
+        timing_stats=summary if repeats > 1 else None,
+        phases=ordered_phases(_median_phases(phase_trials)),
+        cpu_user_time=timings.get("cpu_user_time"),
+        cpu_system_time=timings.get("cpu_system_time"),
+        parallelism=statistics.median(samples) if samples else None,
+        status=problem.status,
+        objective_value=problem.value,
+        num_iters=stats.num_iters if stats else None,
+        **solution_quality(problem, spec.name, seed, references),
+        timestamp=datetime.now(timezone.utc).isoformat(),
+        **common,
+    )
+
+
+def run_sandboxed(
+    spec: ProblemSpec,
+    solver_name: str,
+    contributor: str = "",
+    timeout: float | None = None,
+    memory_limit_mb: float | None = None,
+    **kwargs,
+) -> BenchmarkResult:
+    """Run a single benchmark in a supervised child process.
+
+    Runs that exceed ``timeout`` seconds or ``memory_limit_mb`` megabytes of
+    resident memory are killed and recorded with status ``"timeout"`` or
+    ``"memory_limit"``. A child that dies or raises is recorded as
+    ``"crashed"``. Extra keyword arguments are passed to :func:`run_single`.
+    """
+    outcome = run_supervised(
+        run_single,
+        (spec, solver_name),
+        {"contributor": contributor, **kwargs},
+        timeout=timeout,
+        memory_limit_mb=memory_limit_mb,
+    )
+    if outcome.status == "ok":
+        return outcome.value
+
+    logger.warning(
+        "Run of %s with %s stopped (%s) after %.1fs %s",
+        spec.name,
+        solver_name,
+        outcome.status,
+        outcome.elapsed,
+        outcome.error,
+    )
+    return BenchmarkResult(
+        problem_name=spec.name,
+        solver_name=solver_name,
+        seed=kwargs.get("seed", SEED),
+        problem_source=spec.source,
+        total_time=outcome.elapsed,
+        mode=kwargs.get("mode", "cold"),
+        peak_rss_mb=outcome.peak_rss / MB if outcome.peak_rss is not None else None,
+        status=outcome.status,
+        solver_version=solver_version(solver_name),
+        timestamp=datetime.now(timezone.utc).isoformat(),
+        contributor=contributor,
+        **_env_info(kwargs.get("calibration")),
+    )
+
+
+def _select_problems(
+    problems: list[str] | None, tags: list[str] | None
+) -> list[ProblemSpec]:
+    """The named ``problems``, else those matching any of ``tags``, else all."""
+    if problems:
+        return [get_problem(p) for p in problems]
+    if not tags:
+        return list_problems()
+    specs = []
+    for tag in tags:
+        specs.extend(list_problems(tag=tag))
+    # Deduplicate preserving order
+    seen: set[str] = set()
+    unique: list[ProblemSpec] = []
+    for s in specs:
+        if s.name not in seen:
+            seen.add(s.name)
+            unique.append(s)
+    return unique
+
+
+def _run_function(
+    run_kwargs: dict, timeout: float | None, memory_limit_mb: float | None
+) -> Callable[[ProblemSpec, str], BenchmarkResult]:
+    """:func:`run_single`, sandboxed when a limit is given, bound to ``run_kwargs``."""
+    if timeout is not None or memory_limit_mb is not None:
+        return partial(
+            run_sandboxed,
+            timeout=timeout,
+            memory_limit_mb=memory_limit_mb,
+            **run_kwargs,
+        )
+    return partial(run_single, **run_kwargs)
+
+
+def _run_seed(
+    run: Callable[..., BenchmarkResult], spec: ProblemSpec, solver: str, seed: int
+) -> BenchmarkResult:
+    return run(spec, solver, seed=seed)
+
+
+def parse_seeds(items: Iterable[str]) -> list[int]:
+    """Parse seeds given as ``"3"`` or inclusive ranges ``"0..9"``."""
+    seeds: list[int] = []
+    for item in items:
+        start, sep, stop = item.partition("..")
+        try:
+            seeds.extend(range(int(start), int(stop) + 1) if sep else [int(item)])
+        except ValueError:
+            raise ValueError(f"Invalid seed {item!r}, expected e.g. 3 or 0..9") from None
+    return list(dict.fromkeys(seeds))
+
+
+def _results_path(output_dir: str | Path, contributor: str) -> Path:
+    date = datetime.now(timezone.utc).strftime("%Y%m%d")
+    plat = platform.system().lower()
+    return Path(output_dir) / f"{date}_{contributor}_{plat}.jsonl"
+
+
+def _log_result(result: BenchmarkResult) -> None:
+    logger.info(
+        "%s (seed %s) with %s: status=%s  total_time=%.3fs",
+        result.problem_name,
+        result.seed,
+        result.solver_name,
+        result.status,
+        result.total_time or 0,
+    )
+
+
+def _planned_runs(
+    problems: list[str] | None,
+    solvers: list[str] | None,
+    tags: list[str] | None,
+    mode: str,
+    seeds: Iterable[int],
+    history: list[BenchmarkResult] | None,
+    instance_dir: str | Path | None = None,
+) -> list[tuple[ProblemSpec, str, int]]:
+    """The (spec, solver, seed) runs of a sweep, without those done in ``history``."""
+    specs = _select_problems(problems, tags)
+    if mode == "resolve":
+        skipped = [spec.name for spec in specs if spec.parametric is None]
+        if skipped:
+            logger.info("No parameterized version, skipped in resolve mode: %s", skipped)
+        specs = [spec for spec in specs if spec.parametric is not None]
+    if instance_dir is not None:
+        specs = [instance_spec(spec, instance_dir) for spec in specs]
+
+    # Select solvers
+    if solvers is None:
+        solvers = list(installed_solvers())
+
+    runs = [
+        (spec, solver, seed) for spec in specs for seed in seeds for solver in solvers
+    ]
+    if history is not None:
+        done = completed_runs(history)
+        host = host_fingerprint()
+        runs = [
+            (spec, solver, seed)
+            for spec, solver, seed in runs
+            if run_key(
+                spec.name,
+                solver,
+                seed,
+                cp.__version__,
+                solver_version(solver),
+                host,
+                mode,
+                spec.source,
+            )
+            not in done
+        ]
+        logger.info("Resuming: %d runs left to do", len(runs))
+    return runs
+
+
+def _estimated_jobs(
+    runs: list[tuple[ProblemSpec, str, int]],
+    output_dir: str | Path,
+    mode: str,
+    repeats: int,
+    warmup: int,
+) -> list[Job]:
+    model = CostModel.from_directory(output_dir, mode=mode, host=host_fingerprint())
+    jobs = []
+    for spec, solver, seed in runs:
+        per_trial, source = model.estimate(spec, solver)
+        jobs.append(Job(spec, solver, seed, per_trial * (repeats + warmup), source))
+    return jobs
+
+
+def plan_benchmarks(
+    problems: list[str] | None = None,
+    solvers: list[str] | None = None,
+    tags: list[str] | None = None,
+    output_dir: str | Path = "results",
+    jobs: int = 1,
+    repeats: int = 1,
+    warmup: int = 0,
+    resume: bool = False,
+    mode: str = "cold",
+    seeds: Iterable[int] = (SEED,),
+    instance_dir: str | Path | None = None,
+) -> Schedule:
+    """Estimate the runs :func:`run_benchmarks` would do, without running them.
+
+    Run times are estimated from the results in ``output_dir`` (see
+    :class:`~solver_benchmarks.scheduler.CostModel`) and the runs are
+    scheduled longest first on ``jobs`` workers.
+    """
+    history = load_all_results(output_dir) if resume else None
+    runs = _planned_runs(problems, solvers, tags, mode, seeds, history, instance_dir)
+    return lpt_schedule(_estimated_jobs(runs, output_dir, mode, repeats, warmup), jobs)
+
+
 def run_benchmarks(
     problems: list[str] | None = None,
     solvers: list[str] | None = None,
     tags: list[str] | None = None,
     output_dir: str | Path = "results",
     contributor: str = "anonymous",
+    jobs: int = 1,
+    threads_per_job: int | None = None,
+    pin_cpus: bool = False,
+    timeout: float | None = None,
+    memory_limit_mb: float | None = None,
+    repeats: int = 1,
+    warmup: int = 0,
+    cache_compiled: bool = False,
+    cache_dir: str | Path | None = None,
+    resume: bool = False,
+    profiler: str | None = None,
+    profile_dir: str | Path = "profiles",
+    trace_memory: bool = False,
+    mode: str = "cold",
+    gc_mode: str = "controlled",
+    references: str | Path = DEFAULT_REFERENCES,
+    seeds: Iterable[int] = (SEED,),
+    instance_dir: str | Path | None = None,
+    schedule: bool = True,
 ) -> list[BenchmarkResult]:
-    """Run benchmarks for selected problems and solvers."""
-    # Select problems
-    if problems:
-        from solver_benchmarks.problems import get_problem
-
-        specs = [get_problem(p) for p in problems]
-    elif tags:
-        specs = []
-        for tag in tags:
-            specs.extend(list_problems(tag=tag))
-        # Deduplicate preserving order
-        seen: set[str] = set()
-        unique: list[ProblemSpec] = []
-        for s in specs:
-            if s.name not in seen:
-                seen.add(s.name)
-                unique.append(s)
-        specs = unique
+    """Run benchmarks for selected problems and solvers.
+
+    Each problem is run on the instance built with each of ``seeds``, so
+    that results describe the problem family rather than one random draw.
+    Runs are ordered by problem, then seed, then solver: with a problem
+    cache each instance is built and canonicalized once for all solvers.
+
+    With ``jobs > 1`` (or when thread limits or CPU pinning are requested)
+    the runs are executed on a pool of worker processes. Each result is
+    written as soon as its run finishes; the returned list is in the order
+    of a sequential run. With
+    ``jobs > 1`` and ``schedule``, the pool starts the runs longest first,
+    as estimated from the results in ``output_dir``, to shorten the sweep
+    (see :mod:`solver_benchmarks.scheduler`).
+
+    If ``timeout`` or ``memory_limit_mb`` is given, every run executes in its
+    own supervised child process (see :func:`run_sandboxed`) so that a run
+    hitting a limit is recorded and the sweep continues.
+
+    ``repeats`` (at least 1) and ``warmup`` (non-negative) control how many
+    timed and untimed trials each run performs (see :func:`run_single`).
+
+    With ``cache_compiled`` (implied by ``cache_dir``) each problem is built
+    and canonicalized once and shared by all solvers through a
+    :class:`~solver_benchmarks.cache.ProblemCache`; ``cache_dir`` also
+    persists the cache between sweeps.
+
+    With ``instance_dir`` problems are loaded from the exported conic form
+    in that instance cache, exporting missing instances first (see
+    :mod:`solver_benchmarks.export`), instead of being built by their
+    factories. Their results are recorded with ``problem_source="instance"``.
+
+    With ``resume``, runs that already have a successful record in
+    ``output_dir`` for the same problem, solver, seed, CVXPY version, solver
+    version, host, mode and source are skipped. Missing and failed runs are
+    executed.
+
+    Every run records its phase breakdown. With ``profiler`` each run also
+    writes a ``"cprofile"`` or ``"pyinstrument"`` profile to ``profile_dir``.
+    Runs also record their peak memory and CPU usage; ``trace_memory`` adds
+    the peak of Python allocations, measured on an extra untimed run.
+
+    With ``mode="resolve"`` only problems with a parameterized version are
+    run, each as a sequence of warm-started re-solves (see
+    :func:`run_resolve`). With ``mode="latency"`` each run times
+    ``repeats`` solves of one problem in a loop, with the garbage collector
+    handled as ``gc_mode`` says (see :func:`run_latency`). With
+    ``mode="direct"`` each run times the solver on CVXPY's problem data
+    next to end-to-end solves (see :func:`run_direct`).
+
+    Objective gaps are measured against the reference objectives in
+    ``references`` (see :mod:`solver_benchmarks.quality`).
+    """
+    _check_trials(repeats, warmup)
+    history = load_all_results(output_dir) if resume else None
+    runs = _planned_runs(problems, solvers, tags, mode, seeds, history, instance_dir)
+    submit_order = None
+    if schedule and jobs > 1:
+        estimated = _estimated_jobs(runs, output_dir, mode, repeats, warmup)
+        plan = lpt_schedule(estimated, jobs)
+        logger.info(
+            "Estimated makespan %.1fs on %d workers (%.1fs of run time)",
+            plan.makespan,
+            jobs,
+            plan.total,
+        )
+        index = {id(job): i for i, job in enumerate(estimated)}
+        submit_order = [index[id(job)] for job in plan.jobs]
+    run_kwargs = {
+        "contributor": contributor,
+        "repeats": repeats,
+        "warmup": warmup,
+        "calibration": calibration_time(),
+    }
+    if profiler is not None:
+        run_kwargs.update(profiler=profiler, profile_dir=profile_dir)
+    if trace_memory:
+        run_kwargs["trace_memory"] = True
+    if mode != "cold":
+        run_kwargs["mode"] = mode
+    if mode == "latency":
+        run_kwargs["gc_mode"] = gc_mode
+    if Path(references) != DEFAULT_REFERENCES:
+        run_kwargs["references"] = references
+    if cache_compiled or cache_dir is not None:
+        run_kwargs["cache"] = ProblemCache(cache_dir)
+    run = partial(_run_seed, _run_function(run_kwargs, timeout, memory_limit_mb))
+    if jobs > 1 or threads_per_job is not None or pin_cpus:
+        outcomes = map_as_completed(
+            run,
+            runs,
+            jobs=jobs,
+            threads_per_job=threads_per_job,
+            pin_cpus=pin_cpus,
+            submit_order=submit_order,
+        )
     else:
-        specs = list_problems()
+        outcomes = enumerate(run(*args) for args in runs)
 
-    # Select solvers
+    # Each result is appended to the output file as soon as its run finishes,
+    # so an interrupted sweep keeps every finished run.
+    finished: list[tuple[int, BenchmarkResult]] = []
+    with ResultWriter(_results_path(output_dir, contributor)) as writer:
+        for i, result in outcomes:
+            writer.write(result)
+            finished.append((i, result))
+            _log_result(result)
+
+    # Return the results in the order of a sequential run.
+    return [result for _, result in sorted(finished, key=lambda item: item[0])]
+
+
+def _predicted_time(points: list[tuple[int, float]], size: int) -> float:
+    """Extrapolate the wall time of a run at ``size`` from earlier sizes.
+
+    Uses the growth between the last two points, but never assumes less
+    than linear growth.
+    """
+    last_size, last_time = points[-1]
+    exponent = 1.0
+    if len(points) > 1:
+        prev_size, prev_time = points[-2]
+        if prev_time > 0 and last_time > 0:
+            growth = math.log(last_time / prev_time) / math.log(last_size / prev_size)
+            exponent = max(exponent, growth)
+    return last_time * (size / last_size) ** exponent
+
+
+def run_scaling(
+    problems: list[str] | None = None,
+    solvers: list[str] | None = None,
+    tags: list[str] | None = None,
+    output_dir: str | Path = "results",
+    contributor: str = "anonymous",
+    time_budget: float = 60.0,
+    timeout: float | None = None,
+    memory_limit_mb: float | None = None,
+    repeats: int = 1,
+    warmup: int = 0,
+) -> list[BenchmarkResult]:
+    """Run scalable problems at increasing sizes until a budget runs out.
+
+    Each selected problem with a size grid (see
+    :func:`~solver_benchmarks.problems.register_problem`) is run with each
+    solver at its ``sizes`` in order. The sweep of a (problem, solver) pair
+    stops after a run that fails or does not reach an optimal status, and
+    before a size whose predicted wall time would take the time spent on the
+    pair past ``time_budget`` seconds. ``timeout`` and ``memory_limit_mb``
+    bound every run as in :func:`run_benchmarks`, so a run killed at the
+    memory limit also ends the sweep.
+
+    Results record ``size`` and ``num_nonzeros`` for
+    :func:`solver_benchmarks.analysis.scaling_exponents`.
+    """
+    _check_trials(repeats, warmup)
+    specs = [spec for spec in _select_problems(problems, tags) if spec.sizes]
     if solvers is None:
-        solvers = cp.installed_solvers()
+        solvers = list(installed_solvers())
+    run = _run_function(
+        {
+            "contributor": contributor,
+            "repeats": repeats,
+            "warmup": warmup,
+            "count_nonzeros": True,
+            "calibration": calibration_time(),
+        },
+        timeout,
+        memory_limit_mb,
+    )
 
     results: list[BenchmarkResult] = []
-    for spec in specs:
-        for solver in solvers:
-            logger.info("Running %s with %s", spec.name, solver)
-            result = run_single(spec, solver, contributor=contributor)
-            results.append(result)
-            logger.info(
-                "  status=%s  total_time=%.3fs", result.status, result.total_time or 0
-            )
-
-    # Write results
-    output_dir = Path(output_dir)
-    date = datetime.now(timezone.utc).strftime("%Y%m%d")
-    plat = platform.system().lower()
-    filename = f"{date}_{contributor}_{plat}.jsonl"
-    save_results(results, output_dir / filename)
+    with ResultWriter(_results_path(output_dir, contributor)) as writer:
+        for spec in specs:
+            for solver in solvers:
+                spent = 0.0
+                points: list[tuple[int, float]] = []
+                for size in spec.sizes:
+                    if points and spent + _predicted_time(points, size) > time_budget:
+                        logger.info("%s with %s: budget reached at %s", spec.name, solver, size)
+                        break
+                    t0 = time.perf_counter()
+                    result = run(spec.scaled(size), solver)
+                    elapsed = time.perf_counter() - t0
+                    writer.write(result)
+                    results.append(result)
+                    _log_result(result)
+                    spent += elapsed
+                    points.append((size, elapsed))
+                    if not result.status.startswith("optimal"):
+                        break
 
     return results
@@ -0,0 +1,130 @@
+"""Run a function in a supervised child process.
+
+The child is killed when it exceeds a wall-clock timeout or a resident memory
+limit, so a hanging or runaway solver cannot take down the whole sweep.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import time
+import traceback
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+# Statuses recorded for runs stopped by the supervisor.
+TIMEOUT = "timeout"
+MEMORY_LIMIT = "memory_limit"
+CRASHED = "crashed"
+
+
+@dataclass
+class SupervisedOutcome:
+    status: str  # "ok", TIMEOUT, MEMORY_LIMIT or CRASHED
+    value: Any = None
+    elapsed: float = 0.0
+    peak_rss: int | None = None
+    error: str = ""
+
+
+def rss_bytes(pid: int) -> int | None:
+    """Return the resident set size of process ``pid``, if it can be read."""
+    try:
+        import psutil
+    except ImportError:
+        pass
+    else:
+        try:
+            return psutil.Process(pid).memory_info().rss
+        except psutil.Error:
+            return None
+
+    status = Path(f"/proc/{pid}/status")
+    try:
+        for line in status.read_text().splitlines():
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) * 1024
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def _child(conn, func: Callable, args: tuple, kwargs: dict) -> None:
+    try:
+        conn.send((True, func(*args, **kwargs)))
+    except BaseException:
+        conn.send((False, traceback.format_exc()))
+    finally:
+        conn.close()
+
+
+def run_supervised(
+    func: Callable,
+    args: tuple = (),
+    kwargs: dict | None = None,
+    timeout: float | None = None,
+    memory_limit_mb: float | None = None,
+    poll_interval: float = 0.05,
+) -> SupervisedOutcome:
+    """Call ``func(*args, **kwargs)`` in a child process under supervision.
+
+    The child is polled every ``poll_interval`` seconds and killed once it has
+    run longer than ``timeout`` seconds or its resident memory exceeds
+    ``memory_limit_mb`` megabytes. Memory is read with ``psutil`` when it is
+    installed and from ``/proc`` otherwise; where neither is available the
+    memory limit is not enforced.
+
+    ``func``, its arguments and its return value must be picklable.
+    """
+    ctx = multiprocessing.get_context("spawn")
+    recv_conn, send_conn = ctx.Pipe(duplex=False)
+    proc = ctx.Process(
+        target=_child, args=(send_conn, func, args, kwargs or {}), daemon=True
+    )
+    limit = memory_limit_mb * 1024 * 1024 if memory_limit_mb is not None else None
+
+    t0 = time.perf_counter()
+    proc.start()
+    send_conn.close()
+    peak_rss = None
+    status = None
+    try:
+        while True:
+            if recv_conn.poll(poll_interval):
+                try:
+                    ok, value = recv_conn.recv()
+                except EOFError:
+                    break
+                proc.join()
+                elapsed = time.perf_counter() - t0
+                if ok:
+                    return SupervisedOutcome("ok", value, elapsed, peak_rss)
+                return SupervisedOutcome(CRASHED, None, elapsed, peak_rss, value)
+            if not proc.is_alive():
+                break
+
+            rss = rss_bytes(proc.pid)
+            if rss is not None:
+                peak_rss = max(peak_rss or 0, rss)
+            if limit is not None and rss is not None and rss > limit:
+                status = MEMORY_LIMIT
+                break
+            if timeout is not None and time.perf_counter() - t0 > timeout:
+                status = TIMEOUT
+                break
+    finally:
+        if proc.is_alive():
+            proc.kill()
+        proc.join()
+        recv_conn.close()
+
+    elapsed = time.perf_counter() - t0
+    if status is None:
+        return SupervisedOutcome(
+            CRASHED,
+            elapsed=elapsed,
+            peak_rss=peak_rss,
+            error=f"child exited with code {proc.exitcode}",
+        )
+    return SupervisedOutcome(status, elapsed=elapsed, peak_rss=peak_rss)
@@ -0,0 +1,179 @@
+"""Runtime estimates and longest-job-first scheduling of benchmark runs.
+
+A sweep mixes runs of milliseconds with runs of minutes. Run in name order
+on a pool of workers, a long run picked up last keeps one worker busy
+while the others sit idle. :class:`CostModel` estimates the time per trial
+of each (problem, solver) run, problem construction included, from earlier
+results in the same mode, preferring, in order:
+
+1. runs of the same problem and solver on this host, then on any host,
+2. runs of the same problem with other solvers,
+3. for a scaled problem (``"<name>@<size_param>=<size>"``), runs of the
+   same problem at other sizes, extrapolated linearly in the size,
+4. the problem's size hints from the manifest (see
+   :mod:`solver_benchmarks.problems`): its number of scalar variables and
+   constraints times the median time per scalar of earlier runs with the
+   same solver, or with any solver,
+5. the problem's size tag (:data:`TAG_ESTIMATES`).
+
+Each run's estimate is the time per trial times the number of trials.
+:func:`lpt_schedule` then orders the runs longest first. A process pool
+hands the next run to the first idle worker, so submitting runs in that
+order is the longest-processing-time (LPT) rule, whose makespan is within
+4/3 of the optimum; the schedule simulates that assignment to report each
+worker's load and the estimated makespan.
+"""
+
+from __future__ import annotations
+
+import heapq
+import statistics
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable
+
+from solver_benchmarks.problems import SIZE_HINTS, ProblemSpec
+from solver_benchmarks.results import iter_records
+
+# Seconds per trial assumed for a problem without history or size hints, by size tag.
+TAG_ESTIMATES = {"small": 0.5, "medium": 5.0, "large": 60.0}
+DEFAULT_ESTIMATE = 5.0
+
+
+@dataclass
+class Job:
+    """One planned run and its estimated wall time in seconds."""
+
+    spec: ProblemSpec
+    solver: str
+    seed: int
+    estimate: float
+    source: str  # what the estimate is based on, see CostModel.estimate
+    worker: int | None = None
+    start: float | None = None  # estimated start, seconds into the sweep
+
+
+@dataclass
+class Schedule:
+    """Runs in submission order and their simulated assignment to workers."""
+
+    jobs: list[Job]
+    workers: int
+    loads: list[float] = field(default_factory=list)
+
+    @property
+    def makespan(self) -> float:
+        return max(self.loads, default=0.0)
+
+    @property
+    def total(self) -> float:
+        return sum(job.estimate for job in self.jobs)
+
+
+class CostModel:
+    """Median times per trial observed in earlier results of one mode.
+
+    ``records`` are raw result dicts (see :func:`~solver_benchmarks.results.iter_records`);
+    only the few fields the model needs are kept.
+    """
+
+    def __init__(self, records: Iterable[dict], mode: str = "cold", host: str = ""):
+        # (problem, solver) -> {on another host: times}
+        runs: dict[tuple[str, str], dict[bool, list[float]]] = defaultdict(
+            lambda: defaultdict(list)
+        )
+        self._sizes: dict[str, list[tuple[int, float]]] = defaultdict(list)
+        rates: dict[str, list[float]] = defaultdict(list)  # solver -> seconds per scalar
+        for d in records:
+            if d.get("mode", "cold") != mode or d.get("total_time") is None:
+                continue
+            phases = d.get("phases") or {}
+            time = d["total_time"] + (phases.get("construction") or 0.0)
+            problem, solver = d["problem_name"], d["solver_name"]
+            runs[problem, solver][d.get("host_fingerprint") != host].append(time)
+            if d.get("size") is not None:
+                self._sizes[problem.partition("@")[0]].append((d["size"], time))
+            scalars = sum(d.get(name) or 0 for name in SIZE_HINTS)
+            if scalars:
+                rates[solver].append(time / scalars)
+        self._medians = {key: statistics.median(times[min(times)]) for key, times in runs.items()}
+        self._rates = {solver: statistics.median(r) for solver, r in rates.items()}
+        self._any_rate = statistics.median([t for r in rates.values() for t in r] or [0.0])
+
+    @classmethod
+    def from_directory(cls, directory: str | Path, mode: str = "cold", host: str = "") -> CostModel:
+        """Build the model from the .jsonl files in ``directory``."""
+        paths = sorted(Path(directory).glob("*.jsonl"))
+        return cls((d for path in paths for d in iter_records(path)), mode, host)
+
+    def estimate(self, spec: ProblemSpec, solver: str) -> tuple[float, str]:
+        """Seconds per trial of ``spec`` on ``solver`` and the basis of the estimate.
+
+        The basis is ``"history"``, ``"other solvers"``, ``"other sizes"``,
+        ``"size hints"`` or ``"tag"`` (see the module docstring).
+        """
+        time = self._medians.get((spec.name, solver))
+        if time is not None:
+            return time, "history"
+        others = [t for (problem, _), t in self._medians.items() if problem == spec.name]
+        if others:
+            return statistics.median(others), "other solvers"
+        points = self._sizes.get(spec.name.partition("@")[0])
+        if spec.size is not None and points:
+            size, time = min(points, key=lambda p: abs(p[0] - spec.size))
+            return time * spec.size / size, "other sizes"
+        rate = self._rates.get(solver, self._any_rate)
+        if spec.size_hints and rate:
+            return rate * sum(spec.size_hints.values()), "size hints"
+        times = [TAG_ESTIMATES[t] for t in spec.tags if t in TAG_ESTIMATES]
+        return (max(times), "tag") if times else (DEFAULT_ESTIMATE, "tag")
+
+
+def lpt_schedule(jobs: list[Job], workers: int) -> Schedule:
+    """Order ``jobs`` longest first and assign each to the least loaded worker.
+
+    Ties keep the order of ``jobs``. Fills in each job's ``worker`` and
+    estimated ``start``.
+    """
+    workers = max(1, workers)
+    ordered = sorted(jobs, key=lambda job: -job.estimate)
+    loads = [0.0] * workers
+    idle = [(0.0, w) for w in range(workers)]
+    for job in ordered:
+        load, worker = heapq.heappop(idle)
+        job.worker, job.start = worker, load
+        loads[worker] = load + job.estimate
+        heapq.heappush(idle, (loads[worker], worker))
+    return Schedule(ordered, workers, loads)
+
+
+def _duration(seconds: float) -> str:
+    if seconds < 1:
+        return f"{seconds * 1e3:.0f}ms"
+    if seconds < 60:
+        return f"{seconds:.1f}s"
+    if seconds < 3600:
+        return f"{seconds / 60:.1f}min"
+    return f"{seconds / 3600:.1f}h"
+
+
+def format_schedule(schedule: Schedule) -> str:
+    """Format the runs in submission order and the estimated makespan."""
+    if not schedule.jobs:
+        return "No runs to do."
+    lines = [
+        f"{'Problem':<35} {'Solver':<10} {'Seed':>4} {'Worker':>6} "
+        f"{'Start':>9} {'Estimate':>9}  Based on"
+    ]
+    for job in schedule.jobs:
+        lines.append(
+            f"{job.spec.name:<35} {job.solver:<10} {job.seed:>4} {job.worker:>6} "
+            f"{_duration(job.start):>9} {_duration(job.estimate):>9}  {job.source}"
+        )
+    lines.append(
+        f"\n{len(schedule.jobs)} runs on {schedule.workers} worker(s): estimated "
+        f"makespan {_duration(schedule.makespan)} "
+        f"(total {_duration(schedule.total)} of run time)"
+    )
+    return "\n".join(lines)
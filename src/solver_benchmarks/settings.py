@@ -0,0 +1,19 @@
+"""Defaults shared by the library and the command-line scripts.
+
+Kept free of NumPy and CVXPY imports so that the scripts can build their
+argument parsers, and answer ``--list``, without loading either.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+# --mode latency: how the garbage collector is handled (see solver_benchmarks.latency).
+GC_MODES = ("controlled", "enabled")
+
+# Root of the repository checkout (src/solver_benchmarks/settings.py).
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# Reference objectives for the objective gap (see solver_benchmarks.quality),
+# found wherever the scripts are run from.
+DEFAULT_REFERENCES = REPO_ROOT / "references.json"
@@ -0,0 +1,109 @@
+"""Versions of the solvers being benchmarked.
+
+CVXPY names solvers ("CLARABEL", "HIGHS") but does not report their
+versions. :data:`SOLVER_DISTRIBUTIONS` maps each name to the Python
+distribution providing it; :func:`solver_version` reads that distribution's
+version from the installed package metadata, without importing the solver,
+so the resume logic can compute it cheaply. :func:`native_version` asks the
+solver library itself where the Python package only wraps it (Gurobi,
+MOSEK, ...), which needs the solver imported. :func:`installed_solvers`
+probes which solvers CVXPY can use once per process.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from importlib import import_module, metadata
+
+# CVXPY solver name -> distribution whose version is recorded.
+SOLVER_DISTRIBUTIONS = {
+    "CBC": "cylp",
+    "CLARABEL": "clarabel",
+    "COPT": "coptpy",
+    "CPLEX": "cplex",
+    "CVXOPT": "cvxopt",
+    "DAQP": "daqp",
+    "ECOS": "ecos",
+    "ECOS_BB": "ecos",
+    "GLOP": "ortools",
+    "GLPK": "cvxopt",
+    "GLPK_MI": "cvxopt",
+    "GUROBI": "gurobipy",
+    "HIGHS": "highspy",
+    "KNITRO": "knitro",
+    "MOSEK": "mosek",
+    "NAG": "naginterfaces",
+    "OSQP": "osqp",
+    "PDLP": "ortools",
+    "PIQP": "piqp",
+    "PROXQP": "proxsuite",
+    "QOCO": "qoco",
+    "SCIP": "pyscipopt",
+    "SCIPY": "scipy",
+    "SCS": "scs",
+    "SDPA": "sdpa-python",
+    "XPRESS": "xpress",
+}
+
+
+def _dotted(parts) -> str:
+    return ".".join(str(p) for p in parts)
+
+
+# Solver name -> (module, callable returning the native library version).
+_NATIVE_VERSIONS = {
+    "CPLEX": ("cplex", lambda m: m.Cplex().get_version()),
+    "GUROBI": ("gurobipy", lambda m: _dotted(m.gurobi.version())),
+    "HIGHS": ("highspy", lambda m: m.Highs().version()),
+    "MOSEK": ("mosek", lambda m: _dotted(m.Env.getversion())),
+    "SCIP": ("pyscipopt", lambda m: str(m.Model().version())),
+    "XPRESS": ("xpress", lambda m: m.getversion()),
+}
+
+
+@lru_cache(maxsize=None)
+def installed_solvers() -> tuple[str, ...]:
+    """Solvers CVXPY can use, probed once (the probe imports every backend)."""
+    import cvxpy as cp
+
+    return tuple(cp.installed_solvers())
+
+
+@lru_cache(maxsize=None)
+def solver_version(solver_name: str) -> str:
+    """Version of the distribution providing ``solver_name``, or ``""``."""
+    distribution = SOLVER_DISTRIBUTIONS.get(solver_name.upper())
+    if distribution is None:
+        return ""
+    try:
+        return metadata.version(distribution)
+    except metadata.PackageNotFoundError:
+        return ""
+
+
+@lru_cache(maxsize=None)
+def native_version(solver_name: str) -> str:
+    """Version the solver library reports, or ``""`` if it reports none.
+
+    Only queried for solvers whose Python package wraps a separately
+    versioned library; failures (a missing license, say) give ``""``.
+    """
+    entry = _NATIVE_VERSIONS.get(solver_name.upper())
+    if entry is None:
+        return ""
+    module, query = entry
+    try:
+        return str(query(import_module(module)))
+    except Exception:  # any failure just means no native version
+        return ""
+
+
+def solver_distributions(solver_names) -> list[str]:
+    """Distributions providing ``solver_names``, without duplicates."""
+    return list(
+        dict.fromkeys(
+            SOLVER_DISTRIBUTIONS[s.upper()]
+            for s in solver_names
+            if s.upper() in SOLVER_DISTRIBUTIONS
+        )
+    )
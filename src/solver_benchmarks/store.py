@@ -0,0 +1,255 @@
+"""Columnar (Parquet/Arrow) storage for benchmark results.
+
+The JSONL files in ``results/`` stay the source of truth; :func:`compact`
+converts them into one of two columnar layouts:
+
+- ``"parquet"``: a Parquet dataset partitioned as
+  ``date=YYYYMMDD/contributor=<name>/solver_name=<SOLVER>/``,
+- ``"arrow"``: a single Arrow IPC file, memory-mapped on read.
+
+:func:`scan_store` reads either layout with predicates pushed down to the
+scan, so only matching partitions and row groups are read. Nested fields
+(e.g. ``timing_stats``) are stored as JSON strings.
+
+Requires the optional ``pyarrow`` dependency (``uv sync --extra store``).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import shutil
+from dataclasses import fields
+from pathlib import Path
+
+from solver_benchmarks.results import BenchmarkResult, load_results
+
+PARTITION_COLUMNS = ("date", "contributor", "solver_name")
+ARROW_FILENAME = "results.arrow"
+LAYOUTS = ("parquet", "arrow")
+
+
+def _pyarrow():
+    try:
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+    except ImportError as exc:
+        raise ImportError(
+            "The columnar results store requires pyarrow: uv sync --extra store"
+        ) from exc
+    return pa, ds
+
+
+def _arrow_type(pa, annotation: str):
+    if "dict" in annotation or "list" in annotation:
+        return pa.string()  # JSON-encoded
+    if "float" in annotation:
+        return pa.float64()
+    if "int" in annotation:
+        return pa.int64()
+    if "bool" in annotation:
+        return pa.bool_()
+    return pa.string()
+
+
+def _json_columns() -> set[str]:
+    return {
+        f.name
+        for f in fields(BenchmarkResult)
+        if "dict" in str(f.type) or "list" in str(f.type)
+    }
+
+
+def result_schema():
+    """Arrow schema of the store: result fields plus ``date`` and ``source``."""
+    pa, _ = _pyarrow()
+    columns = [
+        pa.field(f.name, _arrow_type(pa, str(f.type))) for f in fields(BenchmarkResult)
+    ]
+    columns.append(pa.field("date", pa.string()))
+    columns.append(pa.field("source", pa.string()))
+    return pa.schema(columns)
+
+
+def _record_date(r: BenchmarkResult, path: Path) -> str:
+    match = re.match(r"(\d{8})_", path.name)
+    if match:
+        return match.group(1)
+    return r.timestamp[:10].replace("-", "") or "unknown"
+
+
+def results_to_table(results_by_file: dict[Path, list[BenchmarkResult]]):
+    """Build an Arrow table from results grouped by their source file."""
+    pa, _ = _pyarrow()
+    json_cols = _json_columns()
+    rows = []
+    for path, results in results_by_file.items():
+        for r in results:
+            row = r.to_dict()
+            for col in json_cols:
+                if row[col] is not None:
+                    row[col] = json.dumps(row[col])
+            row["date"] = _record_date(r, path)
+            row["source"] = path.name
+            rows.append(row)
+    return pa.Table.from_pylist(rows, schema=result_schema())
+
+
+def compact(
+    results_dir: str | Path = "results",
+    dest: str | Path = "results_store",
+    layout: str = "parquet",
+) -> int:
+    """Convert every ``*.jsonl`` file in ``results_dir`` into a columnar store.
+
+    ``dest`` is replaced once the new store is complete; it may not be, or
+    contain, ``results_dir``. Returns the number of rows written.
+    """
+    if layout not in LAYOUTS:
+        raise ValueError(f"Unknown layout {layout!r}, expected 'parquet' or 'arrow'")
+    results_dir = Path(results_dir)
+    dest = Path(dest)
+    source, target = results_dir.resolve(), dest.resolve()
+    if target == source or target in source.parents:
+        raise ValueError(f"Store {dest} would replace the results in {results_dir}")
+    pa, ds = _pyarrow()
+    table = results_to_table(
+        {path: load_results(path) for path in sorted(results_dir.glob("*.jsonl"))}
+    )
+
+    # Build next to dest, then swap, so a failed write leaves the old store.
+    tmp = dest.with_name(f".{dest.name}.{os.getpid()}.tmp")
+    shutil.rmtree(tmp, ignore_errors=True)
+    tmp.mkdir(parents=True)
+    try:
+        if layout == "parquet":
+            schema = result_schema()
+            ds.write_dataset(
+                table,
+                tmp,
+                format="parquet",
+                partitioning=ds.partitioning(
+                    pa.schema([schema.field(c) for c in PARTITION_COLUMNS]),
+                    flavor="hive",
+                ),
+            )
+        else:
+            with pa.OSFile(str(tmp / ARROW_FILENAME), "wb") as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+    except BaseException:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+    if dest.exists():
+        old = dest.with_name(f".{dest.name}.{os.getpid()}.old")
+        os.replace(dest, old)
+        os.replace(tmp, dest)
+        shutil.rmtree(old)
+    else:
+        os.replace(tmp, dest)
+    return table.num_rows
+
+
+def _open_dataset(path: Path):
+    pa, ds = _pyarrow()
+    arrow_file = path / ARROW_FILENAME if path.is_dir() else path
+    if arrow_file.suffix == ".arrow" and arrow_file.exists():
+        return ds.dataset(pa.ipc.open_file(pa.memory_map(str(arrow_file))).read_all())
+    schema = result_schema()
+    return ds.dataset(
+        path,
+        format="parquet",
+        schema=schema,
+        partitioning=ds.partitioning(
+            pa.schema([schema.field(c) for c in PARTITION_COLUMNS]), flavor="hive"
+        ),
+    )
+
+
+def _version_tuple(version: str) -> tuple[int, ...]:
+    return tuple(int(p) for p in re.findall(r"\d+", version))
+
+
+_VERSION_OPS = {
+    ">=": lambda a, b: a >= b,
+    "<=": lambda a, b: a <= b,
+    "==": lambda a, b: a == b,
+    "!=": lambda a, b: a != b,
+    ">": lambda a, b: a > b,
+    "<": lambda a, b: a < b,
+}
+
+
+def version_matches(version: str, spec: str) -> bool:
+    """Check ``version`` against a spec such as ``">=1.8,<1.9"``.
+
+    Versions compare by their numeric components; a bare version means
+    ``==``.
+    """
+    v = _version_tuple(version)
+    if not v:
+        return False
+    for clause in spec.split(","):
+        clause = clause.strip()
+        op = next((o for o in _VERSION_OPS if clause.startswith(o)), "==")
+        target = _version_tuple(clause[len(op) :] if clause.startswith(op) else clause)
+        if not _VERSION_OPS[op](v, target):
+            return False
+    return True
+
+
+def scan_store(
+    path: str | Path,
+    problem_type: str | None = None,
+    solvers: list[str] | None = None,
+    problems: list[str] | None = None,
+    contributors: list[str] | None = None,
+    cvxpy_version: str | None = None,
+    solver_version: str | None = None,
+    columns: list[str] | None = None,
+):
+    """Read matching rows of a columnar store as an Arrow table.
+
+    All predicates are pushed down to the scan. Version specs (see
+    :func:`version_matches`) are resolved against the distinct versions in
+    the store and pushed down as set-membership filters.
+    """
+    _, ds = _pyarrow()
+    dataset = _open_dataset(Path(path))
+
+    conditions = []
+    if problem_type is not None:
+        conditions.append(ds.field("problem_type") == problem_type)
+    if solvers:
+        conditions.append(ds.field("solver_name").isin(solvers))
+    if problems:
+        conditions.append(ds.field("problem_name").isin(problems))
+    if contributors:
+        conditions.append(ds.field("contributor").isin(contributors))
+    for column, spec in [("cvxpy_version", cvxpy_version), ("solver_version", solver_version)]:
+        if spec is not None:
+            distinct = dataset.to_table(columns=[column]).column(column).unique()
+            allowed = [v for v in distinct.to_pylist() if v and version_matches(v, spec)]
+            conditions.append(ds.field(column).isin(allowed))
+
+    predicate = None
+    for condition in conditions:
+        predicate = condition if predicate is None else predicate & condition
+    return dataset.to_table(columns=columns, filter=predicate)
+
+
+def load_store(path: str | Path, **filters) -> list[BenchmarkResult]:
+    """Load matching rows of a columnar store as ``BenchmarkResult`` objects.
+
+    Accepts the same filters as :func:`scan_store`.
+    """
+    table = scan_store(path, **filters)
+    json_cols = _json_columns() & set(table.column_names)
+    results = []
+    for row in table.to_pylist():
+        for col in json_cols:
+            if row[col] is not None:
+                row[col] = json.loads(row[col])
+        results.append(BenchmarkResult.from_dict(row))
+    return results
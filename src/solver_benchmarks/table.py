@@ -0,0 +1,229 @@
+"""Column-oriented storage for large collections of benchmark results.
+
+A :class:`ResultTable` keeps one array per ``BenchmarkResult`` field instead
+of one object per result:
+
+- ``str`` fields are categoricals (integer codes plus one copy of each
+  distinct string),
+- ``int`` fields are ``int64`` arrays,
+- optional numbers (``float | None``, ``int | None``) are ``float64`` arrays
+  with NaN for missing values,
+- nested fields (``timing_stats``, ``phases``) are kept as JSON text, as in the
+  columnar store, and decoded when a row is rebuilt.
+
+Tables load straight from JSONL files or a columnar store without creating
+a ``BenchmarkResult`` per row, and convert to a pandas DataFrame without
+copying (see :func:`solver_benchmarks.analysis.results_frame`).
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from array import array
+from dataclasses import MISSING, fields
+from pathlib import Path
+from typing import Iterable, Iterator
+
+import numpy as np
+import pandas as pd
+
+from solver_benchmarks.results import BenchmarkResult, iter_records
+from solver_benchmarks.store import scan_store
+
+
+def _kind(annotation: str) -> str:
+    if annotation == "str":
+        return "str"
+    if annotation == "int":
+        return "int"
+    if annotation in ("float | None", "int | None"):
+        return "float"
+    return "object"
+
+
+# Field name -> storage kind, and the defaults used for keys a record lacks.
+_FIELD_KINDS = {f.name: _kind(str(f.type)) for f in fields(BenchmarkResult)}
+_INT_OR_NONE = {f.name for f in fields(BenchmarkResult) if str(f.type) == "int | None"}
+_DEFAULTS = {
+    f.name: f.default for f in fields(BenchmarkResult) if f.default is not MISSING
+}
+
+
+def _categorical(codes: np.ndarray, categories: list) -> pd.Categorical:
+    """Build a categorical with sorted categories from first-seen codes."""
+    order = sorted(range(len(categories)), key=categories.__getitem__)
+    remap = np.empty(len(categories) + 1, dtype=np.int64)
+    remap[order] = np.arange(len(categories))
+    remap[-1] = -1  # code -1 (missing) indexes the last slot
+    return pd.Categorical.from_codes(
+        remap[codes], categories=[categories[i] for i in order]
+    )
+
+
+class _ColumnBuilder:
+    """Accumulate one column without keeping a Python object per value."""
+
+    def __init__(self, kind: str):
+        self.kind = kind
+        if kind == "str":
+            self.values = array("q")
+            self.codes: dict[str, int] = {}
+        elif kind == "int":
+            self.values = array("q")
+        elif kind == "float":
+            self.values = array("d")
+        else:
+            self.values = []
+
+    def append(self, value) -> None:
+        if self.kind == "str":
+            if value is None:
+                self.values.append(-1)
+            else:
+                self.values.append(self.codes.setdefault(value, len(self.codes)))
+        elif self.kind == "float":
+            self.values.append(math.nan if value is None else value)
+        elif self.kind == "object":
+            self.values.append(None if value is None else json.dumps(value))
+        else:
+            self.values.append(value)
+
+    def finish(self):
+        if self.kind == "str":
+            codes = np.frombuffer(self.values, dtype=np.int64)
+            return _categorical(codes, list(self.codes))
+        if self.kind == "int":
+            return np.frombuffer(self.values, dtype=np.int64).copy()
+        if self.kind == "float":
+            return np.frombuffer(self.values, dtype=np.float64).copy()
+        return _object_array(self.values)
+
+
+def _object_array(values: list) -> np.ndarray:
+    # Filling an empty array keeps NumPy from inspecting the values.
+    out = np.empty(len(values), dtype=object)
+    out[:] = values
+    return out
+
+
+class ResultTable:
+    """Benchmark results stored column by column (see the module docstring).
+
+    Use :meth:`load`, :meth:`from_store` or :meth:`from_results` to build
+    one. ``table["solve_time"]`` returns a column; :meth:`row` and iteration
+    rebuild ``BenchmarkResult`` objects on demand.
+    """
+
+    def __init__(self, columns: dict):
+        self.columns = columns
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+    def __getitem__(self, name: str):
+        return self.columns[name]
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory used by the columns, excluding nested objects."""
+        total = 0
+        for column in self.columns.values():
+            if isinstance(column, pd.Categorical):
+                total += column.codes.nbytes
+                total += sum(len(c) for c in column.categories)
+            else:
+                total += column.nbytes
+        return total
+
+    @classmethod
+    def from_records(cls, records: Iterable[dict]) -> ResultTable:
+        """Build a table from record dicts as written to JSONL.
+
+        Unknown keys are ignored and missing ones take the field default,
+        as in :meth:`BenchmarkResult.from_dict`.
+        """
+        builders = {name: _ColumnBuilder(kind) for name, kind in _FIELD_KINDS.items()}
+        columns = [(name, b.append, _DEFAULTS.get(name)) for name, b in builders.items()]
+        for record in records:
+            for name, append, default in columns:
+                append(record.get(name, default))
+        return cls({name: b.finish() for name, b in builders.items()})
+
+    @classmethod
+    def from_results(cls, results: Iterable[BenchmarkResult]) -> ResultTable:
+        """Build a table from ``BenchmarkResult`` objects."""
+        results = list(results)
+        columns = {}
+        for name, kind in _FIELD_KINDS.items():
+            values = [getattr(r, name) for r in results]
+            if kind == "str":
+                columns[name] = pd.Categorical(values)
+            elif kind == "int":
+                columns[name] = np.array(values, dtype=np.int64)
+            elif kind == "float":
+                columns[name] = np.array(values, dtype=float)
+            else:
+                columns[name] = _object_array(
+                    [None if v is None else json.dumps(v) for v in values]
+                )
+        return cls(columns)
+
+    @classmethod
+    def load(cls, path: str | Path = "results") -> ResultTable:
+        """Load a JSONL file, or every ``*.jsonl`` file in a directory."""
+        path = Path(path)
+        paths = sorted(path.glob("*.jsonl")) if path.is_dir() else [path]
+        return cls.from_records(d for p in paths for d in iter_records(p))
+
+    @classmethod
+    def from_store(cls, path: str | Path, **filters) -> ResultTable:
+        """Load matching rows of a columnar store.
+
+        Accepts the filters of :func:`solver_benchmarks.store.scan_store`.
+        """
+        table = scan_store(path, **filters)
+        columns = {}
+        for name, kind in _FIELD_KINDS.items():
+            column = table.column(name)
+            if kind == "str":
+                columns[name] = pd.Categorical(column.to_pandas())
+            elif kind == "int":
+                columns[name] = column.to_numpy().astype(np.int64)
+            elif kind == "float":
+                columns[name] = np.asarray(
+                    column.to_numpy(zero_copy_only=False), dtype=float
+                )
+            else:
+                columns[name] = _object_array(column.to_pylist())
+        return cls(columns)
+
+    def to_frame(self) -> pd.DataFrame:
+        """Return the columns as a DataFrame, without copying them."""
+        return pd.DataFrame(self.columns, copy=False)
+
+    def row(self, i: int) -> BenchmarkResult:
+        """Rebuild the ``BenchmarkResult`` at position ``i``."""
+        values = {}
+        for name, kind in _FIELD_KINDS.items():
+            value = self.columns[name][i]
+            if kind == "int":
+                value = int(value)
+            elif kind == "float":
+                if math.isnan(value):
+                    value = None
+                else:
+                    value = int(value) if name in _INT_OR_NONE else float(value)
+            elif kind == "str" and not isinstance(value, str):
+                value = None  # missing category
+            elif kind == "object" and value is not None:
+                value = json.loads(value)
+            values[name] = value
+        return BenchmarkResult(**values)
+
+    def __iter__(self) -> Iterator[BenchmarkResult]:
+        return (self.row(i) for i in range(len(self)))
+
+    def to_results(self) -> list[BenchmarkResult]:
+        """Rebuild every row as a ``BenchmarkResult``."""
+        return list(self)
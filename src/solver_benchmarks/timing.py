@@ -0,0 +1,61 @@
+"""Summary statistics for repeated timing samples."""
+
+from __future__ import annotations
+
+import math
+import statistics
+
+# Timing fields of BenchmarkResult that are sampled on every trial.
+TIMING_METRICS = (
+    "compilation_time",
+    "setup_time",
+    "solve_time",
+    "total_time",
+    "cpu_user_time",
+    "cpu_system_time",
+)
+
+# Statistics stored for each timing metric, selectable as ``"<metric>:<stat>"``.
+STATS = ("min", "median", "mean", "std", "iqr")
+
+
+def _quantile(values: list[float], q: float) -> float:
+    """Linearly interpolated quantile of already sorted ``values``."""
+    pos = (len(values) - 1) * q
+    lo = math.floor(pos)
+    hi = math.ceil(pos)
+    return values[lo] + (values[hi] - values[lo]) * (pos - lo)
+
+
+def summarize_samples(samples: list[float]) -> dict:
+    """Return min/median/mean/std/IQR and the raw samples.
+
+    ``std`` is the sample standard deviation (zero for a single sample).
+    """
+    values = sorted(samples)
+    return {
+        "min": values[0],
+        "median": statistics.median(values),
+        "mean": statistics.fmean(values),
+        "std": statistics.stdev(values) if len(values) > 1 else 0.0,
+        "iqr": _quantile(values, 0.75) - _quantile(values, 0.25),
+        "samples": list(samples),
+    }
+
+
+def summarize_trials(trials: dict[str, list[float | None]]) -> dict[str, dict]:
+    """Summarize per-metric samples, skipping metrics a solver never reports."""
+    summary = {}
+    for metric, samples in trials.items():
+        values = [v for v in samples if v is not None]
+        if values:
+            summary[metric] = summarize_samples(values)
+    return summary
+
+
+def split_metric(metric: str) -> tuple[str, str | None]:
+    """Split ``"solve_time:min"`` into ``("solve_time", "min")``."""
+    name, _, stat = metric.partition(":")
+    if stat and stat not in STATS:
+        raise ValueError(f"Unknown statistic {stat!r}, expected one of {STATS}")
+    return name, stat or None
@@ -0,0 +1,131 @@
+"""Validate the vectorized analysis reports."""
+
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from solver_benchmarks.analysis import (
+    data_profile,
+    fastest_solver_per_problem,
+    metric_series,
+    performance_profile,
+    results_frame,
+    shifted_geometric_mean,
+    solver_comparison_table,
+    solver_reliability_summary,
+)
+from solver_benchmarks.results import BenchmarkResult
+from solver_benchmarks.timing import summarize_samples
+
+
+def _result(problem, solver, solve_time, status="optimal", problem_type="LP", **kwargs):
+    return BenchmarkResult(
+        problem_name=problem,
+        solver_name=solver,
+        solve_time=solve_time,
+        status=status,
+        problem_type=problem_type,
+        **kwargs,
+    )
+
+
+RESULTS = [
+    _result("lp/a", "SCS", 3.0),
+    _result("lp/a", "SCS", 2.0),  # later duplicate wins in the comparison table
+    _result("lp/a", "CLARABEL", 1.0),
+    _result("lp/b", "SCS", None, status="solver_error"),
+    _result("lp/b", "CLARABEL", 0.5),
+    _result("lp/b", "HIGHS", 0.5),
+    _result(
+        "qp/c",
+        "OSQP",
+        2.0,
+        problem_type="QP",
+        repeats=3,
+        timing_stats={"solve_time": summarize_samples([1.5, 2.0, 4.0])},
+    ),
+]
+
+
+def test_comparison_table():
+    table = solver_comparison_table(RESULTS)
+    assert list(table) == ["lp/a", "lp/b", "qp/c"]
+    assert table["lp/a"] == {"CLARABEL": 1.0, "HIGHS": None, "OSQP": None, "SCS": 2.0}
+    assert table["lp/b"]["SCS"] is None
+
+    lp = solver_comparison_table(RESULTS, problem_type="LP")
+    assert list(lp) == ["lp/a", "lp/b"]
+    assert set(lp["lp/a"]) == {"CLARABEL", "HIGHS", "SCS"}
+    assert solver_comparison_table(RESULTS, problem_type="SDP") == {}
+
+
+def test_reports_accept_a_shared_frame():
+    frame = results_frame(RESULTS)
+    assert results_frame(frame) is frame
+    assert solver_comparison_table(frame, metric="solve_time:min") == solver_comparison_table(
+        RESULTS, metric="solve_time:min"
+    )
+    assert solver_reliability_summary(frame) == solver_reliability_summary(RESULTS)
+    assert fastest_solver_per_problem(frame) == fastest_solver_per_problem(RESULTS)
+
+
+def test_metric_series_statistics():
+    frame = results_frame(RESULTS)
+    mins = metric_series(frame, "solve_time:min")
+    assert list(mins[:3]) == [3.0, 2.0, 1.0]
+    assert math.isnan(mins[3])
+    assert mins[6] == 1.5
+    stds = metric_series(frame, "solve_time:std")
+    assert stds[0] == 0.0 and math.isnan(stds[3]) and stds[6] > 0
+    assert "solve_time:min" in frame.columns  # computed once, kept on the frame
+
+
+def test_reliability_summary():
+    summary = solver_reliability_summary(RESULTS)
+    assert summary["SCS"] == {"LP": {"total": 3, "optimal": 2}}
+    assert summary["OSQP"] == {"QP": {"total": 1, "optimal": 1}}
+
+
+def test_fastest_solver_per_problem():
+    best = fastest_solver_per_problem(RESULTS)
+    assert best["lp/a"] == ("CLARABEL", 1.0)
+    assert best["lp/b"] == ("CLARABEL", 0.5)  # ties go to the earliest result
+    assert fastest_solver_per_problem(RESULTS, metric="solve_time:min")["qp/c"] == ("OSQP", 1.5)
+    assert fastest_solver_per_problem([]) == {}
+
+
+PROFILE_RESULTS = [
+    _result("a", "X", 1.0),
+    _result("a", "Y", 2.0),
+    _result("b", "X", 3.0, status="solver_error"),
+    _result("b", "Y", 4.0),
+]
+
+
+def test_shifted_geometric_mean_penalizes_failures():
+    sgm = shifted_geometric_mean(PROFILE_RESULTS, shift=0.0)
+    # X's failure on "b" is charged the largest solved time, 4.0.
+    assert sgm["X"]["sgm"] == pytest.approx(2.0)
+    assert sgm["Y"]["sgm"] == pytest.approx(math.sqrt(8))
+    assert sgm["Y"]["relative"] == pytest.approx(math.sqrt(2))
+    assert (sgm["X"]["solved"], sgm["X"]["total"]) == (1, 2)
+
+    limited = shifted_geometric_mean(PROFILE_RESULTS, shift=1.0, time_limit=15.0)
+    assert limited["X"]["sgm"] == pytest.approx(math.sqrt(2 * 16) - 1)
+
+
+def test_performance_profile():
+    profile = performance_profile(PROFILE_RESULTS)
+    assert list(profile.index) == [1.0, 2.0]
+    assert list(profile["X"]) == [0.5, 0.5]
+    assert list(profile["Y"]) == [0.5, 1.0]
+    assert list(performance_profile(PROFILE_RESULTS, taus=[1.5])["Y"]) == [0.5]
+
+
+def test_data_profile():
+    profile = data_profile(PROFILE_RESULTS)
+    assert list(profile.index) == [1.0, 2.0, 4.0]
+    assert list(profile["X"]) == [0.5, 0.5, 0.5]
+    assert list(profile["Y"]) == [0.0, 0.5, 1.0]
@@ -0,0 +1,92 @@
+"""Validate the local bikeshare dataset cache."""
+
+from __future__ import annotations
+
+import shutil
+import tempfile
+import zipfile
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import scipy as sp
+
+from solver_benchmarks.data import bikeshare
+
+
+def _seed_archive(directory: Path) -> pd.DataFrame:
+    df = pd.DataFrame(
+        {
+            "Duration": [300, 600, 900, 1200],
+            "Start date": [
+                "2011-01-01 00:01:29",
+                "2011-01-01 06:02:00",
+                "2011-01-01 12:00:00",
+                "2011-01-01 18:30:15",
+            ],
+            "Start station number": [31208, 31100, 31208, np.nan],
+            "End station number": [31108, 31108, 31200, 31100],
+            "Member type": ["Member", "Casual", "Member", "Member"],
+        }
+    )
+    with zipfile.ZipFile(directory / bikeshare.ARCHIVE_NAME, "w") as zf:
+        zf.writestr(bikeshare.CSV_NAME, df.to_csv(index=False))
+    return df
+
+
+def test_one_hot_matches_get_dummies():
+    column = pd.Series([3.0, 1.0, 3.0, 2.0, np.nan])
+    expected = sp.sparse.csr_matrix(pd.get_dummies(column, sparse=True).values)
+    assert (bikeshare._one_hot(column) != expected).nnz == 0
+
+
+def test_offline_cache_from_preseeded_archive():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        directory = Path(tmpdir)
+        expected = _seed_archive(directory)
+
+        df = bikeshare.load_bikeshare_data(directory)
+        A_sparse, A_dense = bikeshare.load_bikeshare_features(directory)
+        assert df["Duration"].tolist() == expected["Duration"].tolist()
+        assert A_sparse.shape == (4, 5)
+        assert A_dense.shape == (4, 2)
+
+        # Derived artifacts are reused once the in-memory cache is cleared,
+        # even without the archive.
+        (directory / bikeshare.ARCHIVE_NAME).unlink()
+        bikeshare._load_frame.cache_clear()
+        bikeshare._load_features.cache_clear()
+        df2 = bikeshare.load_bikeshare_data(directory)
+        A_sparse2, A_dense2 = bikeshare.load_bikeshare_features(directory)
+        assert df2["Member type"].tolist() == expected["Member type"].tolist()
+        assert (A_sparse2 != A_sparse).nnz == 0
+        assert isinstance(A_dense2, np.memmap)
+        np.testing.assert_allclose(A_dense2, A_dense)
+
+
+def test_stale_stamp_downloads_again(monkeypatch):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        directory = Path(tmpdir)
+        expected = _seed_archive(directory)
+        content = (directory / bikeshare.ARCHIVE_NAME).read_bytes()
+        df = bikeshare.load_bikeshare_data(directory)
+        df["Duration"] = 0  # callers get their own copy
+        df = bikeshare.load_bikeshare_data(directory)
+        assert df["Duration"].tolist() == expected["Duration"].tolist()
+
+        # The stamp is left, but the archive and its artifacts are gone.
+        (directory / bikeshare.ARCHIVE_NAME).unlink()
+        for artifacts in directory.glob("bikeshare-*"):
+            shutil.rmtree(artifacts)
+        bikeshare._load_frame.cache_clear()
+        downloads = []
+
+        def get(url):
+            downloads.append(url)
+            return SimpleNamespace(content=content, raise_for_status=lambda: None)
+
+        monkeypatch.setattr(bikeshare.requests, "get", get)
+        df = bikeshare.load_bikeshare_data(directory)
+        assert downloads == [bikeshare.URL]
+        assert df["Duration"].tolist() == expected["Duration"].tolist()
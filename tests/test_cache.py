@@ -0,0 +1,71 @@
+"""Validate the compiled problem cache."""
+
+from __future__ import annotations
+
+import pickle
+import tempfile
+
+import pytest
+
+from solver_benchmarks.cache import ProblemCache
+from solver_benchmarks.problems import ProblemSpec, get_problem
+
+
+class CountingFactory:
+    def __init__(self, name: str):
+        self.spec = get_problem(name)
+        self.calls = 0
+
+    def __call__(self, seed: int):
+        self.calls += 1
+        return self.spec.func(seed)
+
+
+def _spec(name: str) -> tuple[ProblemSpec, CountingFactory]:
+    factory = CountingFactory(name)
+    return ProblemSpec(name=name, func=factory), factory
+
+
+def test_conic_solvers_share_canonicalization():
+    spec, factory = _spec("lp/transportation_medium")
+    reference = spec.func(0)
+    reference.solve(solver="CLARABEL")
+    factory.calls = 0
+
+    cache = ProblemCache()
+    for solver in ["CLARABEL", "SCS", "CLARABEL"]:
+        problem = cache.prepare(spec, 0, solver)
+        problem.solve(solver=solver, warm_start=False)
+        assert problem.value == pytest.approx(reference.value, rel=1e-3)
+    assert factory.calls == 1
+    assert cache.builds == 1
+    assert cache.canonicalizations == 1
+
+
+def test_problem_data_matches_cvxpy():
+    spec, _ = _spec("qp/portfolio_small")
+    data, chain, _ = ProblemCache().problem_data(spec, 0, "OSQP")
+    expected, _, _ = spec.func(0).get_problem_data("OSQP")
+    assert chain.solver.name() == "OSQP"
+    assert (data["P"] != expected["P"]).nnz == 0
+
+
+def test_disk_cache_skips_construction():
+    spec, factory = _spec("lp/diet_small")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        first = ProblemCache(tmpdir)
+        first.prepare(spec, 0, "HIGHS").solve(solver="HIGHS")
+        expected = first.problem(spec, 0).value
+
+        second = ProblemCache(tmpdir)
+        problem = second.prepare(spec, 0, "HIGHS")
+        problem.solve(solver="HIGHS", warm_start=False)
+        assert problem.value == pytest.approx(expected)
+        assert factory.calls == 1
+        assert second.builds == 0
+        assert second.canonicalizations == 0
+
+
+def test_pickled_cache_is_per_process_singleton():
+    cache = ProblemCache("some/dir")
+    assert pickle.loads(pickle.dumps(cache)) is pickle.loads(pickle.dumps(cache))
@@ -0,0 +1,53 @@
+"""Validate the direct-to-solver timing mode."""
+
+from __future__ import annotations
+
+import pytest
+
+from solver_benchmarks.analysis import direct_summary
+from solver_benchmarks.problems import get_problem
+from solver_benchmarks.results import BenchmarkResult
+from solver_benchmarks.runner import run_single
+
+
+@pytest.mark.parametrize("solver", ["CLARABEL", "HIGHS"])
+def test_direct_run_splits_solver_and_cvxpy_time(solver):
+    spec = get_problem("qp/portfolio_small")
+    result = run_single(spec, solver, mode="direct", repeats=3, warmup=1)
+    assert (result.mode, result.status) == ("direct", "optimal")
+    assert 0 < result.solve_time <= result.direct_time < result.total_time
+    assert len(result.timing_stats["direct_time"]["samples"]) == 3
+    assert len(result.timing_stats["total_time"]["samples"]) == 3
+
+    problem = spec.func(0)
+    problem.solve(solver=solver)
+    assert result.objective_value == pytest.approx(problem.value, rel=1e-6)
+
+
+def test_direct_summary():
+    results = [
+        BenchmarkResult(
+            "p",
+            "A",
+            0,
+            mode="direct",
+            status="optimal",
+            total_time=4.0,
+            direct_time=1.0,
+            setup_time=0.2,
+            solve_time=0.5,
+        ),
+        BenchmarkResult(
+            "p", "B", 0, mode="direct", status="optimal", total_time=2.0, direct_time=1.5
+        ),
+        BenchmarkResult("p", "A", 0, status="optimal", total_time=3.0),  # cold run, ignored
+    ]
+    summary = direct_summary(results)["p"]
+    assert summary["A"] == {
+        "total": 4.0,
+        "direct": 1.0,
+        "native": 0.7,
+        "overhead": 3.0,
+        "overhead_share": 0.75,
+    }
+    assert summary["B"]["native"] is None and summary["B"]["overhead"] == 0.5
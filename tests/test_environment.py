@@ -0,0 +1,55 @@
+"""Validate machine fingerprinting and machine-normalized times."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from solver_benchmarks.analysis import machine_summary, metric_series, metric_value, results_frame
+from solver_benchmarks.environment import calibration_time, machine_info
+from solver_benchmarks.problems import get_problem
+from solver_benchmarks.results import BenchmarkResult, load_all_results
+from solver_benchmarks.runner import run_benchmarks, run_single
+
+
+def test_machine_info_and_calibration():
+    info = machine_info()
+    assert info["cpu_model"]
+    assert info["logical_cpus"] >= 1
+    assert "numpy" in info["packages"] and "cvxpy" in info["packages"]
+    assert calibration_time() > 0
+    assert calibration_time() == calibration_time()  # computed once per process
+
+
+def test_run_single_records_machine():
+    result = run_single(get_problem("lp/diet_small"), "HIGHS")
+    assert result.cpu_info == machine_info()["cpu_model"]
+    assert result.machine == machine_info()
+    assert result.calibration_time == calibration_time()
+    assert run_single(get_problem("lp/diet_small"), "HIGHS", calibration=2.5).calibration_time == 2.5
+
+
+def test_sweep_calibrates_once_and_writes_machine_once(tmp_path):
+    results = run_benchmarks(
+        problems=["lp/diet_small"], solvers=["HIGHS", "CLARABEL"], output_dir=tmp_path, jobs=2
+    )
+    # Workers record the parent's calibration instead of their own.
+    assert {r.calibration_time for r in results} == {calibration_time()}
+    written = load_all_results(tmp_path)
+    assert [r.machine is not None for r in written] == [True, False]
+    assert machine_summary(results_frame(written))["blas"].iloc[0] == machine_info()["blas"]
+
+
+def test_normalized_metrics():
+    results = [
+        BenchmarkResult("p", "A", 0, solve_time=2.0, calibration_time=0.5, host_fingerprint="fast"),
+        BenchmarkResult("p", "B", 0, solve_time=2.0, calibration_time=1.0, host_fingerprint="slow"),
+        BenchmarkResult("p", "C", 0, solve_time=2.0),  # recorded before calibration
+    ]
+    assert metric_value(results[0], "solve_time_norm") == 4.0
+    assert metric_value(results[1], "solve_time_norm:min") == 2.0
+    assert metric_value(results[2], "solve_time_norm") is None
+
+    frame = results_frame(results)
+    np.testing.assert_array_equal(metric_series(frame, "solve_time_norm"), [4.0, 2.0, np.nan])
+    machines = machine_summary(frame)
+    assert list(machines["calibration_time"].dropna()) == [0.5, 1.0]
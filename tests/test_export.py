@@ -0,0 +1,103 @@
+"""Validate instance export and the instance cache."""
+
+from __future__ import annotations
+
+import highspy
+import pytest
+
+from solver_benchmarks.export import ConicInstance, export_instance, instance_path, instance_spec
+from solver_benchmarks.problems import ProblemSpec, get_problem
+from solver_benchmarks.runner import run_benchmarks
+
+
+@pytest.mark.parametrize(
+    "name, solver",
+    [
+        ("lp/diet_small", "CLARABEL"),
+        ("qp/portfolio_small", "CLARABEL"),
+        ("mip/knapsack_small", "HIGHS"),  # maximization
+        ("sdp/max_cut_small", "CLARABEL"),
+        ("socp/robust_portfolio", "CLARABEL"),
+    ],
+)
+def test_npz_round_trip_keeps_optimal_value(tmp_path, name, solver):
+    spec = get_problem(name)
+    paths = export_instance(spec, 0, tmp_path)
+    assert paths["npz"] == instance_path(tmp_path, name, 0)
+    problem = spec.func(0)
+    problem.solve(solver=solver)
+
+    loaded = ConicInstance.load_npz(paths["npz"]).to_problem()
+    loaded.solve(solver=solver)
+    assert loaded.value == pytest.approx(problem.value, rel=1e-6)
+
+
+@pytest.mark.parametrize("name", ["lp/diet_small", "qp/portfolio_small", "mip/knapsack_small"])
+def test_mps_read_by_highs(tmp_path, name):
+    spec = get_problem(name)
+    paths = export_instance(spec, 0, tmp_path, formats=("mps",))
+    problem = spec.func(0)
+    problem.solve(solver="HIGHS")
+
+    highs = highspy.Highs()
+    highs.setOptionValue("output_flag", False)
+    assert highs.readModel(str(paths["mps"])) == highspy.HighsStatus.kOk
+    highs.run()
+    assert highs.getInfo().objective_function_value == pytest.approx(problem.value, rel=1e-6)
+
+
+def test_formats_follow_cones(tmp_path):
+    qp = export_instance(get_problem("qp/portfolio_small"), 0, tmp_path)
+    sdp = export_instance(get_problem("sdp/max_cut_small"), 0, tmp_path)
+    assert sorted(qp) == ["mps", "npz"]
+    assert sorted(sdp) == ["cbf", "npz", "sdpa"]
+    cbf = instance_path(tmp_path, "sdp/max_cut_small", 0, "cbf").read_text().split("\n")
+    assert cbf[cbf.index("OBJSENSE") + 1] == "MAX"
+    assert cbf[cbf.index("PSDCON") + 1 : cbf.index("PSDCON") + 3] == ["1", "20"]
+
+
+def test_cached_instances_skip_construction(tmp_path):
+    calls = []
+    base = get_problem("lp/diet_small")
+
+    def factory(seed):
+        calls.append(seed)
+        return base.func(seed)
+
+    spec = instance_spec(ProblemSpec(name=base.name, func=factory), tmp_path)
+    first, second = spec.func(0), spec.func(0)
+    assert calls == [0]
+    first.solve(solver="HIGHS")
+    second.solve(solver="HIGHS")
+    assert first.value == second.value
+
+    (result,) = run_benchmarks(
+        problems=[base.name],
+        solvers=["HIGHS"],
+        output_dir=tmp_path / "results",
+        instance_dir=tmp_path,
+    )
+    assert result.status == "optimal"
+    assert result.objective_value == pytest.approx(first.value)
+
+
+def test_instance_runs_are_kept_apart(tmp_path):
+    kwargs = {"problems": ["lp/diet_small"], "solvers": ["HIGHS"], "output_dir": tmp_path}
+    (native,) = run_benchmarks(**kwargs)
+    (instance,) = run_benchmarks(**kwargs, instance_dir=tmp_path / "instances", resume=True)
+    assert (native.problem_source, instance.problem_source) == ("native", "instance")
+    assert run_benchmarks(**kwargs, instance_dir=tmp_path / "instances", resume=True) == []
+    assert run_benchmarks(**kwargs, resume=True) == []
+
+
+def test_instance_runs_do_not_reuse_cached_native_problems(tmp_path):
+    kwargs = {
+        "problems": ["lp/diet_small"],
+        "solvers": ["HIGHS"],
+        "output_dir": tmp_path / "results",
+        "cache_dir": tmp_path / "cache",
+    }
+    run_benchmarks(**kwargs)
+    (result,) = run_benchmarks(**kwargs, instance_dir=tmp_path / "instances")
+    assert result.problem_source == "instance"
+    assert instance_path(tmp_path / "instances", "lp/diet_small", 0).exists()
@@ -0,0 +1,42 @@
+"""Validate latency histograms and the latency benchmark mode."""
+
+from __future__ import annotations
+
+import gc
+
+import numpy as np
+import pytest
+
+from solver_benchmarks.analysis import latency_summary
+from solver_benchmarks.latency import LatencyHistogram
+from solver_benchmarks.problems import get_problem
+from solver_benchmarks.runner import run_latency
+
+
+def test_histogram_percentiles_within_precision():
+    samples = np.random.default_rng(0).lognormal(-9, 1, size=50_000)
+    histogram = LatencyHistogram()
+    histogram.record(samples[:100])
+    histogram.record(samples[100:])
+    assert histogram.count == len(samples)
+    for q in (50, 90, 99, 99.9):
+        assert histogram.percentile(q) == pytest.approx(np.percentile(samples, q), rel=0.01)
+
+    restored = LatencyHistogram.from_dict(histogram.to_dict())
+    assert restored.summary() == histogram.summary()
+    assert LatencyHistogram().percentile(50) is None
+
+
+def test_run_latency_splits_native_and_overhead():
+    result = run_latency(get_problem("lp/diet_small"), "HIGHS", repeats=50, warmup=5)
+    assert gc.isenabled()
+    assert (result.mode, result.status) == ("latency", "optimal")
+    total, native, overhead = (result.latency[k] for k in ("total", "native", "overhead"))
+    assert total["count"] == native["count"] == overhead["count"] == 50
+    assert total["p50"] <= total["p99"] <= total["max"]
+    assert native["p50"] < total["p50"]
+    assert result.total_time == total["p50"]
+
+    summary = latency_summary([result])
+    assert summary["lp/diet_small"]["HIGHS"]["total"]["p99.9"] == total["p99.9"]
+    assert "histogram" not in summary["lp/diet_small"]["HIGHS"]["total"]
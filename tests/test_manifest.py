@@ -0,0 +1,61 @@
+"""Validate the problem manifest and lazy problem loading."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+
+import cvxpy as cp
+
+from solver_benchmarks.problems import (
+    MANIFEST_PATH,
+    SIZE_HINTS,
+    LazyFactory,
+    _load_manifest,
+    build_manifest,
+    get_problem,
+)
+
+
+def test_manifest_matches_registry():
+    """The committed manifest is current; regenerate with scripts/make_manifest.py."""
+    manifest = json.loads(MANIFEST_PATH.read_text())
+    # Size hints depend on the datasets available, so they are checked apart.
+    hints = {entry["name"]: entry.pop("size_hints") for entry in manifest["problems"]}
+    assert manifest == build_manifest(size_hints=False)
+
+    metrics = get_problem("lp/diet_small").func(0).size_metrics
+    assert hints["lp/diet_small"] == {name: getattr(metrics, name) for name in SIZE_HINTS}
+    assert get_problem("lp/diet_small").size_hints == hints["lp/diet_small"]
+
+
+def test_listing_imports_no_problem_module():
+    code = (
+        "import sys\n"
+        "from solver_benchmarks.problems import get_problem, list_problems\n"
+        "assert len(list_problems('small')) > 0\n"
+        "spec = get_problem('lp/basis_pursuit_large@n=250')\n"
+        "assert not [m for m in sys.modules if m.startswith('solver_benchmarks.problems.')]\n"
+        "assert 'cvxpy' not in sys.modules\n"
+        "assert type(spec.func(0)).__name__ == 'Problem'\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_lazy_specs_build_the_registered_problems(tmp_path):
+    specs = {spec.name: spec for spec in _load_manifest()}
+    lazy = specs["qp/portfolio_small"]
+    assert lazy.func == LazyFactory("solver_benchmarks.problems.qp", "portfolio_small")
+    problem, update = lazy.parametric(0)
+    assert isinstance(problem, cp.Problem) and callable(update)
+
+    expected = get_problem("qp/portfolio_small").scaled(20).func(0)
+    built = lazy.scaled(20).func(0)
+    assert built.size_metrics.num_scalar_variables == expected.size_metrics.num_scalar_variables
+
+    stale = json.loads(MANIFEST_PATH.read_text())
+    stale["sources"]["solver_benchmarks.problems.lp"] = "0" * 64
+    (tmp_path / "manifest.json").write_text(json.dumps(stale))
+    assert _load_manifest(tmp_path / "manifest.json") is None
+    assert _load_manifest(tmp_path / "missing.json") is None
@@ -0,0 +1,30 @@
+"""Validate resource monitoring of benchmark runs."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from solver_benchmarks.monitor import ResourceMonitor
+from solver_benchmarks.problems import get_problem
+from solver_benchmarks.runner import run_single
+
+
+def test_monitor_records_peaks_and_cpu():
+    with ResourceMonitor(trace_python=True) as usage:
+        block = np.ones(64 * 1024 * 1024 // 8)  # 64 MB, touched
+        data = [str(i) for i in range(100_000)]
+        del block, data
+        sum(i * i for i in range(200_000))
+
+    assert usage.peak_rss_mb is not None and usage.peak_rss_mb > 64
+    assert usage.python_peak_mb > 64  # NumPy reports its buffers to tracemalloc
+    assert usage.cpu_user_time > 0
+    assert 0 < usage.parallelism < 64
+
+
+def test_run_single_records_resources():
+    result = run_single(get_problem("lp/diet_small"), "HIGHS", repeats=2, trace_memory=True)
+    assert result.status == "optimal"
+    assert result.peak_rss_mb > 0 and result.python_peak_mb > 0
+    assert result.cpu_user_time is not None and result.parallelism > 0
+    assert len(result.timing_stats["cpu_user_time"]["samples"]) == 2
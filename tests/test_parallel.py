@@ -0,0 +1,56 @@
+"""Validate process-pool helpers."""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import time
+
+from solver_benchmarks.parallel import (
+    THREAD_ENV_VARS,
+    cpu_slots,
+    map_as_completed,
+    thread_limit_env,
+)
+
+
+def test_thread_limit_env_covers_all_runtimes():
+    env = thread_limit_env(2)
+    assert set(env) == set(THREAD_ENV_VARS)
+    assert all(v == "2" for v in env.values())
+
+
+def test_cpu_slots_are_disjoint():
+    slots = cpu_slots(jobs=3, threads=2, cpus=list(range(8)))
+    assert slots == [[0, 1], [2, 3], [4, 5]]
+
+
+def test_cpu_slots_wrap_when_oversubscribed():
+    slots = cpu_slots(jobs=3, threads=1, cpus=[0, 1])
+    assert slots == [[0], [1], [0]]
+
+
+def test_map_as_completed_yields_indexed_results():
+    args = [(2, k) for k in range(6)]
+    assert sorted(map_as_completed(pow, args, jobs=3)) == [(k, 2**k) for k in range(6)]
+    submitted = map_as_completed(pow, args, jobs=3, submit_order=[5, 4, 3, 2, 1, 0])
+    assert sorted(submitted) == [(k, 2**k) for k in range(6)]
+
+
+def test_results_come_as_runs_finish():
+    # One worker runs the jobs in submission order, so they finish in that order.
+    args = [(0.2,), (0.0,), (0.1,)]
+    done = [i for i, _ in map_as_completed(time.sleep, args, submit_order=[1, 2, 0])]
+    assert done == [1, 2, 0]
+
+
+def test_stopping_kills_runs_in_progress():
+    results = map_as_completed(time.sleep, [(0.0,), (60.0,)], jobs=2)
+    assert next(results) == (0, None)
+    results.close()
+    assert multiprocessing.active_children() == []
+
+
+def test_workers_inherit_thread_limits():
+    values = list(map_as_completed(os.getenv, [("OMP_NUM_THREADS",)], threads_per_job=3))
+    assert values == [(0, "3")]
@@ -0,0 +1,57 @@
+"""Validate phase timings and profiler output."""
+
+from __future__ import annotations
+
+import pstats
+
+import cvxpy as cp
+import numpy as np
+
+from solver_benchmarks.analysis import phase_breakdown
+from solver_benchmarks.problems import get_problem
+from solver_benchmarks.profiling import PHASES, PhaseTimer, timed_solve
+from solver_benchmarks.runner import run_single
+from solver_benchmarks.table import ResultTable
+
+
+def test_timed_solve_records_phases():
+    x = cp.Variable(3)
+    problem = cp.Problem(cp.Minimize(cp.sum_squares(x - np.arange(3))), [x >= 1])
+    seen = []
+    timer = PhaseTimer(hooks=[lambda phase, seconds: seen.append(phase)])
+    total = timed_solve(problem, timer, solver="CLARABEL")
+
+    assert problem.status == "optimal"
+    assert set(timer.phases) <= set(PHASES) and "retrieval" in timer.phases
+    assert seen == list(timer.phases)
+    assert sum(timer.phases.values()) <= total + 1e-6
+    assert "unpack_results" not in vars(problem)  # wrapper removed
+
+
+def test_run_single_phases_and_profile(tmp_path):
+    spec = get_problem("lp/diet_small")
+    seen = []
+    result = run_single(
+        spec,
+        "HIGHS",
+        repeats=2,
+        phase_hooks=(lambda phase, seconds: seen.append(phase),),
+        profiler="cprofile",
+        profile_dir=tmp_path,
+    )
+    assert result.status == "optimal"
+    assert list(result.phases)[:4] == [
+        "construction",
+        "classification",
+        "size_metrics",
+        "canonicalization",
+    ]
+    assert seen.count("canonicalization") == 2  # timed trials only
+
+    stats = pstats.Stats(result.profile_path)
+    assert stats.total_calls > 0
+
+    table = ResultTable.from_results([result])
+    assert table.row(0).phases == result.phases
+    breakdown = phase_breakdown(table)
+    assert breakdown.loc[("lp/diet_small", "HIGHS"), "construction"] > 0
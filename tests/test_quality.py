@@ -0,0 +1,72 @@
+"""Validate solution quality metrics and time-to-accuracy reports."""
+
+from __future__ import annotations
+
+import cvxpy as cp
+import numpy as np
+
+from solver_benchmarks.analysis import accuracy_table, mark_inaccurate, results_frame
+from solver_benchmarks.problems import get_problem
+from solver_benchmarks.quality import (
+    DEFAULT_REFERENCES,
+    compute_reference,
+    dual_residual,
+    load_references,
+    objective_gap,
+    primal_residual,
+    save_references,
+)
+from solver_benchmarks.results import BenchmarkResult
+from solver_benchmarks.runner import SEED, run_single
+
+
+def test_residuals():
+    x = cp.Variable(3)
+    problem = cp.Problem(cp.Minimize(cp.sum_squares(x - 2)), [cp.sum(x) == 3, x <= 1.5])
+    problem.solve(solver="CLARABEL")
+    assert primal_residual(problem) < 1e-7
+    assert dual_residual(problem) < 1e-6
+
+    x.value = np.array([2.0, 2.0, 2.0])  # violates both constraints
+    assert np.isclose(primal_residual(problem), 3.0)
+    assert dual_residual(problem) > 0.1
+    assert objective_gap(101.0, 100.0) == 0.01
+    assert objective_gap(0.5, 0.0) == 0.5
+
+
+def test_run_single_records_gap_to_reference(tmp_path):
+    spec = get_problem("lp/diet_small")
+    path = tmp_path / "references.json"
+    reference = compute_reference(spec.func(SEED))
+    save_references({spec.name: {str(SEED): reference}}, path)
+
+    result = run_single(spec, "HIGHS", references=path)
+    assert result.objective_gap < 1e-6
+    assert result.primal_residual < 1e-6
+    assert result.dual_residual < 1e-6
+
+
+def test_default_references_found_from_any_directory(tmp_path, monkeypatch, caplog):
+    monkeypatch.chdir(tmp_path)
+    assert DEFAULT_REFERENCES.is_absolute() and DEFAULT_REFERENCES.exists()
+    assert load_references()  # the committed references.json
+
+    assert load_references(tmp_path / "missing.json") == {}
+    assert "missing.json not found" in caplog.text
+
+
+def test_time_to_accuracy():
+    results = [
+        BenchmarkResult("p", "TIGHT", 0, solve_time=2.0, status="optimal", objective_value=1.0),
+        BenchmarkResult("p", "LOOSE", 0, solve_time=1.0, status="optimal", objective_value=1.01),
+        BenchmarkResult("p", "FAILS", 0, solve_time=0.5, status="solver_error"),
+    ]
+    references = {"p": {"0": {"objective": 1.0}}}
+    table = accuracy_table(results, tolerance=1e-6, references=references)["p"]
+    assert table["TIGHT"]["time"] == 2.0 and table["TIGHT"]["accurate"]
+    assert table["LOOSE"]["time"] is None and np.isclose(table["LOOSE"]["gap"], 0.01)
+    assert table["FAILS"]["time"] is None
+
+    frame = mark_inaccurate(results_frame(results), 1e-6, references)
+    assert list(frame["status"]) == ["optimal", "inaccurate", "solver_error"]
+    assert list(mark_inaccurate(results, 0.1, references)["status"])[:2] == ["optimal"] * 2
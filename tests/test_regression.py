@@ -0,0 +1,86 @@
+"""Validate regression detection between runs."""
+
+from __future__ import annotations
+
+import pytest
+
+from solver_benchmarks.analysis import results_frame
+from solver_benchmarks.regression import compare_runs, format_comparisons, parse_selector, select
+from solver_benchmarks.results import BenchmarkResult
+from solver_benchmarks.timing import summarize_samples
+
+
+def _run(version, problem, samples, status="optimal", num_iters=10, seed=None):
+    return BenchmarkResult(
+        problem_name=problem,
+        seed=seed,
+        solver_name="SCS",
+        solve_time=sorted(samples)[len(samples) // 2],
+        compilation_time=0.1,
+        repeats=len(samples),
+        timing_stats={"solve_time": summarize_samples(samples)} if len(samples) > 1 else None,
+        status=status,
+        num_iters=num_iters,
+        cvxpy_version=version,
+    )
+
+
+def _frames(results, baseline="cvxpy_version==1.7.1", candidate="cvxpy_version>=1.8"):
+    frame = results_frame(results)
+    return frame[select(frame, baseline)], frame[select(frame, candidate)]
+
+
+def test_selectors():
+    assert parse_selector("cvxpy_version>=1.8, contributor=alice") == [
+        ("cvxpy_version", ">=", "1.8"),
+        ("contributor", "==", "alice"),
+    ]
+    with pytest.raises(ValueError):
+        parse_selector("cvxpy_version")
+    frame = results_frame([_run("1.7.1", "p", [1.0]), _run("1.10.0", "p", [1.0])])
+    assert list(select(frame, "cvxpy_version>=1.8")) == [False, True]
+    assert list(select(frame, "cvxpy_version<1.8,problem_name=p")) == [True, False]
+    with pytest.raises(ValueError):
+        select(frame, "problem_name>p")
+
+
+def test_significant_slowdown_is_flagged():
+    base = [1.0, 1.02, 0.98, 1.01, 0.99]
+    results = [
+        _run("1.7.1", "slow", base),
+        _run("1.8.0", "slow", [x * 1.5 for x in base]),
+        _run("1.7.1", "noisy", [1.0, 2.0, 0.5, 1.5, 0.8]),
+        _run("1.8.0", "noisy", [1.2, 0.6, 2.1, 0.9, 1.4]),
+    ]
+    comparisons = {
+        (c.problem_name, c.metric): c for c in compare_runs(*_frames(results))
+    }
+    slow = comparisons["slow", "solve_time"]
+    assert slow.regressed and slow.method == "mann-whitney"
+    assert slow.ratio == pytest.approx(1.5)
+    assert not comparisons["noisy", "solve_time"].regressed
+    assert not comparisons["slow", "compilation_time"].regressed
+
+
+def test_ratio_fallback_and_status():
+    results = [
+        _run("1.7.1", "iters", [1.0], num_iters=10),
+        _run("1.8.0", "iters", [1.0], num_iters=20),
+        _run("1.7.1", "broken", [1.0]),
+        _run("1.8.0", "broken", [1.0], status="solver_error"),
+    ]
+    comparisons = compare_runs(*_frames(results))
+    regressed = {(c.problem_name, c.metric, c.method) for c in comparisons if c.regressed}
+    assert regressed == {("iters", "num_iters", "ratio"), ("broken", "status", "status")}
+
+
+def test_only_matching_seeds_are_compared():
+    # Seed 0 is the easy instance; the baseline also ran harder ones.
+    results = [_run("1.7.1", "p", [1.0 + seed], seed=seed) for seed in range(10)]
+    results += [_run("1.8.0", "p", [1.0], seed=0), _run("1.8.0", "q", [2.0], seed=3)]
+    results.append(_run("1.7.1", "q", [1.0]))  # recorded before seeds: seed 0
+    comparisons = [c for c in compare_runs(*_frames(results)) if c.metric == "solve_time"]
+    assert [(c.problem_name, c.seed, c.ratio) for c in comparisons] == [("p", 0, 1.0)]
+    assert "Compared 1 (problem, solver, seed) runs: 0 regressions" in format_comparisons(
+        comparisons
+    )
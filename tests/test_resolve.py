@@ -0,0 +1,59 @@
+"""Validate the warm-started re-solve mode."""
+
+from __future__ import annotations
+
+import pytest
+
+from solver_benchmarks.analysis import resolve_summary
+from solver_benchmarks.problems import get_problem
+from solver_benchmarks.results import BenchmarkResult, completed_runs
+from solver_benchmarks.runner import run_benchmarks, run_resolve
+
+
+def test_parametric_problem_matches_cold_problem():
+    spec = get_problem("qp/portfolio_small")
+    problem, update = spec.parametric(0)
+    assert problem.is_dcp(dpp=True)
+    problem.solve(solver="CLARABEL")
+    cold = spec.func(0)
+    cold.solve(solver="CLARABEL")
+    assert problem.value == pytest.approx(cold.value, rel=1e-6)
+
+
+def test_run_resolve_records_first_and_steady_state():
+    result = run_resolve(get_problem("qp/portfolio_small"), "OSQP", repeats=5, warmup=1)
+    assert (result.mode, result.status, result.repeats) == ("resolve", "optimal", 5)
+    assert len(result.timing_stats["total_time"]["samples"]) == 5
+    assert result.first_solve_time > 0 and result.total_time > 0
+    assert "canonicalization" in result.phases
+    with pytest.raises(ValueError):
+        run_resolve(get_problem("lp/diet_small"), "HIGHS")
+
+
+def test_resolve_mode_skips_problems_without_parameters(tmp_path):
+    results = run_benchmarks(
+        problems=["lp/diet_small", "qp/portfolio_small"],
+        solvers=["OSQP"],
+        output_dir=tmp_path,
+        mode="resolve",
+        repeats=2,
+    )
+    assert [(r.problem_name, r.mode) for r in results] == [("qp/portfolio_small", "resolve")]
+    cold = BenchmarkResult(problem_name="qp/portfolio_small", solver_name="OSQP", status="optimal")
+    assert len(completed_runs(results + [cold])) == 2  # modes resume separately
+
+
+def test_resolve_summary():
+    results = [
+        BenchmarkResult(problem_name="qp/a", solver_name="X", total_time=0.5, status="optimal"),
+        BenchmarkResult(
+            problem_name="qp/a",
+            solver_name="X",
+            total_time=0.1,
+            first_solve_time=0.4,
+            mode="resolve",
+            status="optimal",
+        ),
+    ]
+    summary = resolve_summary(results)
+    assert summary == {"qp/a": {"X": {"first": 0.4, "steady": 0.1, "speedup": 4.0, "cold": 0.5}}}
@@ -6,7 +6,13 @@ import json
 import tempfile
 from pathlib import Path
 
-from solver_benchmarks.results import BenchmarkResult, load_results, save_results, load_all_results
+from solver_benchmarks.results import (
+    BenchmarkResult,
+    ResultWriter,
+    load_all_results,
+    load_results,
+    save_results,
+)
 
 
 def test_round_trip():
@@ -75,3 +81,31 @@ def test_existing_jsonl_files():
         for r in results:
             assert r.problem_name, f"Empty problem_name in {path}"
             assert r.solver_name, f"Empty solver_name in {path}"
+
+
+def test_result_writer_streams_records():
+    """ResultWriter appends each record and leaves a valid file on close."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "sub" / "stream.jsonl"
+        with ResultWriter(path) as writer:
+            for name in ["a", "b", "c"]:
+                writer.write(BenchmarkResult(problem_name=name, solver_name="X"))
+        loaded = load_results(path)
+        assert [r.problem_name for r in loaded] == ["a", "b", "c"]
+
+
+def test_partial_last_record_is_recovered():
+    """A half-written final line is skipped on load and dropped on append."""
+    r = BenchmarkResult(problem_name="a", solver_name="X")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "partial.jsonl"
+        save_results([r], path)
+        with open(path, "a") as f:
+            f.write('{"problem_name": "b", "sol')
+        assert [x.problem_name for x in load_results(path)] == ["a"]
+
+        with ResultWriter(path) as writer:
+            writer.write(BenchmarkResult(problem_name="c", solver_name="X"))
+        with open(path) as f:
+            assert all(json.loads(line) for line in f)
+        assert [x.problem_name for x in load_results(path)] == ["a", "c"]
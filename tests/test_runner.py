@@ -0,0 +1,97 @@
+"""Validate the benchmark runner on small problems."""
+
+from __future__ import annotations
+
+import tempfile
+
+import pytest
+
+from solver_benchmarks.problems import get_problem
+from solver_benchmarks.results import load_all_results
+from solver_benchmarks.runner import run_benchmarks, run_single
+
+
+def test_parallel_results_in_sequential_order():
+    """A pooled sweep returns and writes results in problem/solver order."""
+    problems = ["lp/diet_small", "mip/knapsack_small"]
+    solvers = ["HIGHS", "SCIPY"]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        results = run_benchmarks(
+            problems=problems, solvers=solvers, output_dir=tmpdir, jobs=2
+        )
+        written = load_all_results(tmpdir)
+    expected = [(p, s) for p in problems for s in solvers]
+    assert [(r.problem_name, r.solver_name) for r in results] == expected
+    assert [(r.problem_name, r.solver_name) for r in written] == expected
+    assert all(r.status == "optimal" for r in results)
+
+
+def test_timeout_recorded_and_sweep_continues():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        results = run_benchmarks(
+            problems=["lp/diet_small"],
+            solvers=["HIGHS", "CLARABEL"],
+            output_dir=tmpdir,
+            timeout=0.01,
+        )
+    assert [r.status for r in results] == ["timeout", "timeout"]
+    assert all(r.total_time >= 0.01 for r in results)
+
+
+def test_repeats_record_timing_stats():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        (result,) = run_benchmarks(
+            problems=["lp/diet_small"],
+            solvers=["HIGHS"],
+            output_dir=tmpdir,
+            repeats=3,
+            warmup=1,
+        )
+    assert result.status == "optimal"
+    assert (result.repeats, result.warmup) == (3, 1)
+    total = result.timing_stats["total_time"]
+    assert len(total["samples"]) == 3
+    assert result.total_time == total["median"]
+
+
+@pytest.mark.parametrize("repeats, warmup", [(0, 0), (1, -1)])
+def test_invalid_trial_counts_rejected(repeats, warmup):
+    with pytest.raises(ValueError, match="repeats|warmup"):
+        run_single(get_problem("lp/diet_small"), "HIGHS", repeats=repeats, warmup=warmup)
+    with pytest.raises(ValueError, match="repeats|warmup"):
+        run_benchmarks(problems=["lp/diet_small"], repeats=repeats, warmup=warmup)
+
+
+def test_compiled_cache_matches_uncached_objectives():
+    problems = ["lp/transportation_medium", "socp/robust_portfolio"]
+    solvers = ["CLARABEL", "SCS"]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        plain = run_benchmarks(problems=problems, solvers=solvers, output_dir=tmpdir)
+        cached = run_benchmarks(
+            problems=problems, solvers=solvers, output_dir=tmpdir, cache_compiled=True
+        )
+    for a, b in zip(plain, cached):
+        assert b.status == a.status
+        assert b.objective_value == pytest.approx(a.objective_value, rel=1e-3)
+
+
+def test_resume_runs_only_missing_and_failed():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        run_benchmarks(
+            problems=["lp/diet_small"], solvers=["HIGHS"], output_dir=tmpdir
+        )
+        run_benchmarks(
+            problems=["mip/knapsack_small"],
+            solvers=["HIGHS"],
+            output_dir=tmpdir,
+            timeout=0.01,
+        )
+        resumed = run_benchmarks(
+            problems=["lp/diet_small", "mip/knapsack_small"],
+            solvers=["HIGHS"],
+            output_dir=tmpdir,
+            resume=True,
+        )
+    assert [(r.problem_name, r.status) for r in resumed] == [
+        ("mip/knapsack_small", "optimal")
+    ]
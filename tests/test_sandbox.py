@@ -0,0 +1,43 @@
+"""Validate the supervised child-process runner."""
+
+from __future__ import annotations
+
+import os
+import time
+
+from solver_benchmarks.sandbox import (
+    CRASHED,
+    MEMORY_LIMIT,
+    TIMEOUT,
+    run_supervised,
+)
+
+
+def _allocate_and_wait(mb: int) -> None:
+    data = b"x" * (mb * 1024 * 1024)  # noqa: F841
+    time.sleep(30)
+
+
+def test_returns_value():
+    outcome = run_supervised(pow, (2, 10), timeout=30)
+    assert outcome.status == "ok"
+    assert outcome.value == 1024
+
+
+def test_timeout_kills_child():
+    outcome = run_supervised(time.sleep, (30,), timeout=0.5)
+    assert outcome.status == TIMEOUT
+    assert outcome.elapsed < 15
+
+
+def test_memory_limit_kills_child():
+    outcome = run_supervised(
+        _allocate_and_wait, (400,), timeout=30, memory_limit_mb=200
+    )
+    assert outcome.status == MEMORY_LIMIT
+
+
+def test_child_exit_is_reported_as_crash():
+    outcome = run_supervised(os._exit, (3,), timeout=30)
+    assert outcome.status == CRASHED
+    assert "3" in outcome.error
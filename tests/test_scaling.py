@@ -0,0 +1,80 @@
+"""Validate scaling sweeps and exponent fits."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from solver_benchmarks.analysis import format_scaling, scaling_exponents
+from solver_benchmarks.problems import get_problem
+from solver_benchmarks.results import BenchmarkResult
+from solver_benchmarks.runner import run_scaling
+
+
+def test_scaled_problems():
+    spec = get_problem("sdp/max_cut_small@n=10")
+    assert spec.size == 10
+    assert spec.func(0).size_metrics.num_scalar_variables == 10 * 10
+    assert get_problem("sdp/max_cut_small").size is None
+    with pytest.raises(KeyError):
+        get_problem("sdp/max_cut_small@m=10")
+    with pytest.raises(ValueError):
+        get_problem("lp/diet_small").scaled(10)
+
+
+def test_run_scaling_stops_at_budget(tmp_path):
+    results = run_scaling(
+        problems=["sdp/max_cut_small", "lp/diet_small"],
+        solvers=["SCS"],
+        output_dir=tmp_path,
+        time_budget=0.5,
+    )
+    sizes = [r.size for r in results]
+    assert results and all(r.problem_name.startswith("sdp/max_cut_small@n=") for r in results)
+    assert sizes == sorted(sizes) and len(sizes) < 6
+    assert all(r.num_nonzeros > 0 for r in results)
+
+
+def test_scaling_exponents():
+    results = [
+        BenchmarkResult(
+            problem_name=f"qp/a@n={n}",
+            solver_name=solver,
+            solve_time=0.001 * n**k,
+            status="optimal",
+            size=n,
+        )
+        for solver, k in [("X", 1.0), ("Y", 2.0)]
+        for n in (10, 20, 40)
+    ]
+    results.append(BenchmarkResult(problem_name="qp/a", solver_name="X", solve_time=5.0, status="optimal"))
+    fits = scaling_exponents(results)
+    assert list(fits) == ["qp/a"]
+    assert fits["qp/a"]["X"]["exponent"] == pytest.approx(1.0)
+    assert fits["qp/a"]["Y"]["exponent"] == pytest.approx(2.0)
+    assert fits["qp/a"]["Y"]["coefficient"] == pytest.approx(0.001)
+    assert fits["qp/a"]["Y"]["largest"] == 40 and fits["qp/a"]["Y"]["points"] == 3
+
+
+def test_scaling_report_without_scaled_runs():
+    results = [
+        BenchmarkResult(problem_name="lp/a", solver_name="X", solve_time=0.1, status="optimal"),
+        BenchmarkResult(problem_name="lp/b", solver_name="X", solve_time=0.2, status="optimal"),
+    ]
+    assert scaling_exponents(results) == {}
+    assert scaling_exponents([]) == {}
+    assert format_scaling({}).startswith("No scaling sweeps")
+
+
+def test_scale_rejects_options_it_would_ignore():
+    script = Path(__file__).parent.parent / "scripts" / "run_benchmarks.py"
+    run = subprocess.run(
+        [sys.executable, str(script), "--scale", "--jobs", "2", "--resume"],
+        capture_output=True,
+        text=True,
+    )
+    assert run.returncode == 2
+    assert "--scale does not support --jobs, --resume" in run.stderr
@@ -0,0 +1,75 @@
+"""Validate runtime estimates and longest-job-first scheduling."""
+
+from __future__ import annotations
+
+import pytest
+
+from solver_benchmarks.problems import ProblemSpec
+from solver_benchmarks.results import BenchmarkResult, ResultWriter
+from solver_benchmarks.runner import plan_benchmarks
+from solver_benchmarks.scheduler import TAG_ESTIMATES, CostModel, Job, lpt_schedule
+
+
+def _spec(name, tags=(), size=None, size_hints=None):
+    return ProblemSpec(
+        name=name, func=lambda seed: None, tags=list(tags), size=size, size_hints=size_hints
+    )
+
+
+def _record(problem, solver, time, host="here", mode="cold", **fields):
+    return BenchmarkResult(
+        problem, solver, 0, total_time=time, host_fingerprint=host, mode=mode, **fields
+    ).to_dict()
+
+
+def test_cost_model_falls_back_from_history_to_tags():
+    records = [
+        _record("p", "A", 1.0, phases={"construction": 0.5}),
+        _record("p", "A", 3.0, phases={"construction": 0.5}),
+        _record("p", "A", 50.0, host="there"),
+        _record("p", "A", 90.0, mode="latency"),  # other modes are ignored
+        _record("p", "B", 4.0, host="there"),
+        _record("q@n=100", "A", 2.0, size=100),
+        _record("s", "A", 1.0, num_scalar_variables=80, num_scalar_eq_constr=20),
+    ]
+    model = CostModel(records, host="here")
+    # Construction counts: the workers spend it too.
+    assert model.estimate(_spec("p"), "A") == (2.5, "history")
+    assert model.estimate(_spec("p"), "B") == (4.0, "history")
+    assert model.estimate(_spec("p"), "C") == (3.25, "other solvers")
+    assert model.estimate(_spec("q@n=400", size=400), "A") == (8.0, "other sizes")
+    hints = {"num_scalar_variables": 900, "num_scalar_eq_constr": 100}
+    assert model.estimate(_spec("r", ["large"], size_hints=hints), "A") == (10.0, "size hints")
+    assert model.estimate(_spec("r", ["lp", "large"]), "A") == (TAG_ESTIMATES["large"], "tag")
+
+
+def test_lpt_schedule():
+    jobs = [Job(_spec(f"p{i}"), "A", 0, t, "tag") for i, t in enumerate([1, 2, 3, 4, 5, 6, 7])]
+    schedule = lpt_schedule(jobs, workers=3)
+    assert [job.estimate for job in schedule.jobs] == [7, 6, 5, 4, 3, 2, 1]
+    assert sorted(schedule.loads) == [9, 9, 10]
+    assert schedule.makespan == 10 and schedule.total == 28
+    assert [(job.worker, job.start) for job in schedule.jobs[:4]] == [
+        (0, 0),
+        (1, 0),
+        (2, 0),
+        (2, 5),
+    ]
+
+
+def test_plan_estimates_from_results(tmp_path):
+    with ResultWriter(tmp_path / "old.jsonl") as writer:
+        writer.write(BenchmarkResult("qp/portfolio_small", "HIGHS", 0, total_time=1.0))
+    schedule = plan_benchmarks(
+        problems=["lp/diet_small", "qp/portfolio_small"],
+        solvers=["HIGHS"],
+        output_dir=tmp_path,
+        jobs=2,
+        repeats=3,
+        warmup=1,
+    )
+    assert [(job.spec.name, job.estimate, job.source) for job in schedule.jobs] == [
+        ("qp/portfolio_small", 4.0, "history"),
+        ("lp/diet_small", pytest.approx(4 * TAG_ESTIMATES["small"]), "tag"),
+    ]
+    assert schedule.makespan == 4.0 and [job.worker for job in schedule.jobs] == [0, 1]
@@ -0,0 +1,59 @@
+"""Validate multi-seed sweeps and their aggregation."""
+
+from __future__ import annotations
+
+import pytest
+
+from solver_benchmarks.analysis import (
+    fastest_solver_per_problem,
+    seed_summary,
+    shifted_geometric_mean,
+    solver_comparison_table,
+)
+from solver_benchmarks.results import BenchmarkResult
+from solver_benchmarks.runner import parse_seeds, run_benchmarks
+
+
+def test_parse_seeds():
+    assert parse_seeds(["0..3", "2", "7"]) == [0, 1, 2, 3, 7]
+    assert parse_seeds(["5"]) == [5]
+    with pytest.raises(ValueError, match="Invalid seed"):
+        parse_seeds(["a..3"])
+
+
+def test_sweep_runs_every_seed(tmp_path):
+    results = run_benchmarks(
+        problems=["lp/diet_small"], solvers=["HIGHS", "CLARABEL"], output_dir=tmp_path, seeds=[0, 1, 2]
+    )
+    assert [(r.seed, r.solver_name) for r in results] == [
+        (seed, solver) for seed in (0, 1, 2) for solver in ("HIGHS", "CLARABEL")
+    ]
+    assert all(r.status == "optimal" for r in results)
+    objectives = {r.seed: r.objective_value for r in results if r.solver_name == "HIGHS"}
+    assert len(set(objectives.values())) == 3  # each seed is a different instance
+
+    resumed = run_benchmarks(
+        problems=["lp/diet_small"], solvers=["HIGHS"], output_dir=tmp_path, seeds=[0, 1, 2, 3], resume=True
+    )
+    assert [r.seed for r in resumed] == [3]
+
+
+def test_seed_aggregation():
+    times = {"A": [1.0, 1.1, 0.9, 1.0, 9.0], "B": [2.0, 2.0, 2.0, 2.0, 2.0]}
+    results = [
+        BenchmarkResult("p", solver, seed, solve_time=t, status="optimal", problem_type="LP")
+        for solver, values in times.items()
+        for seed, t in enumerate(values)
+    ]
+    results.append(BenchmarkResult("p", "B", 5, status="solver_error", problem_type="LP"))
+
+    summary = seed_summary(results)["p"]
+    assert summary["A"]["median"] == 1.0 and summary["A"]["outliers"] == [4]
+    assert summary["B"]["solved"] == 5 and summary["B"]["failed"] == [5]
+    assert summary["B"]["iqr"] == 0.0 and summary["B"]["outliers"] == []
+
+    # The median over seeds ignores the slow seed of A.
+    assert solver_comparison_table(results)["p"]["A"] == 1.0
+    assert fastest_solver_per_problem(results)["p"] == ("A", 1.0)
+    # Each seed is an instance for the SGM.
+    assert shifted_geometric_mean(results)["B"]["solved"] == 5
@@ -0,0 +1,37 @@
+"""Validate solver version capture."""
+
+from __future__ import annotations
+
+from importlib import metadata
+
+import cvxpy as cp
+
+from solver_benchmarks.analysis import results_frame, split_solver_versions
+from solver_benchmarks.problems import get_problem
+from solver_benchmarks.results import BenchmarkResult
+from solver_benchmarks.runner import run_single
+from solver_benchmarks.solvers import SOLVER_DISTRIBUTIONS, native_version, solver_version
+
+
+def test_installed_solvers_have_versions():
+    for solver in cp.installed_solvers():
+        if solver in SOLVER_DISTRIBUTIONS:
+            assert solver_version(solver) == metadata.version(SOLVER_DISTRIBUTIONS[solver])
+    assert solver_version("NOT_A_SOLVER") == ""
+    assert native_version("CLARABEL") == ""  # the package is the solver
+
+
+def test_run_single_records_solver_version():
+    result = run_single(get_problem("lp/diet_small"), "HIGHS")
+    assert result.solver_version == metadata.version("highspy")
+    assert result.solver_native_version  # reported by the HiGHS library
+
+
+def test_split_solver_versions():
+    results = [
+        BenchmarkResult("p", "SCS", 0, solver_version="3.2.7"),
+        BenchmarkResult("p", "SCS", 0, solver_version="3.3.1"),
+        BenchmarkResult("p", "SCS", 0, solver_version="SCS"),  # older records
+    ]
+    frame = split_solver_versions(results_frame(results))
+    assert list(frame["solver_name"]) == ["SCS 3.2.7", "SCS 3.3.1", "SCS"]
@@ -0,0 +1,79 @@
+"""Validate the columnar results store."""
+
+from __future__ import annotations
+
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from solver_benchmarks.results import BenchmarkResult, load_all_results, save_results
+from solver_benchmarks.store import compact, load_store, scan_store, version_matches
+
+RESULTS_DIR = Path(__file__).parent.parent / "results"
+
+
+def test_version_matches():
+    assert version_matches("1.8.1", ">=1.8,<1.9")
+    assert not version_matches("1.10.0", "<1.9")
+    assert version_matches("1.10.0", ">1.9.5")
+    assert version_matches("0.11.1", "0.11.1")
+    assert not version_matches("", ">=1.0")
+
+
+@pytest.mark.parametrize("layout", ["parquet", "arrow"])
+def test_compact_round_trip(layout):
+    pytest.importorskip("pyarrow")
+    expected = load_all_results(RESULTS_DIR)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        n = compact(RESULTS_DIR, Path(tmpdir) / "store", layout=layout)
+        loaded = load_store(Path(tmpdir) / "store")
+    assert n == len(expected)
+    key = lambda r: (r.timestamp, r.problem_name, r.solver_name)  # noqa: E731
+    assert sorted(loaded, key=key) == sorted(expected, key=key)
+
+
+def test_filters_are_applied():
+    pytest.importorskip("pyarrow")
+    results = [
+        BenchmarkResult(
+            problem_name="p",
+            solver_name=solver,
+            problem_type=ptype,
+            cvxpy_version=version,
+            timing_stats={"solve_time": {"median": 1.0}},
+            timestamp="2026-01-02T00:00:00",
+        )
+        for solver, ptype, version in [
+            ("SCS", "LP", "1.8.1"),
+            ("SCS", "QP", "1.9.0"),
+            ("OSQP", "LP", "1.10.0"),
+        ]
+    ]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        save_results(results, Path(tmpdir) / "20260102_me_linux.jsonl")
+        compact(tmpdir, Path(tmpdir) / "store")
+        store = Path(tmpdir) / "store"
+        assert any(store.glob("date=20260102/*/solver_name=SCS"))
+        lp = load_store(store, problem_type="LP")
+        assert sorted(r.solver_name for r in lp) == ["OSQP", "SCS"]
+        new = load_store(store, cvxpy_version=">=1.9")
+        assert sorted(r.cvxpy_version for r in new) == ["1.10.0", "1.9.0"]
+        assert new[0].timing_stats == {"solve_time": {"median": 1.0}}
+        table = scan_store(store, solvers=["OSQP"], columns=["problem_type"])
+        assert table.column_names == ["problem_type"]
+        assert table.num_rows == 1
+
+
+def test_compact_keeps_the_results(tmp_path):
+    pytest.importorskip("pyarrow")
+    save_results([BenchmarkResult(problem_name="p", solver_name="SCS")], tmp_path / "a.jsonl")
+    for dest in (tmp_path, tmp_path.parent):
+        with pytest.raises(ValueError):
+            compact(tmp_path, dest)
+    with pytest.raises(ValueError):
+        compact(tmp_path, tmp_path / "store", layout="csv")
+    assert (tmp_path / "a.jsonl").exists() and not (tmp_path / "store").exists()
+    assert compact(tmp_path, tmp_path / "store") == 1
+    assert compact(tmp_path, tmp_path / "store", layout="arrow") == 1
+    assert [p.name for p in (tmp_path / "store").iterdir()] == ["results.arrow"]
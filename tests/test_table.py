@@ -0,0 +1,71 @@
+"""Validate the column-oriented result table."""
+
+from __future__ import annotations
+
+import json
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from solver_benchmarks.results import BenchmarkResult, load_all_results
+from solver_benchmarks.table import ResultTable
+from solver_benchmarks.timing import summarize_samples
+
+RESULTS_DIR = Path(__file__).parent.parent / "results"
+
+
+def test_benchmark_result_is_slotted():
+    r = BenchmarkResult(problem_name="p", solver_name="S")
+    assert not hasattr(r, "__dict__")
+    assert BenchmarkResult.from_dict({**r.to_dict(), "unknown": 1}) == r
+
+
+def test_load_matches_results():
+    expected = load_all_results(RESULTS_DIR)
+    table = ResultTable.load(RESULTS_DIR)
+    assert len(table) == len(expected)
+    assert table.to_results() == expected
+    assert ResultTable.from_results(expected).to_results() == expected
+
+
+def test_columns_are_typed():
+    results = [
+        BenchmarkResult(problem_name="b", solver_name="SCS", solve_time=1.0, num_iters=7),
+        BenchmarkResult(
+            problem_name="a",
+            solver_name="SCS",
+            repeats=3,
+            timing_stats={"solve_time": summarize_samples([1.0, 2.0, 3.0])},
+        ),
+    ]
+    table = ResultTable.from_results(results)
+    assert isinstance(table["solver_name"], pd.Categorical)
+    assert list(table["problem_name"].categories) == ["a", "b"]
+    assert table["repeats"].dtype == np.int64
+    assert table["solve_time"].dtype == np.float64 and np.isnan(table["solve_time"][1])
+    assert table.row(0).num_iters == 7 and isinstance(table.row(0).num_iters, int)
+    assert table.row(1).timing_stats == results[1].timing_stats
+    assert table.nbytes > 0
+
+
+def test_missing_keys_take_defaults():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "old.jsonl"
+        path.write_text(json.dumps({"problem_name": "p", "solver_name": "S", "extra": 1}) + "\n")
+        (row,) = ResultTable.load(path)
+    assert row == BenchmarkResult(problem_name="p", solver_name="S")
+
+
+def test_from_store():
+    pytest.importorskip("pyarrow")
+    from solver_benchmarks.store import compact
+
+    expected = [r for r in load_all_results(RESULTS_DIR) if r.solver_name == "SCS"]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        compact(RESULTS_DIR, Path(tmpdir) / "store")
+        table = ResultTable.from_store(Path(tmpdir) / "store", solvers=["SCS"])
+    key = lambda r: (r.timestamp, r.problem_name)  # noqa: E731
+    assert sorted(table, key=key) == sorted(expected, key=key)
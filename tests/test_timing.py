@@ -0,0 +1,55 @@
+"""Validate repeated-trial timing statistics."""
+
+from __future__ import annotations
+
+import pytest
+
+from solver_benchmarks.analysis import metric_value
+from solver_benchmarks.results import BenchmarkResult
+from solver_benchmarks.timing import split_metric, summarize_samples, summarize_trials
+
+
+def test_summarize_samples():
+    stats = summarize_samples([4.0, 1.0, 3.0, 2.0, 5.0])
+    assert stats["min"] == 1.0
+    assert stats["median"] == 3.0
+    assert stats["mean"] == 3.0
+    assert stats["std"] == pytest.approx(1.5811388)
+    assert stats["iqr"] == 2.0
+    assert stats["samples"] == [4.0, 1.0, 3.0, 2.0, 5.0]
+
+
+def test_single_sample_has_zero_spread():
+    stats = summarize_samples([0.5])
+    assert stats["median"] == 0.5
+    assert stats["std"] == 0.0
+    assert stats["iqr"] == 0.0
+
+
+def test_unreported_metrics_are_skipped():
+    summary = summarize_trials({"solve_time": [1.0, 2.0], "setup_time": [None, None]})
+    assert set(summary) == {"solve_time"}
+
+
+def test_split_metric():
+    assert split_metric("solve_time") == ("solve_time", None)
+    assert split_metric("total_time:iqr") == ("total_time", "iqr")
+    with pytest.raises(ValueError):
+        split_metric("solve_time:p99")
+
+
+def test_metric_value_selects_statistic():
+    r = BenchmarkResult(
+        problem_name="p",
+        solver_name="S",
+        solve_time=2.0,
+        repeats=3,
+        timing_stats={"solve_time": summarize_samples([1.0, 2.0, 6.0])},
+    )
+    assert metric_value(r, "solve_time") == 2.0
+    assert metric_value(r, "solve_time:min") == 1.0
+    assert metric_value(r, "solve_time:mean") == 3.0
+
+    single = BenchmarkResult(problem_name="p", solver_name="S", solve_time=2.0)
+    assert metric_value(single, "solve_time:min") == 2.0
+    assert metric_value(single, "solve_time:std") == 0.0